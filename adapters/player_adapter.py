@@ -36,15 +36,29 @@ NO_CONNECTION_LOG = ScrapperIsNotRespongingLogger()
 class PlayerAdapterBase(BaseAdapter):
     data: PlayerBaseSchema = None
 
-    def __init__(self, player, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        player,
+        *args,
+        season_range: typing.Optional[typing.Sequence] = None,
+        player_uuid: typing.Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """
+        `season_range` and `player_uuid` can be passed when already known
+        (e.g. resolved in bulk for many players), otherwise they are queried.
+        """
         super().__init__(*args, **kwargs)
         self.player = player
-        self.season_range = self.get_season_range()
+        self.season_range = (
+            season_range if season_range is not None else self.get_season_range()
+        )
+        self._player_uuid = player_uuid
 
     def get_season_range(self):
-        from clubs.models import Season
+        from utils.reference_data import reference_data
 
-        return Season.objects.all().order_by("-name")[:4]
+        return list(reference_data.get("seasons")[:4])
 
     @property
     def current_season(self) -> str:
@@ -82,8 +96,14 @@ class PlayerAdapterBase(BaseAdapter):
     @property
     def player_uuid(self) -> typing.Optional[str]:
         """
-        uuid straight from LNP
+        uuid straight from LNP, queried once per adapter
         """
+        if self._player_uuid is None:
+            self._player_uuid = self.get_player_uuid()
+        return self._player_uuid
+
+    def get_player_uuid(self) -> typing.Optional[str]:
+        """Query uuid of player from mapper"""
         mapper = self.get_player_mapper()
         params = {
             "database_source": "scrapper_mongodb",
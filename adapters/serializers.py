@@ -3,7 +3,6 @@ from abc import abstractmethod
 from datetime import datetime
 from itertools import groupby
 
-from django.core.exceptions import ObjectDoesNotExist
 from pm_core.services.models import (
     EventSchema,
     GameSchema,
@@ -17,7 +16,7 @@ from pm_core.services.models import (
 
 from adapters.exceptions import DataShortageLogger, WrongDataFormatException
 from adapters.utils import resolve_stats_list
-from mapper.models import MapperEntity
+from mapper.resolver import mapper_name_resolver
 
 
 class BasePlayerSerializer:
@@ -27,20 +26,17 @@ class BasePlayerSerializer:
         """data property abstract method"""
         ...
 
+    def prefetch_names(self, ids: typing.Iterable[str]) -> None:
+        """load names of all teams and leagues of the payload at once"""
+        mapper_name_resolver.resolve(ids)
+
     def resolve_team_name(self, team_id: str) -> typing.Union[str, None]:
         """get team name from s51"""
-        try:
-            team_entity = MapperEntity.objects.get(mapper_id=team_id)
-        except ObjectDoesNotExist:  # maybe display name from api in case?
-            return
-
-        return team_entity.target.teamhistory.team.name
+        return mapper_name_resolver.get(team_id).team_name
 
     def get_league_name(self, _id: str) -> str:
         """get league name from s51 (scrapper has different league names)"""
-        entity = MapperEntity.objects.filter(mapper_id=_id).first()
-        if entity:
-            return entity.target.leaguehistory.league.name
+        return mapper_name_resolver.get(_id).league_name
 
 
 class GameSerializer(BasePlayerSerializer):
@@ -80,6 +76,11 @@ class GameSerializer(BasePlayerSerializer):
     def parse_games(self) -> typing.List:
         """translate new games data like old serializer"""
         games = []
+        self.prefetch_names(
+            _id
+            for game in self.games.__root__
+            for _id in (game.host.id, game.guest.id, game.league.id)
+        )
 
         for game in self.games.__root__:
             final_result = game.scores.final
@@ -213,6 +214,9 @@ class StatsSerializer(BasePlayerSerializer):
                 obj=self, func_name="parse_season_stats()", stats=self.stats.__root__
             )
 
+        self.prefetch_names(
+            _id for seq in self.stats.__root__ for _id in (seq.league.id, seq.team.id)
+        )
         for season, stats in groupby(self.stats.__root__, lambda stat: stat.season):
             prepared_stats[season] = {}
             for seq in list(stats):
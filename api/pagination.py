@@ -14,6 +14,18 @@ class PagePagination(pagination.PageNumberPagination):
     max_page_size: int = 100
 
 
+class FollowCursorPagination(pagination.CursorPagination):
+    """
+    Cursor pagination of follows listings, newest first.
+    Pages are stable when follows are added or removed while paginating.
+    """
+
+    page_size: int = 20
+    page_size_query_param: str = "page_size"
+    max_page_size: int = 100
+    ordering = ("-created_at", "-id")
+
+
 class TransferRequestCataloguePagePagination(PagePagination):
     """
     Custom pagination class for transfer request catalogue page.
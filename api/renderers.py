@@ -0,0 +1,39 @@
+import typing
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+_encoder = JSONEncoder()
+
+
+def render_json(data: typing.Any) -> bytes:
+    """
+    Compact JSON of data, the same as rendered by stock JSONRenderer.
+    Values orjson doesn't serialize natively (Decimal, lazy translations,
+    querysets, timedelta) and datetimes are encoded by DRF JSONEncoder.
+    """
+    content = orjson.dumps(data, default=_encoder.default, option=ORJSON_OPTIONS)
+    # keep output a strict javascript subset, as stock renderer does
+    if b"\xe2\x80" in content:
+        content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+    return content
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson.
+    Indented JSON (browsable API, `; indent=4` media type) is rendered by
+    the stock renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return render_json(data)
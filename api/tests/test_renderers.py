@@ -0,0 +1,35 @@
+import datetime
+import decimal
+import uuid
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    data = {
+        "name": "Łukasz \u2028",
+        "score": decimal.Decimal("1.50"),
+        "created": timezone.now(),
+        "birth_date": datetime.date(2000, 1, 2),
+        "uuid": uuid.uuid4(),
+        "label": gettext_lazy("Player"),
+        "duration": datetime.timedelta(minutes=90),
+        "positions": {1: [1.5, None, True]},
+    }
+
+    def test_renders_the_same_json_as_stock_renderer(self):
+        assert ORJSONRenderer().render(self.data) == JSONRenderer().render(self.data)
+
+    def test_indented_json(self):
+        content = ORJSONRenderer().render(self.data, "application/json; indent=4")
+
+        assert content == JSONRenderer().render(self.data, "application/json; indent=4")
+        assert content.startswith(b'{\n    "name"')
+
+    def test_no_content(self):
+        assert ORJSONRenderer().render(None) == b""
@@ -1,8 +1,12 @@
+import typing
 from logging import getLogger
+from urllib.parse import urlsplit
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
 from django.core.management import call_command
+from django.test import RequestFactory
+from django.urls import resolve
 from django_celery_beat.models import CrontabSchedule, PeriodicTask
 
 from profiles.services import NotificationService
@@ -18,7 +22,7 @@ def notify_check_trial() -> None:
     """
     Send notifications to users about trial expiration.
     """
-    NotificationService.notify_check_trial()
+    NotificationService.bulk_notify_check_trial()
 
 
 @shared_task
@@ -26,7 +30,7 @@ def notify_verify_profile() -> None:
     """
     Send notifications to users to verify their profile every two days.
     """
-    NotificationService.notify_verify_profile()
+    NotificationService.bulk_notify_verify_profile()
 
 
 @shared_task
@@ -34,7 +38,7 @@ def notify_pm_rank() -> None:
     """
     Send weekly notifications to users about PM rank updates.
     """
-    NotificationService.notify_pm_rank()
+    NotificationService.bulk_notify_pm_rank()
 
 
 @shared_task
@@ -42,7 +46,7 @@ def notify_visits_summary() -> None:
     """
     Send notifications to users summarizing profile visits every month.
     """
-    NotificationService.notify_visits_summary()
+    NotificationService.bulk_notify_visits_summary()
 
 
 @shared_task
@@ -50,7 +54,7 @@ def notify_set_transfer_request() -> None:
     """
     Send notifications to users to set transfer requests every month
     """
-    NotificationService.notify_set_transfer_requests()
+    NotificationService.bulk_notify_set_transfer_requests()
 
 
 @shared_task
@@ -58,7 +62,7 @@ def notify_set_status() -> None:
     """
     Send notifications to users to set their transfer status every month.
     """
-    NotificationService.notify_set_status()
+    NotificationService.bulk_notify_set_status()
 
 
 @shared_task
@@ -66,7 +70,7 @@ def notify_add_links() -> None:
     """
     Send notifications to users to add links to their profile every month.
     """
-    NotificationService.notify_add_links()
+    NotificationService.bulk_notify_add_links()
 
 
 @shared_task
@@ -74,7 +78,7 @@ def notify_add_video() -> None:
     """
     Send notifications to users to add videos to their profile every month.
     """
-    NotificationService.notify_add_video()
+    NotificationService.bulk_notify_add_video()
 
 
 @shared_task
@@ -82,7 +86,7 @@ def notify_invite_friends() -> None:
     """
     Send weekly notifications to users to invite friends once a week.
     """
-    NotificationService.notify_invite_friends()
+    NotificationService.bulk_notify_invite_friends()
 
 
 @shared_task
@@ -90,7 +94,7 @@ def notify_profile_hidden() -> None:
     """
     Send notifications to users about their profile being hidden every two days.
     """
-    NotificationService.notify_profile_hidden()
+    NotificationService.bulk_notify_profile_hidden()
 
 
 @shared_task
@@ -98,7 +102,7 @@ def notify_assign_club() -> None:
     """
     Send notifications to users to assign their current club every month.
     """
-    NotificationService.notify_assign_club()
+    NotificationService.bulk_notify_assign_club()
 
 
 @shared_task  # TODO: remove this task
@@ -258,3 +262,34 @@ def run_daily_supervisor() -> None:
     """
 
     call_command("daily_supervisor")
+
+
+@shared_task
+def refresh_cached_response(
+    url: str,
+    language: str,
+    cache_key: typing.Optional[str] = None,
+    lock_key: typing.Optional[str] = None,
+) -> None:
+    """
+    Recompute cached API response (stale-while-revalidate).
+    Response is computed for an anonymous user, as cached responses are shared,
+    and stored under given cache key (releasing given lock) of the stale entry.
+    """
+    parsed_url = urlsplit(url)
+    request = RequestFactory().get(
+        parsed_url.path,
+        QUERY_STRING=parsed_url.query,
+        secure=parsed_url.scheme == "https",
+        HTTP_HOST=parsed_url.netloc,
+        HTTP_X_LANGUAGE=language,
+    )
+    request.cache_refresh = True
+    if cache_key is not None:
+        request.cache_refresh_keys = (cache_key, lock_key)
+    match = resolve(request.path_info)
+    response = match.func(request, *match.args, **match.kwargs)
+    if response.status_code != 200:
+        logger.warning(
+            f"Refreshing cached response of {url} failed: {response.status_code}"
+        )
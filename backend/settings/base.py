@@ -37,6 +37,17 @@ ADMINS = MANAGERS = [
 ]
 
 DEFAULT_CACHE_LIFESPAN = 60 * 15  # in seconds (60 * 5 = 5min)
+# tagged responses are invalidated on data change, TTL is just a safety net
+TAGGED_CACHE_LIFESPAN = 60 * 60 * 6  # in seconds (6h)
+# single-flight recomputation of cached responses
+CACHE_LOCK_TIMEOUT = 30  # in seconds, lock is released earlier by its holder
+CACHE_LOCK_WAIT = 3  # in seconds, how long other workers wait for fresh data
+# how long an expired response may be served while it's refreshed in background
+CACHE_STALE_WHILE_REVALIDATE = 60 * 5  # in seconds
+# cached responses larger than this are stored zlib-compressed
+CACHE_COMPRESS_MIN_SIZE = 1024  # in bytes
+# filtered profile count is estimated (query planner) above this number
+APPROXIMATE_PROFILE_COUNT_FROM = 10_000
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/3.1/howto/deployment/checklist/
@@ -128,6 +139,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "middleware.user_activity_middleware.UserActivityMiddleware",
+    "middleware.premium_snapshot_middleware.PremiumSnapshotMiddleware",
     # "middleware.redirect_middleware.RedirectMiddleware",
 ]
 
@@ -425,11 +437,32 @@ CELERY_BROKER_TRANSPORT_OPTIONS = {
 
 # Beat schedule max run frequency - zapobiega multiple runs
 CELERY_BEAT_MAX_LOOP_INTERVAL = 5  # Sprawdzaj schedule co 5 sekund (domyślnie)
+USER_ACTIVITY_FLUSH_INTERVAL = 60  # in seconds
 CELERY_BEAT_SCHEDULE = {
     "daily-supervisor": {
         "task": "app.celery.tasks.run_daily_supervisor",
         "schedule": crontab(hour=10, minute=0),  # Codziennie o 10:00
     },
+    "refresh-profile-visit-summaries": {
+        "task": "profiles.tasks.refresh_profile_visit_summaries",
+        "schedule": crontab(hour=0, minute=5),
+    },
+    "flush-user-activity": {
+        "task": "users.tasks.flush_user_activity",
+        "schedule": USER_ACTIVITY_FLUSH_INTERVAL,
+    },
+    "check-inquiry-responses": {
+        "task": "inquiries.tasks.check_inquiry_responses",
+        "schedule": crontab(minute="*/10"),
+    },
+    "rebuild-profile-search-documents": {
+        "task": "profiles.tasks.rebuild_profile_search_documents",
+        "schedule": crontab(hour=1, minute=30),
+    },
+    "build-missing-profile-search-documents": {
+        "task": "profiles.tasks.build_missing_profile_search_documents",
+        "schedule": crontab(minute="*/5"),
+    },
 }
 
 # Redis & stream activity
@@ -446,7 +479,7 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "api.renderers.ORJSONRenderer",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
@@ -566,6 +599,7 @@ else:
 
 DEFAULT_FROM_EMAIL = SERVER_EMAIL = cfg.smtp.outgoing_address
 EMAIL_TIMEOUT = 10  # seconds
+MAILING_BATCH_SIZE = 100  # emails sent over a single SMTP connection
 
 try:
     from backend.settings.local import *  # noqa
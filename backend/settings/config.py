@@ -72,6 +72,7 @@ class RedisConfig(BaseModel):
         list_profiles: str = "list_profiles"
         popular_profiles: str = "popular_profiles"
         profiles_nearby: str = "profiles_nearby"
+        profiles_count: str = "profiles_count"
 
     host: str
     port: int
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from clubs.models import League
+from utils.cache import invalidate_cache_tags, league_tag
+
+
+@receiver(post_save, sender=League)
+def post_save_league(sender, instance, **kwargs):
+    """
+    Invalidate cached listings filtered by the league.
+    """
+    invalidate_cache_tags(league_tag(instance.pk))
@@ -27,6 +27,7 @@ from rest_framework.test import APIClient
 from utils.factories import UserFactory
 from utils.factories.cities_factories import CityFactory
 from utils.fixtures import *
+from utils.reference_data import reference_data
 
 pytestmark = pytest.mark.django_db
 
@@ -63,6 +64,14 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_slow)
 
 
+@pytest.fixture(autouse=True)
+def clear_reference_data():
+    """Don't let reference data loaded by one test leak into another."""
+    reference_data.clear()
+    yield
+    reference_data.clear()
+
+
 @pytest.fixture
 def system_user(setup_system_user):
     """Get the system user that was created during setup."""
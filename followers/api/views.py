@@ -6,6 +6,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from api.base_view import EndpointView
+from api.pagination import FollowCursorPagination
 from clubs.errors import (
     ClubDoesNotExist,
     ClubNotFoundServiceException,
@@ -23,7 +24,9 @@ from followers.errors import (
     SelfFollowException,
     SelfFollowServiceException,
 )
+from followers.models import GenericFollow
 from followers.services import FollowService
+from followers.utils import prefetch_followed_objects, prefetch_followers_profiles
 from profiles.api.errors import PermissionDeniedHTTPException
 from profiles.api.mixins import ProfileRetrieveMixin
 from profiles.errors import CatalogDoesNotExist, CatalogNotFoundServiceException
@@ -39,42 +42,47 @@ team_service = TeamHistoryCreationService()
 class FollowAPIView(EndpointView, ProfileRetrieveMixin):
     permission_classes = [IsAuthenticated]
 
+    pagination_class = FollowCursorPagination
+
     def list_followed_objects(self, request: Request) -> Response:
         """
-        List all objects followed by the current user.
-        """
-        if profile := request.user.profile:
-            context = self.get_serializer_context()
-            context.update({
-                "premium_viewer": request.user.profile.is_premium,
-            })
-            data = FollowedListSerializer(
-                profile.who_i_follow.order_by("-created_at"),
-                many=True,
-                context=context,
-            ).data
-        else:
-            data = []
-        return Response(data, status=status.HTTP_200_OK)
+        List objects followed by the current user (cursor paginated).
+        """
+        profile = request.user.profile
+        page = self.paginate_queryset(
+            profile.who_i_follow if profile else GenericFollow.objects.none()
+        )
+        context = self.get_serializer_context()
+        context.update({
+            "premium_viewer": bool(profile and profile.is_premium),
+        })
+        data = FollowedListSerializer(
+            prefetch_followed_objects(page),
+            many=True,
+            context=context,
+        ).data
+        return self.get_paginated_response(data)
 
     def list_my_followers(self, request: Request) -> Response:
         """
-        List all followers of the current user.
-        """
-        if profile := request.user.profile:
-            context = self.get_serializer_context()
-            context.update({
-                "premium_viewer": request.user.profile.is_premium,
-            })
-            data = FollowingListSerializer(
-                profile.who_follows_me.order_by("-created_at"),
-                many=True,
-                context=context,
-            ).data
-        else:
-            data = []
-
-        return Response(data, status=status.HTTP_200_OK)
+        List followers of the current user (cursor paginated).
+        """
+        profile = request.user.profile
+        page = self.paginate_queryset(
+            profile.who_follows_me.select_related("user")
+            if profile
+            else GenericFollow.objects.none()
+        )
+        context = self.get_serializer_context()
+        context.update({
+            "premium_viewer": bool(profile and profile.is_premium),
+        })
+        data = FollowingListSerializer(
+            prefetch_followers_profiles(page),
+            many=True,
+            context=context,
+        ).data
+        return self.get_paginated_response(data)
 
     def follow_profile(self, request: Request, profile_uuid: uuid.UUID) -> Response:
         """
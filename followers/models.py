@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
@@ -8,11 +10,30 @@ class GenericFollowManager(models.Manager):
     def with_existing_objects(self, user):
         """
         Return GenericFollow instances where the followed object exists.
+        Existing objects are checked with a single query per content type.
         """
+        follows = list(
+            self.get_queryset().filter(user=user).select_related("content_type")
+        )
+        object_ids = defaultdict(set)
+        for follow in follows:
+            object_ids[follow.content_type].add(follow.object_id)
+
+        missing = set()
+        for content_type, ids in object_ids.items():
+            model = content_type.model_class()
+            existing = set()
+            if model:
+                existing = set(
+                    model._default_manager.filter(pk__in=ids).values_list(
+                        "pk", flat=True
+                    )
+                )
+            missing |= {(content_type.pk, pk) for pk in ids - existing}
         return [
             follow
-            for follow in self.get_queryset().filter(user=user)
-            if follow.followed_object_exists()
+            for follow in follows
+            if (follow.content_type_id, follow.object_id) not in missing
         ]
 
 
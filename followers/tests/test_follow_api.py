@@ -41,9 +41,24 @@ class TestFollowAPI(APITestCase):
 
         response = self.client.get(reverse("api:followers:get_followers"))
         data = response.json()
-        self.assertEqual(len(data), 5)
+        self.assertEqual(len(data["results"]), 5)
         self.assertEqual(response.status_code, 200)
 
+    def test_list_my_followers_paginated(self) -> None:
+        """Test that followers are listed page by page with a cursor."""
+        for _ in range(5):
+            follow_service.follow_profile(
+                self.superuser.profile.uuid, PlayerProfileFactory().user
+            )
+
+        url = f"{reverse('api:followers:get_followers')}?page_size=2"
+        pages = []
+        while url:
+            data = self.client.get(url).json()
+            pages.append(len(data["results"]))
+            url = data["next"]
+        self.assertEqual(pages, [2, 2, 1])
+
     @parameterized.expand([
         ("profile", "profile_uuid", lambda self: self.profile.uuid),
         ("team", "team_id", lambda self: self.team.id),
@@ -105,6 +120,19 @@ class TestFollowAPI(APITestCase):
         response = self.client.get(reverse("api:followers:get_user_follows"))
         self.assertEqual(response.status_code, 200)
 
+    def test_list_followed_objects_skips_deleted(self) -> None:
+        """Test that follows of deleted profiles are not listed."""
+        content_type = ContentType.objects.get_for_model(self.profile)
+        for object_id in (self.profile.user.id, self.profile.user.id + 1000):
+            GenericFollowFactory.create(
+                user=self.superuser, object_id=object_id, content_type=content_type
+            )
+
+        response = self.client.get(reverse("api:followers:get_user_follows"))
+        results = response.json()["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["uuid"], str(self.profile.uuid))
+
     @parameterized.expand([
         ("profile", "profile_uuid", lambda self: self.profile.uuid),
         ("team", "team_id", lambda self: self.team.id),
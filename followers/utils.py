@@ -1,9 +1,16 @@
-from typing import Optional
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
 
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Model, QuerySet
 from django.http import HttpRequest
 
 from followers.models import GenericFollow
-from profiles.models import PROFILE_MODELS, Catalog
+from labels.utils import prefetch_labels
+from premium.snapshot import prefetch_premium_products
+from profiles.models import PROFILE_MODELS, BaseProfile, Catalog
+from profiles.services import ProfileVisitHistoryService
+from roles.definitions import PROFILE_TYPE_MAP
 
 
 def get_followed_object_url(
@@ -34,3 +41,79 @@ def get_followed_object_url(
         return request.build_absolute_uri(
             f"/api/v3/{model._meta.app_label}/{plural_model_name}/{generic_follow.object_id}"
         )
+
+
+def get_followed_queryset(model: Model) -> QuerySet:
+    """Queryset loading followed objects with related data their serializers need"""
+    if model in PROFILE_MODELS:
+        return model.objects.select_related(
+            "user", "meta", "visitation", "premium_products", "verification_stage"
+        )
+    return model._default_manager.all()
+
+
+def prefetch_profiles_data(profiles: Iterable[BaseProfile]) -> None:
+    """Load data used by profile serializers of a page of profiles in bulk."""
+    profiles = list(profiles)
+    prefetch_premium_products(profiles)
+    prefetch_labels(profiles, label_context="profile")
+    ProfileVisitHistoryService.prefetch_visit_summaries(profiles)
+
+
+def prefetch_followed_objects(follows: Iterable[GenericFollow]) -> List[GenericFollow]:
+    """
+    Load followed objects of given follows (e.g. page of a list) with a single
+    query per content type. Returns follows whose objects exist, with
+    `content_object` already set.
+    """
+    follows = list(follows)
+    object_ids: Dict[int, Set[int]] = defaultdict(set)
+    for follow in follows:
+        object_ids[follow.content_type_id].add(follow.object_id)
+
+    objects: Dict[int, Dict[int, Model]] = {}
+    for content_type_id, ids in object_ids.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        objects[content_type_id] = (
+            get_followed_queryset(model).in_bulk(ids) if model else {}
+        )
+        if model in PROFILE_MODELS:
+            prefetch_profiles_data(objects[content_type_id].values())
+
+    existing = []
+    for follow in follows:
+        if obj := objects[follow.content_type_id].get(follow.object_id):
+            follow.content_object = obj
+            existing.append(follow)
+    return existing
+
+
+def prefetch_followers_profiles(
+    follows: Iterable[GenericFollow],
+) -> List[GenericFollow]:
+    """
+    Load profiles of users who follow (e.g. page of followers) with a single
+    query per profile type. Returns follows of users having a profile,
+    with `follow.user.profile` already loaded.
+    """
+    follows = list(follows)
+    models_by_name = {model.__name__.lower(): model for model in PROFILE_MODELS}
+    user_ids: Dict[Model, Set[int]] = defaultdict(set)
+    for follow in follows:
+        role_name = PROFILE_TYPE_MAP.get(follow.user.declared_role)
+        if model := models_by_name.get(f"{role_name}profile"):
+            user_ids[model].add(follow.user_id)
+
+    profiles: Dict[int, BaseProfile] = {}
+    for model, ids in user_ids.items():
+        loaded = get_followed_queryset(model).in_bulk(ids)
+        prefetch_profiles_data(loaded.values())
+        profiles.update(loaded)
+
+    existing = []
+    for follow in follows:
+        if profile := profiles.get(follow.user_id):
+            # profile's user has reverse (user.<role>profile) relation cached
+            follow.user = profile.user
+            existing.append(follow)
+    return existing
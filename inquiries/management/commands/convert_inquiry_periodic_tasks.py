@@ -0,0 +1,74 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django_celery_beat.models import ClockedSchedule, PeriodicTask, PeriodicTasks
+
+from inquiries.models import InquiryRequest
+
+CHECK_RESPONSE_TASK = "inquiries.tasks.check_inquiry_response"
+
+
+class Command(BaseCommand):
+    help = (
+        "Move pending response checks of inquiry requests from one-off periodic "
+        "tasks to `response_due_at` of the requests (checked by periodic sweep), "
+        "then delete all these tasks with their clocked schedules."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options) -> None:
+        tasks = PeriodicTask.objects.filter(task=CHECK_RESPONSE_TASK, one_off=True)
+        converted = deleted = last_pk = 0
+
+        while batch := list(
+            tasks.filter(pk__gt=last_pk)
+            .select_related("clocked")
+            .order_by("pk")[: options["batch_size"]]
+        ):
+            last_pk = batch[-1].pk
+            due = self.get_pending_checks(batch)
+            requests = list(
+                InquiryRequest.objects.filter(
+                    pk__in=due, response_due_at__isnull=True
+                ).only("pk")
+            )
+            for inquiry_request in requests:
+                inquiry_request.response_due_at = due[inquiry_request.pk]
+            converted += len(requests)
+            deleted += len(batch)
+            if options["dry_run"]:
+                continue
+
+            with transaction.atomic():
+                InquiryRequest.objects.bulk_update(requests, ["response_due_at"])
+                PeriodicTask.objects.filter(pk__in=[task.pk for task in batch]).delete()
+                ClockedSchedule.objects.filter(
+                    pk__in=[task.clocked_id for task in batch if task.clocked_id],
+                    periodictask__isnull=True,
+                ).delete()
+
+        if deleted and not options["dry_run"]:
+            PeriodicTasks.update_changed()
+        self.stdout.write(
+            f"{'Would convert' if options['dry_run'] else 'Converted'} "
+            f"{converted} pending checks, "
+            f"{'would delete' if options['dry_run'] else 'deleted'} "
+            f"{deleted} periodic tasks."
+        )
+
+    @staticmethod
+    def get_pending_checks(tasks: list) -> dict:
+        """{inquiry request id: time of check} of tasks which did not run yet"""
+        due = {}
+        for task in tasks:
+            if not task.enabled or task.clocked is None:
+                continue
+            try:
+                due[int(json.loads(task.args)[0])] = task.clocked.clocked_time
+            except (ValueError, TypeError, IndexError):
+                continue
+        return due
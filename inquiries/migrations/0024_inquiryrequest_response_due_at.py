@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inquiries", "0023_inquiryrequest_recipient_anonymous_uuid"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inquiryrequest",
+            name="response_due_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When to check if recipient responded, cleared once checked.",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inquiryrequest",
+            index=models.Index(
+                condition=models.Q(response_due_at__isnull=False),
+                fields=["response_due_at"],
+                name="inquiry_response_due_idx",
+            ),
+        ),
+    ]
@@ -408,6 +408,7 @@ class InquiryRequest(models.Model):
     UNSEEN_STATES = [STATUS_SENT]
     ACTIVE_STATES = [STATUS_NEW, STATUS_SENT, STATUS_RECEIVED]
     RESOLVED_STATES = [STATUS_ACCEPTED, STATUS_REJECTED]
+    RESPONSE_TIME = timedelta(days=7)
 
     STATUS_CHOICES = (
         (STATUS_NEW, STATUS_NEW),
@@ -444,6 +445,20 @@ class InquiryRequest(models.Model):
         help_text="Stores the anonymous UUID for recipient when anonymous_recipient=True. "
                   "Preserves historical anonymity even if transfer objects are deleted."
     )
+    response_due_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When to check if recipient responded, cleared once checked.",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["response_due_at"],
+                name="inquiry_response_due_idx",
+                condition=models.Q(response_due_at__isnull=False),
+            )
+        ]
 
     def create_log_for_sender(self, log_type: InquiryLogType) -> None:
         """Create log for sender"""
@@ -540,6 +555,9 @@ class InquiryRequest(models.Model):
         if self.status == self.STATUS_NEW:
             self.send()
 
+        if self._state.adding and self.response_due_at is None:
+            self.response_due_at = timezone.now() + self.RESPONSE_TIME
+
         super().save(*args, **kwargs)
 
     def reward_sender(self) -> None:
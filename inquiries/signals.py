@@ -1,7 +1,5 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from django.utils import timezone
-from django_celery_beat.models import ClockedSchedule, PeriodicTask
 
 from inquiries.constants import InquiryLogType
 from inquiries.models import InquiryRequest, UserInquiry, UserInquiryLog
@@ -32,16 +30,9 @@ def post_save_inquiry_request(sender, instance, created, **kwargs):
     """
     Signal handler to perform actions after an inquiry request is saved.
     This can include notifying the recipient or logging the action.
+    Response is checked by `check_inquiry_responses` sweep, after
+    `response_due_at` of the request.
     """
     if created:
         instance.sender.userinquiry.increment()
         instance.create_log_for_recipient(InquiryLogType.NEW)
-        PeriodicTask.objects.create(
-            name=f"Check if recipient responded for inquiry request [ inquiry_request_id={instance.pk} ]",
-            task="inquiries.tasks.check_inquiry_response",
-            args=[instance.pk],
-            one_off=True,
-            clocked=ClockedSchedule.objects.create(
-                clocked_time=timezone.now() + timezone.timedelta(days=7)
-            ),
-        )
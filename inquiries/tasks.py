@@ -1,5 +1,7 @@
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.db import transaction
+from django.utils import timezone
 
 from inquiries.constants import INQUIRY_EMAIL_TEMPLATE, InquiryLogType
 from inquiries.models import InquiryRequest, UserInquiry, UserInquiryLog
@@ -10,6 +12,8 @@ from utils.constants import INQUIRY_LIMIT_INCREASE_URL
 
 logger = get_task_logger(__name__)
 
+RESPONSE_SWEEP_BATCH_SIZE = 500
+
 
 @shared_task
 def notify_limit_reached(user_inquiry_id: int):
@@ -63,19 +67,59 @@ def send_inquiry_update_email(user_inquiry_log_id: int):
     MailingService(template(context)).send_mail(user)
 
 
+def notify_unanswered_inquiry(inquiry_request: InquiryRequest) -> None:
+    """Remind sender about inquiry request not responded to in time."""
+    if inquiry_request.status in InquiryRequest.RESOLVED_STATES:
+        return
+
+    mail_schema = EmailTemplateRegistry.OUTDATED_REMINDER
+    context = build_email_context(
+        user=inquiry_request.sender.user,
+        user2=inquiry_request.recipient.user,
+        mailing_type=mail_schema.mailing_type,
+    )
+    MailingService(mail_schema(context)).send_mail(inquiry_request.sender)
+
+
 @shared_task
 def check_inquiry_response(inquiry_request_id: int):
     """
     Check if an inquiry request has been responded to within 7 days.
-    This task can be scheduled to run periodically to check for responses.
+    Kept for one-off tasks scheduled before `check_inquiry_responses` sweep.
     """
-    inquiry_request = InquiryRequest.objects.get(pk=inquiry_request_id)
-
-    if inquiry_request.status not in InquiryRequest.RESOLVED_STATES:
-        mail_schema = EmailTemplateRegistry.OUTDATED_REMINDER
-        context = build_email_context(
-            user=inquiry_request.sender.user,
-            user2=inquiry_request.recipient.user,
-            mailing_type=mail_schema.mailing_type,
-        )
-        MailingService(mail_schema(context)).send_mail(inquiry_request.sender)
+    notify_unanswered_inquiry(InquiryRequest.objects.get(pk=inquiry_request_id))
+
+
+@shared_task
+def check_inquiry_responses() -> int:
+    """
+    Periodic sweep over inquiry requests past their response deadline.
+    Due requests are claimed in batches by clearing their deadline (so each
+    one is checked once, also by concurrent sweeps), then senders of those
+    not responded to are reminded. Returns number of checked requests.
+    """
+    now = timezone.now()
+    checked = 0
+    while True:
+        with transaction.atomic():
+            batch = list(
+                InquiryRequest.objects.filter(response_due_at__lte=now)
+                .select_for_update(skip_locked=True, of=("self",))
+                .select_related("sender", "recipient")
+                .order_by("response_due_at")[:RESPONSE_SWEEP_BATCH_SIZE]
+            )
+            if not batch:
+                return checked
+            InquiryRequest.objects.filter(
+                pk__in=[inquiry_request.pk for inquiry_request in batch]
+            ).update(response_due_at=None)
+
+        for inquiry_request in batch:
+            try:
+                notify_unanswered_inquiry(inquiry_request)
+            except Exception as e:
+                logger.exception(
+                    f"Unable to check response of inquiry request "
+                    f"{inquiry_request.pk}: {e}"
+                )
+        checked += len(batch)
@@ -0,0 +1,79 @@
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from django_celery_beat.models import ClockedSchedule, PeriodicTask
+
+from inquiries.models import InquiryRequest
+from inquiries.tasks import check_inquiry_responses
+from utils.factories.inquiry_factories import InquiryRequestFactory
+from utils.factories.profiles_factories import GuestProfileFactory
+
+pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("silence_mails")]
+
+
+def create_inquiry_request() -> InquiryRequest:
+    return InquiryRequestFactory(
+        sender=GuestProfileFactory().user, recipient=GuestProfileFactory().user
+    )
+
+
+def test_new_request_is_due_in_a_week():
+    inquiry_request = create_inquiry_request()
+
+    due_in = inquiry_request.response_due_at - inquiry_request.created_at
+    assert abs(due_in - InquiryRequest.RESPONSE_TIME) < timedelta(minutes=1)
+    assert not PeriodicTask.objects.filter(
+        task="inquiries.tasks.check_inquiry_response"
+    ).exists()
+
+
+def test_sweep_checks_due_requests_once(silence_mails):
+    due, resolved, pending = [create_inquiry_request() for _ in range(3)]
+    past = timezone.now() - timedelta(minutes=1)
+    InquiryRequest.objects.filter(pk__in=[due.pk, resolved.pk]).update(
+        response_due_at=past
+    )
+    InquiryRequest.objects.filter(pk=resolved.pk).update(
+        status=InquiryRequest.STATUS_ACCEPTED
+    )
+    silence_mails.reset_mock()
+
+    assert check_inquiry_responses() == 2
+    assert silence_mails.call_count == 1
+    assert not InquiryRequest.objects.filter(
+        pk__in=[due.pk, resolved.pk], response_due_at__isnull=False
+    ).exists()
+    pending.refresh_from_db()
+    assert pending.response_due_at > timezone.now()
+
+    assert check_inquiry_responses() == 0
+    assert silence_mails.call_count == 1
+
+
+def test_convert_inquiry_periodic_tasks():
+    pending, checked = create_inquiry_request(), create_inquiry_request()
+    InquiryRequest.objects.update(response_due_at=None)
+    check_time = timezone.now() + timedelta(days=2)
+    for inquiry_request, enabled in ((pending, True), (checked, False)):
+        PeriodicTask.objects.create(
+            name=f"Check inquiry request {inquiry_request.pk}",
+            task="inquiries.tasks.check_inquiry_response",
+            args=json.dumps([inquiry_request.pk]),
+            one_off=True,
+            enabled=enabled,
+            clocked=ClockedSchedule.objects.create(clocked_time=check_time),
+        )
+
+    call_command("convert_inquiry_periodic_tasks", batch_size=1)
+
+    pending.refresh_from_db()
+    checked.refresh_from_db()
+    assert pending.response_due_at == check_time
+    assert checked.response_due_at is None
+    assert not PeriodicTask.objects.filter(
+        task="inquiries.tasks.check_inquiry_response"
+    ).exists()
+    assert not ClockedSchedule.objects.filter(clocked_time=check_time).exists()
@@ -29,7 +29,9 @@ class LabelDefinition(models.Model):
         """
         Retrieves a list of all label names defined in the LabelDefinition model.
         """
-        return LabelDefinition.objects.all().values_list("label_name", flat=True)
+        from utils.reference_data import reference_data
+
+        return list(reference_data.get("label_names"))
 
 
 class Label(models.Model):
@@ -1,5 +1,6 @@
 import datetime
 import typing
+from collections import defaultdict
 from datetime import date
 
 from django.contrib.auth import get_user_model
@@ -10,6 +11,7 @@ from django.utils import timezone
 from clubs.models import Season
 from labels.models import Label, LabelDefinition
 from profiles.models import PROFILE_TYPE, PlayerProfile
+from utils.reference_data import reference_data
 
 User = get_user_model()
 
@@ -82,13 +84,17 @@ def get_licence_expiry_date(user: User, licence_label: str) -> typing.Optional[d
     return licence.expiry_date if licence else None
 
 
-def fetch_all_labels(
-    profile_object: PROFILE_TYPE, label_context: str
-) -> typing.List[Label]:
+# attribute of profile instance with labels loaded by `prefetch_labels`
+PREFETCHED_LABELS_ATTR = "_prefetched_labels"
+
+
+def get_labels_filter(
+    label_context: str, current_season: typing.Optional[Season] = None
+) -> Q:
     """
-    Fetches all labels associated with a profile and its user, based on the specified context.
+    Filter of labels valid today (and in the current season),
+    visible in the specified context.
     """
-    current_season = Season.objects.filter(is_current=True).first()
     today = timezone.now().date()
 
     # Common date filter
@@ -113,17 +119,77 @@ def fetch_all_labels(
     elif label_context == "base":
         visibility_filter &= Q(visible_on_base=True)
 
+    return date_filter & visibility_filter
+
+
+def fetch_all_labels(
+    profile_object: PROFILE_TYPE, label_context: str
+) -> typing.List[Label]:
+    """
+    Fetches all labels associated with a profile and its user, based on the specified context.
+    Labels loaded by `prefetch_labels` are returned without querying.
+    """
+    prefetched = getattr(profile_object, PREFETCHED_LABELS_ATTR, {})
+    if label_context in prefetched:
+        return prefetched[label_context]
+
+    current_season = Season.objects.filter(is_current=True).first()
+    labels_filter = get_labels_filter(label_context, current_season)
+
     # Apply the filters
-    profile_labels = profile_object.labels.filter(date_filter & visibility_filter)
+    profile_labels = profile_object.labels.filter(labels_filter).select_related(
+        "label_definition"
+    )
     user_labels = Label.objects.filter(
-        date_filter & visibility_filter,
+        labels_filter,
         content_type=ContentType.objects.get_for_model(User),
         object_id=profile_object.user_id,
-    )
+    ).select_related("label_definition")
 
     return list(profile_labels) + list(user_labels)
 
 
+def prefetch_labels(profiles: typing.Iterable, label_context: str) -> None:
+    """
+    Load labels of given profiles (e.g. page of profiles list) in bulk
+    and attach them to the instances, to be returned by `fetch_all_labels`.
+    Profile and user labels are loaded with one query each.
+    """
+    profiles = [profile for profile in profiles if profile is not None]
+    if not profiles:
+        return
+
+    current_season = Season.objects.filter(is_current=True).first()
+    labels_filter = get_labels_filter(label_context, current_season)
+
+    profiles_by_model = defaultdict(list)
+    for profile in profiles:
+        profiles_by_model[type(profile)].append(profile.pk)
+    content_types = ContentType.objects.get_for_models(*profiles_by_model)
+    profiles_condition = Q()
+    for model, pks in profiles_by_model.items():
+        profiles_condition |= Q(content_type=content_types[model], object_id__in=pks)
+
+    profile_labels = defaultdict(list)
+    for label in Label.objects.filter(labels_filter, profiles_condition).select_related(
+        "label_definition"
+    ):
+        profile_labels[(label.content_type_id, label.object_id)].append(label)
+
+    user_labels = defaultdict(list)
+    for label in Label.objects.filter(
+        labels_filter,
+        content_type=ContentType.objects.get_for_model(User),
+        object_id__in={profile.user_id for profile in profiles},
+    ).select_related("label_definition"):
+        user_labels[label.object_id].append(label)
+
+    for profile in profiles:
+        key = (content_types[type(profile)].pk, profile.pk)
+        prefetched = profile.__dict__.setdefault(PREFETCHED_LABELS_ATTR, {})
+        prefetched[label_context] = profile_labels[key] + user_labels[profile.user_id]
+
+
 def validate_labels(label_names: typing.List[str]) -> typing.List[str]:
     """
     Validates a list of label names against available label definitions.
@@ -132,7 +198,7 @@ def validate_labels(label_names: typing.List[str]) -> typing.List[str]:
     valid label names obtained from LabelDefinition. It returns a list containing
     only the label names that are valid.
     """
-    valid_choices: typing.Set[str] = set(LabelDefinition.get_label_choices())
+    valid_choices: typing.FrozenSet[str] = reference_data.get("label_names")
     return [label for label in label_names if label in valid_choices]
 
 
@@ -1,4 +1,6 @@
 import enum
+import functools
+import re
 import uuid
 from enum import Enum
 from typing import List, Optional
@@ -43,6 +45,29 @@ class EmailTemplateFileNames(Enum):
     CONFIRM_EMAIL = "confirm_email.html"
 
 
+# end of a line closing an HTML element, safe place to split rendered email
+HTML_FRAGMENT_END = re.compile(r"</\w+>[ \t]*\n")
+
+
+@functools.lru_cache(maxsize=4096)
+def _strip_fragment(fragment: str) -> str:
+    return strip_tags(fragment)
+
+
+def html_to_text(html: str) -> str:
+    """
+    Plain text version of rendered email, `strip_tags` of the whole html.
+    Html is stripped in fragments, so static fragments of templates (the same
+    for all recipients of a campaign) are stripped only once.
+    """
+    fragments, start = [], 0
+    for match in HTML_FRAGMENT_END.finditer(html):
+        fragments.append(_strip_fragment(html[start : match.end()]))
+        start = match.end()
+    fragments.append(_strip_fragment(html[start:]))
+    return "".join(fragments)
+
+
 class MailingPreferenceType(str, enum.Enum):
     SYSTEM = "system"
     MARKETING = "marketing"
@@ -62,8 +87,7 @@ class MailContent(BaseModel):
         use_enum_values = True
 
     def __call__(self, context: dict = dict()) -> "MailContent":
-        self.render_content(context)
-        return self
+        return self.render(context)
 
     @validator("template_file")
     def validate_template_file(cls, v):
@@ -78,6 +102,15 @@ class MailContent(BaseModel):
                 f"Template file {v} does not exist in any Django template directory."
             )
 
+    def render(self, context: dict) -> "MailContent":
+        """
+        Returns copy of the template rendered with the given context.
+        Templates of the registry are shared, so they are never rendered in place.
+        """
+        content = self.copy()
+        content.render_content(context)
+        return content
+
     def render_content(self, context: dict) -> None:
         """
         Renders the HTML body using the given context.
@@ -88,7 +121,7 @@ class MailContent(BaseModel):
             raise ValueError(f"Some context keys are missing: {e}")
 
         self.html_content = render_to_string(self.template_file, context)
-        self.text_content = strip_tags(self.html_content)
+        self.text_content = html_to_text(self.html_content)
 
     @property
     def ready(self) -> bool:
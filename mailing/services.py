@@ -5,12 +5,13 @@ from dataclasses import dataclass
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
-from django.db.models import Count, F, Q
+from django.db.models import Count, F, Q, QuerySet
 from django.utils import timezone
-from typing import List
+from typing import Dict, List, Optional
 from email.mime.image import MIMEImage
 
 from mailing.schemas import EmailTemplateRegistry, Envelope, MailContent
+from mailing.tasks import send_batch
 from mailing.utils import build_email_context
 from premium.models import PremiumProduct
 from profiles.models import ClubProfile, CoachProfile, PlayerProfile, ProfileMeta
@@ -68,9 +69,86 @@ class MailingService:
         envelope.send_to_admins()
 
 
+class MailBatch:
+    """
+    Collects rendered emails of a campaign and sends them in batches
+    (`send_batch` task, single SMTP connection per batch).
+    """
+
+    def __init__(
+        self,
+        operation_id: Optional[uuid.UUID] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        self._operation_id = operation_id or uuid.uuid4()
+        self._batch_size = batch_size or settings.MAILING_BATCH_SIZE
+        self._messages: List[dict] = []
+
+    def add(self, schema: MailContent, recipient: User) -> None:
+        """
+        Add rendered email for the recipient, respecting their preferences.
+        Content is copied, as schemas from registry are re-rendered for each user.
+        """
+        if schema.mailing_type and not recipient.can_send_email(schema.mailing_type):
+            logger.info(
+                f"Skipping sending {schema.mailing_type} email of subject '{schema.subject}' to {recipient.email} due to user preferences",
+            )
+            return
+
+        self._messages.append({**schema.data, "recipient": recipient.email})
+        if len(self._messages) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send collected emails."""
+        if self._messages:
+            send_batch.delay(operation_id=self._operation_id, messages=self._messages)
+            self._messages = []
+
+
 class PostmanService:
-    def __init__(self, logger: logging.Logger = logging.getLogger(__name__)) -> None:
+    # recipients fetched from server-side cursor at once
+    CHUNK_SIZE = 2000
+
+    def __init__(
+        self,
+        logger: logging.Logger = logging.getLogger(__name__),
+        batch_size: Optional[int] = None,
+    ) -> None:
         self.logger = logger
+        self.batch_size = batch_size
+
+    def get_batch(self) -> MailBatch:
+        """Batch collecting emails of a single campaign."""
+        return MailBatch(batch_size=self.batch_size)
+
+    def send_campaign(
+        self, mail_schema: MailContent, queryset: QuerySet, name: str, **context
+    ) -> int:
+        """
+        Send campaign email to users of the queryset (users or objects with `user`).
+        Recipients are streamed in chunks, each of them gets own rendered copy
+        of the template and emails are sent in batches.
+        Returns number of recipients.
+        """
+        batch = self.get_batch()
+        counter = 0
+        for obj in queryset.iterator(chunk_size=self.CHUNK_SIZE):
+            user = obj if isinstance(obj, User) else obj.user
+            try:
+                user_context = build_email_context(
+                    user, mailing_type=mail_schema.mailing_type, **context
+                )
+                batch.add(mail_schema.render(user_context), user)
+                self.logger.info("Sent %s to %s", name, user.email)
+            except Exception as e:
+                self.logger.error(
+                    "Failed to send %s to %s: %s", name, user.email, str(e)
+                )
+            else:
+                counter += 1
+        batch.flush()
+        return counter
 
     def blank_profile(self):
         """
@@ -93,27 +171,9 @@ class PostmanService:
                 user__mailing__mailbox__mail_template=mail_schema.template_file,
             )
             .exclude(user__date_joined__gt=timezone.now() - timezone.timedelta(days=3))
-            .select_related("user")
+            .select_related("user__mailing__preferences")
         )
-
-        counter = 0
-        for profile in qs:
-            try:
-                context = build_email_context(
-                    profile.user, mailing_type=mail_schema.mailing_type
-                )
-                MailingService(mail_schema(context)).send_mail(profile.user)
-                self.logger.info(
-                    "Sent incomplete profile reminder to %s", profile.user.email
-                )
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send incomplete profile reminder to %s: %s",
-                    profile.user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
+        counter = self.send_campaign(mail_schema, qs, "incomplete profile reminder")
         self.logger.info(
             "Incomplete profile reminder email has been sent to %d players", counter
         )
@@ -131,27 +191,9 @@ class PostmanService:
                 user__is_email_verified=False,
             )
             .exclude(user__date_joined__gt=timezone.now() - timezone.timedelta(days=3))
-            .select_related("user")
+            .select_related("user__mailing__preferences")
         )
-
-        counter = 0
-        for profile in qs:
-            try:
-                context = build_email_context(
-                    profile.user, mailing_type=mail_schema.mailing_type
-                )
-                MailingService(mail_schema(context)).send_mail(profile.user)
-                self.logger.info(
-                    "Sent incomplete profile reminder to %s", profile.user.email
-                )
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send incomplete profile reminder to %s: %s",
-                    profile.user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
+        counter = self.send_campaign(mail_schema, qs, "incomplete profile reminder")
         self.logger.info(
             "Incomplete profile reminder email has been sent to %d coaches", counter
         )
@@ -169,26 +211,9 @@ class PostmanService:
                 user__is_email_verified=False,
             )
             .exclude(user__date_joined__gt=timezone.now() - timezone.timedelta(days=3))
-            .select_related("user")
+            .select_related("user__mailing__preferences")
         )
-        counter = 0
-        for profile in qs:
-            try:
-                context = build_email_context(
-                    profile.user, mailing_type=mail_schema.mailing_type
-                )
-                MailingService(mail_schema(context)).send_mail(profile.user)
-                self.logger.info(
-                    "Sent incomplete profile reminder to %s", profile.user.email
-                )
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send incomplete profile reminder to %s: %s",
-                    profile.user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
+        counter = self.send_campaign(mail_schema, qs, "incomplete profile reminder")
         self.logger.info(
             "Incomplete profile reminder email has been sent to %d clubs", counter
         )
@@ -214,23 +239,11 @@ class PostmanService:
             .exclude(
                 is_email_verified=False,
             )
+            .select_related("mailing__preferences")
+        )
+        counter = self.send_campaign(
+            mail_schema, qs, "inactive (30 days) user reminder", days_inactive=30
         )
-        counter = 0
-        for user in qs:
-            try:
-                context = build_email_context(
-                    user, days_inactive=30, mailing_type=mail_schema.mailing_type
-                )
-                MailingService(mail_schema(context)).send_mail(user)
-                self.logger.info("Sent inactive (30 days) user reminder to %s", user.email)
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send inactive (30 days) user reminder to %s: %s",
-                    user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
         self.logger.info(
             "Inactive (30 days) user reminder email has been sent to %d users",
             counter,
@@ -257,23 +270,11 @@ class PostmanService:
             .exclude(
                 is_email_verified=False,
             )
+            .select_related("mailing__preferences")
+        )
+        counter = self.send_campaign(
+            mail_schema, qs, "inactive (90 days) user reminder", days_inactive=90
         )
-        counter = 0
-        for user in qs:
-            try:
-                context = build_email_context(
-                    user, days_inactive=90, mailing_type=mail_schema.mailing_type
-                )
-                MailingService(mail_schema(context)).send_mail(user)
-                self.logger.info("Sent inactive (90 days) user reminder to %s", user.email)
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send inactive (90 days) user reminder to %s: %s",
-                    user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
         self.logger.info(
             "Inactive (90 days) user reminder email has been sent to %d users",
             counter,
@@ -295,24 +296,9 @@ class PostmanService:
                 user__is_email_verified=False,
             )
             .exclude(user__date_joined__gt=timezone.now() - timezone.timedelta(days=5))
-            .select_related("user")
+            .select_related("user__mailing__preferences")
         )
-        counter = 0
-        for pp in qs:
-            try:
-                context = build_email_context(
-                    pp.user, mailing_type=mail_schema.mailing_type
-                )
-                MailingService(mail_schema(context)).send_mail(pp.user)
-                self.logger.info("Sent premium encouragement email to %s", pp.user.email)
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send premium encouragement email to %s: %s",
-                    pp.user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
+        counter = self.send_campaign(mail_schema, qs, "premium encouragement email")
         self.logger.info(
             "Premium encouragement email has been sent to %d users",
             counter,
@@ -344,26 +330,9 @@ class PostmanService:
             .exclude(
                 user__is_email_verified=False,
             )
-            .select_related("user")
+            .select_related("user__mailing__preferences")
         )
-        counter = 0
-        for meta in qs:
-            try:
-                context = build_email_context(
-                    meta.user, mailing_type=mail_schema.mailing_type
-                )
-                MailingService(mail_schema(context)).send_mail(meta.user)
-                self.logger.info(
-                    "Sent profile views milestone email to %s", meta.user.email
-                )
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send profile views milestone email to %s: %s",
-                    meta.user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
+        counter = self.send_campaign(mail_schema, qs, "profile views milestone email")
         self.logger.info(
             "Profile views milestone email has been sent to %d users", counter
         )
@@ -387,24 +356,9 @@ class PostmanService:
                 user__is_email_verified=False,
             )
             .exclude(user__date_joined__gt=timezone.now() - timezone.timedelta(days=7))
-            .select_related("user")
+            .select_related("user__mailing__preferences")
         )
-        counter = 0
-        for player in qs:
-            try:
-                context = build_email_context(
-                    player.user, mailing_type=mail_schema.mailing_type
-                )
-                MailingService(mail_schema(context)).send_mail(player.user)
-                self.logger.info("Sent transfer status reminder to %s", player.user.email)
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send transfer status reminder to %s: %s",
-                    player.user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
+        counter = self.send_campaign(mail_schema, qs, "transfer status reminder")
         self.logger.info(
             "Transfer status reminder email has been sent to %d players", counter
         )
@@ -428,24 +382,9 @@ class PostmanService:
                 user__is_email_verified=False,
             )
             .exclude(user__date_joined__gt=timezone.now() - timezone.timedelta(days=7))
-            .select_related("user")
+            .select_related("user__mailing__preferences")
         )
-        counter = 0
-        for meta in qs:
-            try:
-                context = build_email_context(
-                    meta.user, mailing_type=mail_schema.mailing_type
-                )
-                MailingService(mail_schema(context)).send_mail(meta.user)
-                self.logger.info("Sent transfer request reminder to %s", meta.user.email)
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send transfer request reminder to %s: %s",
-                    meta.user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
+        counter = self.send_campaign(mail_schema, qs, "transfer request reminder")
         self.logger.info(
             "Transfer request reminder email has been sent to %d profiles", counter
         )
@@ -465,22 +404,9 @@ class PostmanService:
                 is_email_verified=False,
             )
             .exclude(date_joined__gt=timezone.now() - timezone.timedelta(days=10))
+            .select_related("mailing__preferences")
         )
-
-        counter = 0
-        for user in qs:
-            try:
-                context = build_email_context(user, mailing_type=mail_schema.mailing_type)
-                MailingService(mail_schema(context)).send_mail(user)
-                self.logger.info("Sent invite friends reminder to %s", user.email)
-            except Exception as e:
-                self.logger.error(
-                    "Failed to send invite friends reminder to %s: %s",
-                    user.email,
-                    str(e),
-                )
-            else:
-                counter += 1
+        counter = self.send_campaign(mail_schema, qs, "invite friends reminder")
         self.logger.info(
             "Invite friends reminder email has been sent to %d users", counter
         )
@@ -509,6 +435,10 @@ class CIDImageConfig:
         )
 
 
+# path -> content of CID images, shared by all emails sent by the process
+_cid_image_data: Dict[str, bytes] = {}
+
+
 class EmailCIDService:
     """Service for attaching CID images to emails."""
 
@@ -525,13 +455,12 @@ class EmailCIDService:
         """
         Attach a single CID image to an email.
         """
-        if not image_config.exists():
+        if image_config.path not in _cid_image_data and not image_config.exists():
             logger.warning(f"CID image not found: {image_config.path}")
             return
 
         try:
-            with open(image_config.path, 'rb') as f:
-                image_data = f.read()
+            image_data = EmailCIDService.get_image_data(image_config)
 
             subtype = image_config.mime_type.split('/')[-1]
 
@@ -548,6 +477,17 @@ class EmailCIDService:
         except Exception as e:
             logger.warning(f"Failed to attach CID image {image_config.filename}: {str(e)}")
 
+    @staticmethod
+    def get_image_data(image_config: CIDImageConfig) -> bytes:
+        """
+        Get image content, read from disk once per (worker) process.
+        """
+        if (image_data := _cid_image_data.get(image_config.path)) is None:
+            with open(image_config.path, 'rb') as f:
+                image_data = f.read()
+            _cid_image_data[image_config.path] = image_data
+        return image_data
+
     @staticmethod
     def attach_standard_images(email: EmailMultiAlternatives) -> None:
         """
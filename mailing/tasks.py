@@ -1,3 +1,4 @@
+import typing
 import uuid
 
 from celery import shared_task
@@ -126,3 +127,149 @@ def send(
         logger.error(f"✗ Email failed: {error_result}")
 
         raise Exception(error_result) from err
+
+
+@shared_task(bind=True, max_retries=3)
+def send_batch(
+    self,
+    operation_id: uuid.UUID,
+    messages: typing.List[dict],
+) -> dict:
+    """
+    Send many (individually rendered) emails over a single SMTP connection.
+    Each message is a dict with recipient, subject, message, html_message
+    and template_file keys.
+    Recipients and antispam state are resolved with bulk queries, emails are sent
+    in chunks of `MAILING_BATCH_SIZE` and throughput of the chunk is stored
+    in metadata of its mail logs.
+    Messages which failed to send are retried (with backoff) up to
+    `max_retries` times, failed mail logs are not counted by antispam.
+    """
+    from mailing.models import MailLog
+    from mailing.services import EmailCIDService
+
+    if not messages:
+        logger.warning(f"[{operation_id}] No recipients provided")
+        return {"status": "skipped", "reason": "no_recipients"}
+
+    users = {
+        user.email: user
+        for user in User.objects.filter(
+            email__in={data["recipient"] for data in messages},
+            mailing__isnull=False,
+        ).select_related("mailing")
+    }
+    recently_sent = set(
+        MailLog.objects.filter(
+            mailing__user__in=users.values(),
+            subject__in={data["subject"] for data in messages},
+            created_at__gte=timezone.now() - timezone.timedelta(minutes=15),  # antispam
+        )
+        .exclude(status=MailLog.MailStatus.FAILED)
+        .values_list("mailing_id", "subject")
+    )
+
+    outgoing = []  # (message, email, mail_log)
+    with get_connection() as batch_connection:
+        for data in messages:
+            recipient = data["recipient"]
+            if user := users.get(recipient):
+                if (user.mailing.pk, data["subject"]) in recently_sent:
+                    logger.info(
+                        f"[{operation_id}] Antispam skip: {recipient} -- {data['subject']}"
+                    )
+                    continue
+                recently_sent.add((user.mailing.pk, data["subject"]))
+                mail_log = MailLog(
+                    mailing=user.mailing,
+                    mail_template=data.get("template_file"),
+                    operation_id=operation_id,
+                    subject=data["subject"],
+                )
+            else:
+                logger.warning(
+                    f"[{operation_id}] No mailing found for recipient: {recipient}"
+                )
+                mail_log = None
+            email = EmailCIDService.create_email_with_cid_images(
+                subject=data["subject"],
+                message=data.get("message", ""),
+                html_message=data.get("html_message"),
+                recipient_list=[recipient],
+                connection=batch_connection,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+            )
+            outgoing.append((data, email, mail_log))
+        MailLog.objects.bulk_create(
+            [mail_log for _, _, mail_log in outgoing if mail_log is not None]
+        )
+
+        sent = failed = 0
+        failed_messages = []
+        for start in range(0, len(outgoing), settings.MAILING_BATCH_SIZE):
+            chunk = outgoing[start : start + settings.MAILING_BATCH_SIZE]
+            metadata = {"batch": start // settings.MAILING_BATCH_SIZE + 1}
+            errors = {}  # index of message in the chunk: error
+            with Timer() as timer:
+                # one by one over the open connection, so an error doesn't
+                # make already delivered messages of the chunk retried
+                for index, (data, email, _) in enumerate(chunk):
+                    try:
+                        batch_connection.send_messages([email])
+                    except Exception as err:
+                        logger.error(
+                            f"[{operation_id}] Failed to send email to "
+                            f"{data['recipient']}: {str(err)}"
+                        )
+                        errors[index] = str(err)
+                        failed_messages.append(data)
+            failed += len(errors)
+            sent += len(chunk) - len(errors)
+            metadata.update(
+                {
+                    "batch_size": len(chunk),
+                    "duration_seconds": timer.duration,
+                    "emails_per_second": round(
+                        len(chunk) / max(timer.duration, 0.001), 1
+                    ),
+                    "start_time": timer.start_time,
+                    "end_time": timer.end_time,
+                }
+            )
+            mail_logs = []
+            for index, (_, _, mail_log) in enumerate(chunk):
+                if mail_log is None:
+                    continue
+                if index in errors:
+                    mail_log.metadata = {**metadata, "error": errors[index]}
+                    mail_log.status = MailLog.MailStatus.FAILED
+                else:
+                    mail_log.metadata = metadata
+                    mail_log.status = MailLog.MailStatus.SENT
+                mail_log.updated_at = timezone.now()
+                mail_logs.append(mail_log)
+            MailLog.objects.bulk_update(mail_logs, ["metadata", "status", "updated_at"])
+            logger.info(
+                f"[{operation_id}] Batch {metadata['batch']}: {len(chunk)} emails, "
+                f"{metadata['emails_per_second']}/s ({len(errors)} failed)"
+            )
+
+    if failed_messages and self.request.retries < self.max_retries:
+        countdown = 60 * 2**self.request.retries
+        logger.warning(
+            f"[{operation_id}] Retrying {len(failed_messages)} failed emails "
+            f"in {countdown}s"
+        )
+        raise self.retry(
+            args=(),
+            kwargs={"operation_id": operation_id, "messages": failed_messages},
+            countdown=countdown,
+        )
+
+    return {
+        "status": "done",
+        "operation_id": str(operation_id),
+        "sent": sent,
+        "failed": failed,
+        "skipped": len(messages) - len(outgoing),
+    }
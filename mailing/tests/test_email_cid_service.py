@@ -146,6 +146,26 @@ class TestEmailCIDService:
         finally:
             os.unlink(temp_path)
 
+    def test_image_data_read_once(self):
+        """Test image content is read from disk only for the first email."""
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
+            temp_file.write(b'fake_image_data')
+            temp_path = temp_file.name
+
+        try:
+            config = CIDImageConfig('test.png', 'test_cid', temp_path)
+            EmailCIDService.attach_image(self.email, config)
+
+            other_email = EmailMultiAlternatives(to=['other@example.com'])
+            with patch('builtins.open', side_effect=IOError("Read error")):
+                EmailCIDService.attach_image(other_email, config)
+
+            assert len(other_email.attachments) == 1
+            assert other_email.attachments[0].get_payload(decode=True) == b'fake_image_data'
+
+        finally:
+            os.unlink(temp_path)
+
     def test_attach_standard_images(self):
         """Test attaching standard images to email."""
         # Create temporary files
@@ -1,11 +1,18 @@
 from datetime import timedelta
+from smtplib import SMTPException
 from typing import List
+from unittest.mock import patch
+from uuid import uuid4
 
 import pytest
+from django.core.mail.backends.locmem import EmailBackend
 from django.utils import timezone
+from django.utils.html import strip_tags
 
+from mailing.models import MailLog
 from mailing.schemas import EmailTemplateRegistry, MailContent
 from mailing.services import MailingService, PostmanService
+from mailing.tasks import send_batch
 from mailing.utils import build_email_context
 from premium.models import PremiumType
 from users.models import User
@@ -183,7 +190,7 @@ class TestPostmanService:
         mock_timezone_now(mock_current_time)
         postman_service.go_premium()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.PREMIUM_ENCOURAGEMENT.subject
+            outbox, EmailTemplateRegistry.PREMIUM_ENCOURAGEMENT.subject_format
         )
 
         assert len(recipients) == 1
@@ -202,7 +209,7 @@ class TestPostmanService:
         postman_service.go_premium()
 
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.PREMIUM_ENCOURAGEMENT.subject
+            outbox, EmailTemplateRegistry.PREMIUM_ENCOURAGEMENT.subject_format
         )
 
         assert len(recipients) == 2
@@ -214,7 +221,7 @@ class TestPostmanService:
         postman_service.go_premium()
 
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.PREMIUM_ENCOURAGEMENT.subject
+            outbox, EmailTemplateRegistry.PREMIUM_ENCOURAGEMENT.subject_format
         )
 
         assert len(recipients) == 5
@@ -242,7 +249,7 @@ class TestPostmanService:
         mock_timezone_now(now)
         postman_service.views_monthly()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.PROFILE_VIEWS_MILESTONE.subject
+            outbox, EmailTemplateRegistry.PROFILE_VIEWS_MILESTONE.subject_format
         )
 
         assert len(recipients) == 1
@@ -261,7 +268,7 @@ class TestPostmanService:
         postman_service.views_monthly()
 
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.PROFILE_VIEWS_MILESTONE.subject
+            outbox, EmailTemplateRegistry.PROFILE_VIEWS_MILESTONE.subject_format
         )
         assert len(recipients) == 2
         assert p3.user.email in recipients
@@ -285,7 +292,7 @@ class TestPostmanService:
 
         postman_service.player_without_transfer_status()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.TRANSFER_STATUS_REMINDER.subject
+            outbox, EmailTemplateRegistry.TRANSFER_STATUS_REMINDER.subject_format
         )
 
         assert len(recipients) == 1
@@ -297,7 +304,7 @@ class TestPostmanService:
         mock_timezone_now(mock_time_plus_days(34))
         postman_service.player_without_transfer_status()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.TRANSFER_STATUS_REMINDER.subject
+            outbox, EmailTemplateRegistry.TRANSFER_STATUS_REMINDER.subject_format
         )
 
         assert len(recipients) == 2
@@ -306,7 +313,7 @@ class TestPostmanService:
         mock_timezone_now(mock_time_plus_days(31))
         postman_service.player_without_transfer_status()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.TRANSFER_STATUS_REMINDER.subject
+            outbox, EmailTemplateRegistry.TRANSFER_STATUS_REMINDER.subject_format
         )
 
         assert len(recipients) == 3
@@ -330,7 +337,7 @@ class TestPostmanService:
 
         postman_service.profile_without_transfer_request()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.TRANSFER_REQUEST_REMINDER.subject
+            outbox, EmailTemplateRegistry.TRANSFER_REQUEST_REMINDER.subject_format
         )
 
         assert len(recipients) == 1
@@ -341,7 +348,7 @@ class TestPostmanService:
         mock_timezone_now(mock_time_plus_days(34))
         postman_service.profile_without_transfer_request()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.TRANSFER_REQUEST_REMINDER.subject
+            outbox, EmailTemplateRegistry.TRANSFER_REQUEST_REMINDER.subject_format
         )
 
         assert len(recipients) == 2
@@ -351,7 +358,7 @@ class TestPostmanService:
         mock_timezone_now(mock_time_plus_days(30))
         postman_service.profile_without_transfer_request()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.TRANSFER_REQUEST_REMINDER.subject
+            outbox, EmailTemplateRegistry.TRANSFER_REQUEST_REMINDER.subject_format
         )
         assert len(recipients) == 3
         assert c1.user.email in recipients
@@ -377,7 +384,7 @@ class TestPostmanService:
 
         postman_service.invite_friends()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.INVITE_FRIENDS_REMINDER.subject
+            outbox, EmailTemplateRegistry.INVITE_FRIENDS_REMINDER.subject_format
         )
 
         assert recipients.count(player_profile.user.email) == 1
@@ -387,7 +394,7 @@ class TestPostmanService:
 
         postman_service.invite_friends()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.INVITE_FRIENDS_REMINDER.subject
+            outbox, EmailTemplateRegistry.INVITE_FRIENDS_REMINDER.subject_format
         )
 
         assert recipients.count(player_profile.user.email) == 1
@@ -396,12 +403,85 @@ class TestPostmanService:
         mock_timezone_now(mock_time_plus_days(2))
         postman_service.invite_friends()
         recipients = self._get_recipients_list(
-            outbox, EmailTemplateRegistry.INVITE_FRIENDS_REMINDER.subject
+            outbox, EmailTemplateRegistry.INVITE_FRIENDS_REMINDER.subject_format
         )
 
         assert recipients.count(player_profile.user.email) == 2
         assert recipients.count(coach_profile.user.email) == 2
 
+    def test_campaign_sent_in_batches(self, outbox) -> None:
+        old_date = timezone.now() - timedelta(days=16)
+        profiles = PlayerProfileFactory.create_batch(
+            3, user__declared_role="P", user__date_joined=old_date
+        )
+        outbox.clear()
+
+        PostmanService(batch_size=2).invite_friends()
+
+        assert len(outbox) == 3
+        logs = MailLog.objects.filter(
+            mailing__user__in=[profile.user for profile in profiles]
+        )
+        assert logs.count() == 3
+        for log in logs:
+            assert log.status == MailLog.MailStatus.SENT
+            assert log.mail_template == "invite_friends_reminder.html"
+            assert log.metadata["batch_size"] in (1, 2)
+            assert "emails_per_second" in log.metadata
+
+    def test_failed_batch_is_retried(self, outbox) -> None:
+        profile = PlayerProfileFactory.create()
+        outbox.clear()
+        send_messages = EmailBackend.send_messages
+        calls = []
+
+        def flaky_send_messages(backend, messages):
+            calls.append(len(messages))
+            if len(calls) == 1:
+                raise SMTPException("Connection lost")
+            return send_messages(backend, messages)
+
+        message = {"recipient": profile.user.email, "subject": "Retry", "message": ""}
+        with patch.object(EmailBackend, "send_messages", flaky_send_messages):
+            send_batch.apply(kwargs={"operation_id": uuid4(), "messages": [message]})
+
+        assert calls == [1, 1]
+        assert [email.to for email in outbox] == [[profile.user.email]]
+        statuses = MailLog.objects.filter(
+            mailing__user=profile.user, subject="Retry"
+        ).values_list("status", flat=True)
+        assert sorted(statuses) == [MailLog.MailStatus.FAILED, MailLog.MailStatus.SENT]
+
+    def test_only_undelivered_emails_are_retried(self, outbox) -> None:
+        delivered, undelivered = PlayerProfileFactory.create_batch(2)
+        outbox.clear()
+        send_messages = EmailBackend.send_messages
+        calls = []
+
+        def flaky_send_messages(backend, messages):
+            calls.append(messages[0].to)
+            if len(calls) == 2:
+                raise SMTPException("Recipient refused")
+            return send_messages(backend, messages)
+
+        messages = [
+            {"recipient": profile.user.email, "subject": "Partial", "message": ""}
+            for profile in (delivered, undelivered)
+        ]
+        with patch.object(EmailBackend, "send_messages", flaky_send_messages):
+            send_batch.apply(kwargs={"operation_id": uuid4(), "messages": messages})
+
+        assert calls == [
+            [delivered.user.email],
+            [undelivered.user.email],
+            [undelivered.user.email],
+        ]
+        assert sorted(email.to[0] for email in outbox) == sorted(
+            [delivered.user.email, undelivered.user.email]
+        )
+        log = MailLog.objects.get(mailing__user=delivered.user, subject="Partial")
+        assert log.status == MailLog.MailStatus.SENT
+
 
 class TestMailing:
     @pytest.mark.parametrize("mail_type", ("SYSTEM", "MARKETING"))
@@ -443,3 +523,16 @@ class TestMailing:
             "Jeżeli nie chcesz otrzymywać podobnych wiadomości, kliknij tutaj"
             not in str(outbox[0].alternatives)
         )
+
+    def test_render_returns_copy(self, player_profile) -> None:
+        mail_schema = EmailTemplateRegistry.INVITE_FRIENDS_REMINDER
+        context = build_email_context(
+            player_profile.user, mailing_type=mail_schema.mailing_type
+        )
+
+        content = mail_schema(context)
+
+        assert content is not mail_schema
+        assert content.subject == mail_schema.subject_format
+        assert content.text_content == strip_tags(content.html_content)
+        assert mail_schema.html_content is None
@@ -11,6 +11,9 @@ class BaseMappingSerializer(serializers.ModelSerializer):
     
     def get_pzpn_id(self, obj):
         """Get LNP UUID from mapper entity"""
+        if hasattr(obj, 'pzpn_id'):
+            # annotated by BaseInternalMappingView.get_mapped_queryset
+            return obj.pzpn_id
         try:
             if hasattr(obj, 'mapper') and obj.mapper:
                 entity = obj.mapper.get_entity(
@@ -1,11 +1,18 @@
-from django.core.cache import cache
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Exists, F, OuterRef, Subquery
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from api.base_view import EndpointView
 from api.internal_auth import InternalAPIKeyAuthentication
+from api.pagination import InternalMappingPagination
 from clubs.models import Club, Team
+from mapper.models import MapperEntity
 from profiles.models import PlayerProfile
 from .serializers import ClubMappingSerializer, TeamMappingSerializer, PlayerMappingSerializer
 
@@ -14,36 +21,97 @@ class BaseInternalMappingView(EndpointView):
     """
     Base view for internal mapping endpoints.
     Uses project's standard EndpointView with internal authentication.
+
+    LNP id (pzpn_id) is joined in the main query, so mappings are read
+    without a query per object. Query parameters common for all mapping views:
+    - updated_since: only mappings changed since given ISO datetime
+    - after: only objects with pk greater than given one (keyset pagination)
+    - stream: stream all mappings as NDJSON (one JSON object per line)
     """
     authentication_classes = [InternalAPIKeyAuthentication]
     permission_classes = []  # No need for additional permissions - authentication handles everything
-    
+    pagination_class = InternalMappingPagination
+    related_type = None
+    export_fields = ('pk', 'name', 'pzpn_id')
+    STREAM_CHUNK_SIZE = 2000
+
+    def get_lnp_entities(self):
+        """LNP mapper entities of objects of the view (outer query)"""
+        entities = MapperEntity.objects.filter(
+            target=OuterRef('mapper'),
+            source__name="LNP",
+            database_source="scrapper_mongodb",
+            related_type=self.related_type,
+        )
+        if updated_since := self.request.GET.get('updated_since'):
+            entities = entities.filter(updated_at__gte=parse_datetime(updated_since))
+        return entities
+
+    def get_mapped_queryset(self, queryset):
+        """Objects having LNP mapping, annotated with their LNP id"""
+        entities = self.get_lnp_entities()
+        queryset = queryset.filter(Exists(entities)).annotate(
+            pzpn_id=Subquery(entities.values('mapper_id')[:1])
+        )
+        if after := self.request.GET.get('after'):
+            queryset = queryset.filter(pk__gt=int(after))
+        return queryset.order_by('pk')
+
+    def export_row(self, row: dict) -> dict:
+        """Adjust exported row (values of `export_fields`), override if needed"""
+        return row
+
+    def stream_rows(self, queryset, limit=None):
+        """NDJSON lines of all mappings, read in chunks by pk (keyset)"""
+        rows = queryset.values(*self.export_fields)
+        last_pk, sent = None, 0
+        while limit is None or sent < limit:
+            chunk_size = self.STREAM_CHUNK_SIZE
+            if limit is not None:
+                chunk_size = min(chunk_size, limit - sent)
+            next_rows = rows.filter(pk__gt=last_pk) if last_pk is not None else rows
+            chunk = list(next_rows[:chunk_size])
+            for row in chunk:
+                yield json.dumps(self.export_row(row), cls=DjangoJSONEncoder) + '\n'
+            if len(chunk) < chunk_size:
+                return
+            last_pk, sent = chunk[-1]['pk'], sent + len(chunk)
+
     @action(detail=False, methods=['get'])
     def list(self, request):
         """List mappings with optional pagination - common logic for all mapping views"""
         try:
-            queryset = self.get_queryset()
-            
-            # Handle pagination based on query params
             limit = request.GET.get('limit')
-            if limit:
+            if limit is not None:
                 try:
-                    limit = min(int(limit), 10000)
-                    if limit > 0:
-                        # Set the pagination page size dynamically
-                        self.pagination_class.page_size = limit
-                        
-                        # Use built-in pagination with custom limit
-                        page = self.paginate_queryset(queryset)
-                        if page is not None:
-                            serializer = self.get_serializer(page, many=True)
-                            return self.get_paginated_response(serializer.data)
+                    limit = min(int(limit), self.pagination_class.max_page_size)
+                    if limit <= 0:
+                        limit = None
                 except ValueError:
                     return Response(
                         {'error': 'Invalid limit parameter'}, 
                         status=status.HTTP_400_BAD_REQUEST
                     )
-            
+            try:
+                queryset = self.get_mapped_queryset(self.get_queryset())
+            except (TypeError, ValueError):
+                return Response(
+                    {'error': 'Invalid updated_since or after parameter'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            if request.GET.get('stream'):
+                return StreamingHttpResponse(
+                    self.stream_rows(queryset, limit),
+                    content_type='application/x-ndjson',
+                )
+
+            # page size is taken from `limit` by the paginator
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+
             # No pagination - return all data
             serializer = self.get_serializer(queryset, many=True)
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -64,16 +132,14 @@ class ClubMappingsAPIView(BaseInternalMappingView):
     Query Parameters:
     - limit: Number of items per page (optional, no default limit)
     - page: Page number for pagination (optional, default: 1)
+    - updated_since, after, stream: see BaseInternalMappingView
     """
     serializer_class = ClubMappingSerializer
+    related_type = "club"
     
     def get_queryset(self):
-        """Get clubs with LNP mappings"""
-        return Club.objects.filter(
-            mapper__mapperentity__source__name="LNP",
-            mapper__mapperentity__database_source="scrapper_mongodb",
-            mapper__mapperentity__related_type="club"
-        ).select_related('mapper').distinct().order_by('pk')
+        """Get clubs (LNP mappings are joined by get_mapped_queryset)"""
+        return Club.objects.all()
 
 
 class TeamMappingsAPIView(BaseInternalMappingView):
@@ -85,16 +151,17 @@ class TeamMappingsAPIView(BaseInternalMappingView):
     Query Parameters:
     - limit: Number of items per page (optional, no default limit)
     - page: Page number for pagination (optional, default: 1)
+    - updated_since, after, stream: see BaseInternalMappingView
     """
     serializer_class = TeamMappingSerializer
+    related_type = "team"
+    export_fields = ('pk', 'name', 'pzpn_id', 'club_pk', 'club_name')
     
     def get_queryset(self):
-        """Get teams with LNP mappings"""
-        return Team.objects.filter(
-            mapper__mapperentity__source__name="LNP",
-            mapper__mapperentity__database_source="scrapper_mongodb", 
-            mapper__mapperentity__related_type="team"
-        ).select_related('mapper', 'club').distinct().order_by('pk')
+        """Get teams (LNP mappings are joined by get_mapped_queryset)"""
+        return Team.objects.select_related('club').annotate(
+            club_pk=F('club_id'), club_name=F('club__name')
+        )
 
 
 class PlayerMappingsAPIView(BaseInternalMappingView):
@@ -106,13 +173,18 @@ class PlayerMappingsAPIView(BaseInternalMappingView):
     Query Parameters:
     - limit: Number of items per page (optional, no default limit)
     - page: Page number for pagination (optional, default: 1)
+    - updated_since, after, stream: see BaseInternalMappingView
     """
     serializer_class = PlayerMappingSerializer
+    related_type = "player"
+    export_fields = ('pk', 'uuid', 'user__first_name', 'user__last_name', 'pzpn_id')
     
     def get_queryset(self):
-        """Get players with LNP mappings"""
-        return PlayerProfile.objects.filter(
-            mapper__mapperentity__source__name="LNP",
-            mapper__mapperentity__database_source="scrapper_mongodb",
-            mapper__mapperentity__related_type="player"
-        ).select_related('mapper', 'user', 'team_object').distinct().order_by('pk')
+        """Get players (LNP mappings are joined by get_mapped_queryset)"""
+        return PlayerProfile.objects.select_related('user')
+
+    def export_row(self, row: dict) -> dict:
+        """Player full name the same way as User.get_full_name"""
+        first_name = row.pop('user__first_name') or ''
+        last_name = row.pop('user__last_name') or ''
+        return {**row, 'name': f"{first_name} {last_name}".strip()}
@@ -0,0 +1,112 @@
+import logging
+import threading
+import typing
+from collections import OrderedDict
+
+from mapper.models import MapperEntity
+from utils.cache import MAPPER_ENTITIES_TAG, get_cache_tag_generation
+
+logger = logging.getLogger(__name__)
+
+
+class MappedNames(typing.NamedTuple):
+    team_name: typing.Optional[str] = None
+    league_name: typing.Optional[str] = None
+
+
+class MapperNameResolver:
+    """
+    Resolve scrapper ids (MapperEntity.mapper_id) to names of our team
+    and league, for serializing games and stats of players.
+
+    All ids of a payload are loaded with a single query and memoized in
+    a bounded LRU, shared by all adapters of the process. Memoized names
+    are dropped when MapperEntity rows change, also in other processes
+    (generation of MAPPER_ENTITIES_TAG is checked once per payload).
+    """
+
+    MAX_SIZE = 10_000
+
+    def __init__(self, max_size: int = MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._names: "OrderedDict[str, MappedNames]" = OrderedDict()
+        self._generation = None
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names.clear()
+
+    def _check_generation(self) -> None:
+        """Forget memoized names if mapper entities changed since"""
+        try:
+            generation = get_cache_tag_generation(MAPPER_ENTITIES_TAG)
+        except Exception as e:
+            logger.warning(f"Unable to check mapper entities generation: {e}")
+            generation = None
+        if generation is None or generation != self._generation:
+            self.clear()
+            self._generation = generation
+
+    @staticmethod
+    def load(mapper_ids: typing.Iterable[str]) -> typing.Dict[str, MappedNames]:
+        """Names of given ids, loaded with a single query"""
+        mapper_ids = set(mapper_ids)
+        team_names, league_names = {}, {}
+        entities = (
+            MapperEntity.objects.filter(mapper_id__in=mapper_ids)
+            .select_related(
+                "target__teamhistory__team", "target__leaguehistory__league"
+            )
+            .order_by("pk")
+        )
+        for entity in entities:
+            target = entity.target
+            if target is None:
+                continue
+            if entity.mapper_id not in team_names and hasattr(target, "teamhistory"):
+                team_names[entity.mapper_id] = target.teamhistory.team.name
+            if entity.mapper_id not in league_names and hasattr(
+                target, "leaguehistory"
+            ):
+                league_names[entity.mapper_id] = target.leaguehistory.league.name
+        return {
+            mapper_id: MappedNames(
+                team_names.get(mapper_id), league_names.get(mapper_id)
+            )
+            for mapper_id in mapper_ids
+        }
+
+    def resolve(
+        self, mapper_ids: typing.Iterable[str]
+    ) -> typing.Dict[str, MappedNames]:
+        """Names of given ids, only those not memoized yet are queried"""
+        mapper_ids = {mapper_id for mapper_id in mapper_ids if mapper_id}
+        self._check_generation()
+        with self._lock:
+            missing = mapper_ids - self._names.keys()
+        loaded = self.load(missing) if missing else {}
+
+        with self._lock:
+            self._names.update(loaded)
+            result = {}
+            for mapper_id in mapper_ids:
+                if mapper_id in loaded:
+                    result[mapper_id] = loaded[mapper_id]
+                elif mapper_id in self._names:
+                    self._names.move_to_end(mapper_id)
+                    result[mapper_id] = self._names[mapper_id]
+            while len(self._names) > self.max_size:
+                self._names.popitem(last=False)
+        return result
+
+    def get(self, mapper_id: str) -> MappedNames:
+        """Names of a single id"""
+        with self._lock:
+            if mapper_id in self._names:
+                self._names.move_to_end(mapper_id)
+                return self._names[mapper_id]
+        return self.resolve([mapper_id]).get(mapper_id, MappedNames())
+
+
+mapper_name_resolver = MapperNameResolver()
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from mapper.models import MapperEntity
+from mapper.resolver import mapper_name_resolver
+from utils.cache import MAPPER_ENTITIES_TAG, invalidate_cache_tags
+
+
+@receiver(post_save, sender=MapperEntity)
+@receiver(post_delete, sender=MapperEntity)
+def mapper_entity_changed(sender, instance, **kwargs):
+    """
+    Forget names resolved by mapper ids, in this and other processes.
+    """
+    mapper_name_resolver.clear()
+    invalidate_cache_tags(MAPPER_ENTITIES_TAG)
@@ -1,3 +1,4 @@
+import json
 import pytest
 from rest_framework.response import Response
 from rest_framework.test import APITestCase
@@ -216,3 +217,47 @@ class TestPaginationAndErrorHandling(BaseInternalMappingAPI):
             assert len(data['results']) >= 0  # Could be 0 or more
         else:  # Non-paginated response
             assert isinstance(data, list)
+
+
+@pytest.mark.django_db
+class TestMappingExport(BaseInternalMappingAPI):
+    """Test streaming (NDJSON) export of mappings"""
+
+    def setUp(self):
+        super().setUp()
+        from mapper.models import MapperEntity, MapperSource
+        from utils.factories import ClubFactory
+
+        source = MapperSource.objects.create(name="LNP")
+        self.clubs = [ClubFactory.create(name=f"Export Club {i}") for i in range(3)]
+        for i, club in enumerate(self.clubs[:2]):
+            MapperEntity.objects.create(
+                target=club.mapper,
+                source=source,
+                mapper_id=f"lnp-{i}",
+                related_type="club",
+                database_source="scrapper_mongodb",
+            )
+
+    def get_rows(self, **params):
+        response = self.make_authenticated_request(
+            'GET', self.clubs_url, {'stream': 1, **params}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        content = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_stream_mapped_clubs(self):
+        rows = self.get_rows()
+
+        assert rows == [
+            {'pk': club.pk, 'name': club.name, 'pzpn_id': f"lnp-{i}"}
+            for i, club in enumerate(self.clubs[:2])
+        ]
+
+    def test_stream_keyset_and_updated_since(self):
+        assert [row['pk'] for row in self.get_rows(after=self.clubs[0].pk)] == [
+            self.clubs[1].pk
+        ]
+        assert self.get_rows(updated_since="2999-01-01T00:00:00+00:00") == []
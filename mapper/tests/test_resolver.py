@@ -0,0 +1,50 @@
+import pytest
+
+from mapper.models import MapperEntity
+from mapper.resolver import MappedNames, MapperNameResolver
+from utils.factories import TeamHistoryFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def team_history():
+    history = TeamHistoryFactory.create()
+    MapperEntity.objects.create(
+        target=history.mapper,
+        mapper_id="team-1",
+        related_type=MapperEntity.MapperRelatedModel.TEAM_HISTORY,
+        database_source=MapperEntity.MapperDataSource.MONGODB,
+    )
+    return history
+
+
+def test_names_loaded_once(team_history, django_assert_num_queries):
+    resolver = MapperNameResolver()
+
+    with django_assert_num_queries(1):
+        names = resolver.resolve(["team-1", "unknown"])
+
+    assert names["team-1"] == MappedNames(team_name=team_history.team.name)
+    assert names["unknown"] == MappedNames()
+    with django_assert_num_queries(0):
+        assert resolver.get("team-1").team_name == team_history.team.name
+        resolver.resolve(["team-1", "unknown"])
+
+
+def test_changed_entity_invalidates_names(team_history):
+    resolver = MapperNameResolver()
+    resolver.resolve(["team-1"])
+
+    MapperEntity.objects.get(mapper_id="team-1").delete()
+
+    assert resolver.resolve(["team-1"])["team-1"] == MappedNames()
+
+
+def test_least_recently_used_names_dropped(team_history):
+    resolver = MapperNameResolver(max_size=2)
+    resolver.resolve(["team-1", "a"])
+    resolver.get("team-1")
+    resolver.resolve(["b"])
+
+    assert set(resolver._names) == {"team-1", "b"}
@@ -0,0 +1,20 @@
+from premium.snapshot import premium_snapshot_scope
+
+
+class PremiumSnapshotMiddleware:
+    """
+    Middleware to scope premium products snapshot to a single request.
+
+    Premium state of each profile is loaded at most once per request,
+    no matter how many times `is_premium`, `is_promoted` etc. are accessed.
+    """
+
+    def __init__(self, get_response):
+        """
+        Initialize the middleware.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with premium_snapshot_scope():
+            return self.get_response(request)
@@ -2,6 +2,7 @@ from django.http import HttpRequest
 from django.test import TestCase, RequestFactory
 from .user_activity_middleware import UserActivityMiddleware
 from users.models import User
+from users.tasks import flush_user_activity
 from unittest.mock import patch, Mock, PropertyMock
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -23,7 +24,8 @@ class UserActivityMiddlewareTest(TestCase):
         """
         Helper method to check that the user's last_activity timestamp has been updated.
         """
-        # Refresh user from database to get updated last_activity
+        # Write buffered activity and refresh user to get updated last_activity
+        flush_user_activity()
         self.user.refresh_from_db()
 
         # Check that the user's last_activity was updated
@@ -66,6 +68,26 @@ class UserActivityMiddlewareTest(TestCase):
         """
         self._test_request_for_authenticated_user("patch", {"key": "value"})
 
+    def test_requests_coalesced_into_single_update(self):
+        """
+        Test that many requests of a user between flushes are written at once,
+        with the latest timestamp, and mark the user as logged in today.
+        """
+        for _ in range(3):
+            request = self.factory.get("/")
+            request.user = self.user
+            self.middleware(request)
+
+        stats = flush_user_activity()
+
+        assert stats["users"] == 1
+        assert stats["hits"] == 3
+        assert stats["coalescing_ratio"] == 3
+        self.user.refresh_from_db()
+        assert self.user.last_activity is not None
+        assert self.user.profile_visit_history.get().user_logged_in
+        assert flush_user_activity()["users"] == 0
+
     def test_middleware_handles_exception_gracefully(self):
         """
         Test to ensure the middleware handles exceptions thrown during the
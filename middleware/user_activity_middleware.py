@@ -1,5 +1,5 @@
 import logging
-from users.tasks import update_user_last_activity, update_visit_history_for_actual_date
+from users.activity import record_activity
 logger = logging.getLogger("user_activity")
 
 
@@ -7,8 +7,9 @@ class UserActivityMiddleware:
     """
     Middleware to track the activity of authenticated users.
 
-    Whenever an authenticated user makes a request, their activity is updated
-    using the `new_user_activity` method on the user instance.
+    Whenever an authenticated user makes a request, their activity is recorded
+    in a buffer, which is written to the database periodically
+    by `users.tasks.flush_user_activity`.
     """
 
     def __init__(self, get_response):
@@ -26,9 +27,7 @@ class UserActivityMiddleware:
         # check if user is authenticated and update activity
         if request.user.is_authenticated:
             try:
-                user = request.user
-                update_user_last_activity.delay(user_id=user.pk)
-                update_visit_history_for_actual_date.delay(user_id=user.pk)
+                record_activity(request.user.pk)
             except Exception as e:
                 logger.error(f"Error updating user activity: {e}")
         return response
@@ -17,6 +17,7 @@ class NotificationSerializer(I18nSerializerMixin, serializers.ModelSerializer):
     """
     title = serializers.SerializerMethodField()
     description = serializers.SerializerMethodField()
+    picture = serializers.SerializerMethodField()
     
     class Meta:
         model = Notification
@@ -34,6 +35,14 @@ class NotificationSerializer(I18nSerializerMixin, serializers.ModelSerializer):
             "picture_profile_role",
         ]
     
+    def get_picture(self, obj):
+        """Url of the picture, as serialized by ImageField."""
+        if not (picture := obj.get_picture()):
+            return None
+        if request := self.context.get("request"):
+            return request.build_absolute_uri(picture.url)
+        return picture.url
+
     def get_title(self, obj):
         """Get translated title."""
         return self._translate_field(obj, 'title')
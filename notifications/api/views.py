@@ -20,7 +20,7 @@ class NotificationsView(EndpointView):
         else:
             notifications = request.user.profile.meta.notifications.all()
         serializer = NotificationSerializer(
-            notifications.order_by("-created_at"),
+            notifications.select_related("picture_user").order_by("-created_at"),
             many=True,
             context=self.get_serializer_context(),
         )
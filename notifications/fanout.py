@@ -0,0 +1,149 @@
+"""
+Set based fan-out of notification templates to many profiles.
+"""
+
+import logging
+import time
+import typing
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q, QuerySet
+from django.utils import timezone
+
+from notifications.tasks import create_notifications
+from notifications.templates import NotificationBody, NotificationTemplate
+from profiles.models import PROFILE_MODELS, ProfileMeta
+from users.models import User
+
+logger = logging.getLogger(__name__)
+
+
+def profile_q(negate: bool = False, **lookups) -> Q:
+    """
+    Q matching metas whose profile (of any profile class) matches lookups.
+    Profile classes without looked up field are treated as matching only
+    if `negate` is set (e.g. "has no club" for profiles without clubs).
+    """
+    condition = Q()
+    for model in PROFILE_MODELS:
+        name = model.__name__.lower()
+        try:
+            for lookup in lookups:
+                model._meta.get_field(lookup.split("__")[0])
+        except FieldDoesNotExist:
+            if negate:
+                condition |= Q(_profile_class=name)
+            continue
+        profile_lookups = Q(
+            **{f"{name}__{lookup}": value for lookup, value in lookups.items()}
+        )
+        condition |= Q(_profile_class=name) & (
+            ~profile_lookups if negate else profile_lookups
+        )
+    return condition
+
+
+# Eligible profiles of periodic notifications, each a single SQL query.
+AUDIENCES: typing.Dict[NotificationTemplate, typing.Callable[[QuerySet], QuerySet]] = {
+    NotificationTemplate.CHECK_TRIAL: lambda qs: qs.filter(
+        profile_q(premium_products__trial_tested=False)
+    ),
+    NotificationTemplate.GO_PREMIUM: lambda qs: qs.filter(
+        profile_q(
+            negate=True, premium_products__premium__valid_until__gt=timezone.now()
+        )
+    ),
+    NotificationTemplate.VERIFY_PROFILE: lambda qs: qs.filter(
+        profile_q(negate=True, external_links__links__isnull=False)
+    ),
+    NotificationTemplate.PROFILE_HIDDEN: lambda qs: qs.filter(
+        user__display_status=User.DisplayStatus.NOT_SHOWN
+    ),
+    NotificationTemplate.PM_RANK: lambda qs: qs,
+    NotificationTemplate.VISITS_SUMMARY: lambda qs: qs.annotate(
+        visited_by_count=F("visit_summary__visitors")
+    ).filter(visited_by_count__gt=0),
+    NotificationTemplate.SET_TRANSFER_REQUESTS: lambda qs: qs.filter(
+        _profile_class__in=["coachprofile", "clubprofile", "managerprofile"],
+        transfer_request__isnull=True,
+    ),
+    NotificationTemplate.SET_STATUS: lambda qs: qs.filter(
+        _profile_class="playerprofile", transfer_status__isnull=True
+    ),
+    NotificationTemplate.INVITE_FRIENDS: lambda qs: qs,
+    NotificationTemplate.ADD_LINKS: lambda qs: qs.filter(
+        profile_q(negate=True, external_links__links__isnull=False)
+    ),
+    NotificationTemplate.ADD_VIDEO: lambda qs: qs.filter(
+        _profile_class="playerprofile"
+    ).exclude(user__user_video__isnull=False),
+    NotificationTemplate.TEST: lambda qs: qs.filter(user__is_staff=True),
+    NotificationTemplate.ASSIGN_CLUB: lambda qs: qs.filter(
+        profile_q(negate=True, team_history_object__isnull=False)
+    ),
+    NotificationTemplate.CONFIRM_EMAIL: lambda qs: qs.filter(
+        user__is_email_verified=False
+    ),
+}
+
+# Per profile parameters of templates (annotated by the audience query)
+TEMPLATE_PARAMS: typing.Dict[NotificationTemplate, typing.Tuple[str, ...]] = {
+    NotificationTemplate.VISITS_SUMMARY: ("visited_by_count",),
+}
+
+
+class NotificationFanOut:
+    """
+    Send notification template to every eligible profile.
+
+    Eligible profiles are selected with a single query, body is rendered once
+    and notifications are created in chunks by `create_notifications` task
+    (a few tasks instead of one per profile).
+    """
+
+    BATCH_SIZE = 2000
+
+    def __init__(
+        self,
+        template: NotificationTemplate,
+        body: NotificationBody,
+        queryset: "QuerySet[ProfileMeta]",
+    ) -> None:
+        self.template = template
+        # template name is needed to translate per profile template params
+        self.body = {**body.to_dict(), "template_name": template.name}
+        self.queryset = AUDIENCES[template](queryset)
+        self.params = TEMPLATE_PARAMS.get(template, ())
+
+    def get_targets(self) -> typing.Iterator[typing.List[list]]:
+        """Chunks of [profile_meta_id, per profile template params]"""
+        rows = (
+            self.queryset.order_by("pk")
+            .values_list("pk", *self.params)
+            .iterator(chunk_size=self.BATCH_SIZE)
+        )
+        chunk = []
+        for pk, *values in rows:
+            chunk.append([pk, dict(zip(self.params, values)) or None])
+            if len(chunk) == self.BATCH_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def run(self) -> int:
+        """Dispatch notification to all eligible profiles, return their number"""
+        started = time.monotonic()
+        total = 0
+        for batch, targets in enumerate(self.get_targets(), start=1):
+            create_notifications.delay(targets, self.body)
+            total += len(targets)
+            logger.info(
+                f"{self.template.name}: batch {batch} ({len(targets)} profiles, "
+                f"{total} total) dispatched"
+            )
+        logger.info(
+            f"{self.template.name}: dispatched to {total} profiles "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+        return total
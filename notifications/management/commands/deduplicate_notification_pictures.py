@@ -0,0 +1,91 @@
+import hashlib
+import re
+import typing
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandParser
+
+from notifications.models import Notification
+
+User = get_user_model()
+
+# storage appends "_<7 random chars>" to the name of a file which already exists
+COPY_SUFFIX_PATTERN = re.compile(r"^(?P<stem>.+)_[a-zA-Z0-9]{7}(?P<ext>\.\w+)$")
+
+
+class Command(BaseCommand):
+    help = (
+        "Make notifications show the picture of the user their picture was "
+        "copied from (picture_user) and remove copies created for notifications."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be changed",
+        )
+
+    def handle(self, *args, **options) -> None:
+        dry_run = options["dry_run"]
+        names = set(
+            Notification.objects.filter(picture_user__isnull=True)
+            .exclude(picture__isnull=True)
+            .exclude(picture="")
+            .values_list("picture", flat=True)
+            .distinct()
+        )
+        self.stdout.write(f"Found {len(names)} distinct notification pictures.")
+
+        originals = {name: self.get_original_name(name) for name in names}
+        users = {
+            user.picture.name: user
+            for user in User.objects.filter(
+                picture__in=[*names, *filter(None, originals.values())]
+            ).only("pk", "picture")
+        }
+        updated = removed = freed = 0
+        for name in names:
+            user = users.get(name) or users.get(originals[name])
+            if user is None or (
+                name not in users
+                and self.get_digest(name) != self.get_digest(user.picture.name)
+            ):
+                continue
+            if not dry_run:
+                updated += Notification.objects.filter(picture=name).update(
+                    picture_user=user, picture=""
+                )
+            # only copies made for notifications are removed
+            if name not in users and default_storage.exists(name):
+                freed += default_storage.size(name)
+                removed += 1
+                if not dry_run:
+                    default_storage.delete(name)
+
+        prefix = "[DRY RUN] " if dry_run else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}Updated {updated} notifications, removed {removed} "
+                f"copied files ({freed / 1024 / 1024:.1f} MB)."
+            )
+        )
+
+    @staticmethod
+    def get_original_name(name: str) -> typing.Optional[str]:
+        """Name of the file the picture was (probably) copied from"""
+        if match := COPY_SUFFIX_PATTERN.match(name):
+            return f"{match['stem']}{match['ext']}"
+
+    @staticmethod
+    def get_digest(name: str) -> typing.Optional[str]:
+        """Content hash of stored file, None if it doesn't exist"""
+        try:
+            with default_storage.open(name, "rb") as file:
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: file.read(64 * 1024), b""):
+                    digest.update(chunk)
+                return digest.hexdigest()
+        except (FileNotFoundError, OSError):
+            return None
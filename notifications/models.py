@@ -1,7 +1,9 @@
+import typing
 from urllib.parse import urljoin
 
 from django.conf import settings
 from django.db import models
+from django.db.models.fields.files import FieldFile
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -21,7 +23,16 @@ class Notification(models.Model):
     template_name = models.CharField(max_length=100, null=True, blank=True)
     template_params = models.JSONField(null=True, blank=True)
     icon = models.CharField(max_length=255, null=True, blank=True)
+    # copy of the picture, made by notifications created before `picture_user`
     picture = models.ImageField(null=True, blank=True)
+    # user whose (current) picture is shown with the notification
+    picture_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
     picture_profile_role = models.CharField(max_length=1, null=True, blank=True)
     seen = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -45,8 +56,14 @@ class Notification(models.Model):
     @property
     def picture_url(self) -> str:
         """Generate club picture url"""
-        if self.picture:
-            return urljoin(settings.BASE_URL, self.picture.url)
+        if picture := self.get_picture():
+            return urljoin(settings.BASE_URL, picture.url)
+
+    def get_picture(self) -> typing.Optional[FieldFile]:
+        """Current picture of picture_user, copied picture of older notifications"""
+        if self.picture_user_id:
+            return self.picture_user.picture or None
+        return self.picture or None
 
     def __str__(self) -> str:
         status = _("ODCZYTANO") if self.seen else _("NIE ODCZYTANO")
@@ -6,10 +6,10 @@ from django.db.models import QuerySet
 from django.utils import translation
 from django.utils.translation import gettext as _
 
+from notifications.fanout import NotificationFanOut
 from notifications.tasks import create_notification
 from notifications.templates import NotificationBody, NotificationTemplate
 from profiles.models import BaseProfile, ProfileMeta
-from users.models import User
 from utils import GENDER_BASED_ROLES
 
 
@@ -53,6 +53,7 @@ class NotificationService:
         """
         # Force Polish for parameter generation to ensure consistent storage
         with translation.override("pl"):
+            picture_user_id = picture_profile_role = None
             if profile := kwargs.pop("profile", None):
                 hide_profile = kwargs.pop("hide_profile", False)
                 full_name = profile.user.get_full_name()
@@ -66,23 +67,35 @@ class NotificationService:
                         # Get role name in Polish for storage
                         subject = GENDER_BASED_ROLES[role_short][gender_index]
                         kwargs["profile"] = f"{str(subject)} {full_name}"
-                        kwargs["picture"] = profile.user.picture.name
-                        kwargs["picture_profile_role"] = role_short
+                        picture_user_id = profile.user_id
+                        picture_profile_role = role_short
                 except (KeyError, IndexError):
                     kwargs["profile"] = full_name
 
         return NotificationBody(
-            **template.value, template_name=template.name, kwargs=kwargs
+            **template.value,
+            template_name=template.name,
+            picture_user_id=picture_user_id,
+            picture_profile_role=picture_profile_role,
+            kwargs=kwargs,
         )
 
+    @classmethod
+    def bulk_notify(cls, template: NotificationTemplate) -> int:
+        """
+        Send notification based on the template to all eligible profiles.
+        Eligibility of each template is defined in notifications.fanout.
+        """
+        return NotificationFanOut(
+            template, cls.parse_body(template), cls.get_queryset()
+        ).run()
+
     @classmethod
     def bulk_notify_check_trial(cls) -> None:
         """
         Send notifications for users who haven't tested the trial.
         """
-        for meta in cls.get_queryset():
-            if meta.profile.products and not meta.profile.products.trial_tested:
-                cls(meta).notify_check_trial()
+        cls.bulk_notify(NotificationTemplate.CHECK_TRIAL)
 
     def notify_check_trial(self) -> None:
         """
@@ -98,9 +111,7 @@ class NotificationService:
         """
         Send notifications for non-premium users.
         """
-        for meta in cls.get_queryset():
-            if not meta.profile.is_premium:
-                cls(meta).notify_go_premium()
+        cls.bulk_notify(NotificationTemplate.GO_PREMIUM)
 
     def notify_go_premium(self) -> None:
         """
@@ -116,9 +127,7 @@ class NotificationService:
         """
         Send notifications for unverified profiles.
         """
-        for meta in cls.get_queryset():
-            if not meta.profile.external_links.links.exists():
-                cls(meta).notify_verify_profile()
+        cls.bulk_notify(NotificationTemplate.VERIFY_PROFILE)
 
     def notify_verify_profile(self) -> None:
         """
@@ -134,10 +143,7 @@ class NotificationService:
         """
         Send notifications for hidden profiles.
         """
-        for meta in cls.get_queryset().filter(
-            user__display_status=User.DisplayStatus.NOT_SHOWN
-        ):
-            cls(meta).notify_profile_hidden()
+        cls.bulk_notify(NotificationTemplate.PROFILE_HIDDEN)
 
     def notify_profile_hidden(self) -> None:
         """
@@ -162,8 +168,7 @@ class NotificationService:
         """
         Send notifications for new PM rankings.
         """
-        for meta in cls.get_queryset():
-            cls(meta).notify_pm_rank()
+        cls.bulk_notify(NotificationTemplate.PM_RANK)
 
     def notify_pm_rank(self) -> None:
         """
@@ -179,9 +184,7 @@ class NotificationService:
         """
         Send notifications for users with new visit summaries.
         """
-        for meta in cls.get_queryset():
-            if meta.count_who_visited_me > 0:
-                cls(meta).notify_visits_summary()
+        cls.bulk_notify(NotificationTemplate.VISITS_SUMMARY)
 
     def notify_visits_summary(self) -> None:
         """
@@ -259,11 +262,7 @@ class NotificationService:
         """
         Send notifications for setting transfer requests.
         """
-        for meta in cls.get_queryset().filter(
-            _profile_class__in=["coachprofile", "clubprofile", "managerprofile"]
-        ):
-            if not hasattr(meta, "transfer_request"):
-                cls(meta).notify_set_transfer_requests()
+        cls.bulk_notify(NotificationTemplate.SET_TRANSFER_REQUESTS)
 
     def notify_set_transfer_requests(self) -> None:
         """
@@ -279,9 +278,7 @@ class NotificationService:
         """
         Send notifications for setting status.
         """
-        for meta in cls.get_queryset().filter(_profile_class="playerprofile"):
-            if not hasattr(meta, "transfer_status"):
-                cls(meta).notify_set_status()
+        cls.bulk_notify(NotificationTemplate.SET_STATUS)
 
     def notify_set_status(self) -> None:
         """
@@ -297,8 +294,7 @@ class NotificationService:
         """
         Send notifications for inviting friends.
         """
-        for meta in cls.get_queryset():
-            cls(meta).notify_invite_friends()
+        cls.bulk_notify(NotificationTemplate.INVITE_FRIENDS)
 
     def notify_invite_friends(self) -> None:
         """
@@ -314,9 +310,7 @@ class NotificationService:
         """
         Send notifications for adding links.
         """
-        for meta in cls.get_queryset():
-            if meta.profile.external_links.links.count() == 0:
-                cls(meta).notify_add_links()
+        cls.bulk_notify(NotificationTemplate.ADD_LINKS)
 
     def notify_add_links(self) -> None:
         """
@@ -332,9 +326,7 @@ class NotificationService:
         """
         Send notifications for adding videos.
         """
-        for meta in cls.get_queryset().filter(_profile_class="playerprofile"):
-            if meta.user.user_video.count() == 0:
-                cls(meta).notify_add_video()
+        cls.bulk_notify(NotificationTemplate.ADD_VIDEO)
 
     def notify_add_video(self) -> None:
         """
@@ -359,17 +351,14 @@ class NotificationService:
         """
         Test notification.
         """
-        for meta in cls.get_queryset().filter(user__is_staff=True):
-            cls(meta).notify_test()
+        cls.bulk_notify(NotificationTemplate.TEST)
 
     @classmethod
     def bulk_notify_assign_club(cls) -> None:
         """
         Send notifications for assigning clubs.
         """
-        for meta in cls.get_queryset():
-            if not meta.profile.team_history_object:
-                cls(meta).notify_assign_club()
+        cls.bulk_notify(NotificationTemplate.ASSIGN_CLUB)
 
     def notify_assign_club(self) -> None:
         """
@@ -411,8 +400,7 @@ class NotificationService:
         """
         Send notifications for email confirmation.
         """
-        for meta in cls.get_queryset(user__is_email_verified=False):
-            cls(meta).notify_confirm_email()
+        cls.bulk_notify(NotificationTemplate.CONFIRM_EMAIL)
 
     def bind_all_reccurrent_notifications(self) -> None:
         """
@@ -2,12 +2,12 @@
 Module containing Celery tasks for notifications in PlayMaker.
 """
 
-import os
+import time
+import typing
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
-from django.conf import settings
-from django.core.files import File
+from django.utils import timezone
 
 from notifications.models import Notification
 
@@ -20,21 +20,10 @@ def create_notification(
 ) -> None:
     """
     Create notification for profile based on provided kwargs.
-    If picture path is provided, it will be used to set the picture field.
+    If picture_user_id is provided, notification shows the current picture
+    of that user, so there is no need to copy the picture file.
     If the notification already exists, it will be refreshed.
     """
-
-    if picture_path := kwargs.get("picture", None):
-        full_path = os.path.join(settings.MEDIA_URL, picture_path).split(
-            settings.BASE_DIR
-        )[-1]
-        try:
-            with open(full_path, "rb") as file:
-                picture = File(file)
-                kwargs["picture"] = picture
-        except FileNotFoundError:
-            pass
-
     profile_meta_id = kwargs.pop("profile_meta_id")
     title = kwargs.pop("title")
     description = kwargs.pop("description")
@@ -58,4 +47,61 @@ def create_notification(
         # Update existing notification with new template data
         notification.template_name = template_name
         notification.template_params = template_params
+        notification.picture_user_id = kwargs.get("picture_user_id")
+        notification.picture_profile_role = kwargs.get("picture_profile_role")
         notification.refresh()
+
+
+@shared_task
+def create_notifications(
+    targets: typing.List[typing.Tuple[int, typing.Optional[dict]]],
+    body: dict,
+) -> None:
+    """
+    Create the same notification for many profiles at once (bulk fan-out).
+    `targets` are pairs of profile meta id and its own template params
+    (merged into body's template params).
+    As in `create_notification`, existing notifications are refreshed.
+    """
+    started = time.monotonic()
+    body = dict(body)
+    lookup = {key: body.pop(key) for key in ("title", "description", "href")}
+    common_params = body.pop("template_params", None)
+    params = {
+        target_id: {**(common_params or {}), **target_params}
+        if target_params
+        else common_params
+        for target_id, target_params in targets
+    }
+    now = timezone.now()
+
+    existing = list(Notification.objects.filter(target_id__in=params, **lookup))
+    for notification in existing:
+        notification.template_name = body["template_name"]
+        notification.template_params = params[notification.target_id]
+        notification.seen = False
+        notification.created_at = notification.updated_at = now
+    Notification.objects.bulk_update(
+        existing,
+        ["template_name", "template_params", "seen", "created_at", "updated_at"],
+        batch_size=500,
+    )
+
+    refreshed = {notification.target_id for notification in existing}
+    created = Notification.objects.bulk_create(
+        [
+            Notification(
+                target_id=target_id,
+                template_params=target_params,
+                **lookup,
+                **body,
+            )
+            for target_id, target_params in params.items()
+            if target_id not in refreshed
+        ],
+        batch_size=500,
+    )
+    logger.info(
+        f"{body['template_name']}: {len(created)} notifications created, "
+        f"{len(existing)} refreshed in {time.monotonic() - started:.2f}s"
+    )
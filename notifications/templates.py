@@ -17,7 +17,7 @@ class NotificationBody:
     href: str
     template_name: Optional[str] = None
     icon: Optional[str] = None
-    picture: Optional[str] = None
+    picture_user_id: Optional[int] = None
     picture_profile_role: Optional[str] = None
 
     kwargs: Dict[str, str] = field(default_factory=dict)
@@ -46,7 +46,7 @@ class NotificationBody:
             "template_name": self.template_name,
             "template_params": self.kwargs,  # Store parameters separately
             "icon": self.icon,
-            "picture": self.picture,
+            "picture_user_id": self.picture_user_id,
             "picture_profile_role": self.picture_profile_role,
         }
         return result
@@ -1,6 +1,8 @@
 from io import StringIO
 
 import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.core.management import call_command
 
 from notifications.models import Notification
@@ -172,3 +174,53 @@ class TestSendCustomNotificationCommand:
             f"\nSUCCESS: {expected_count}, FAILED: 0, TOTAL: {expected_count}\n"
         )
         assert Notification.objects.filter(**query_data).count() == expected_count
+
+
+class TestDeduplicateNotificationPicturesCommand:
+    """Test suite for deduplicate_notification_pictures management command."""
+
+    @pytest.fixture
+    def pictures(self):
+        """User's picture and its copy created for a notification."""
+        content = ContentFile(b"fake image data")
+        original = default_storage.save("profile_pics/test/avatar.jpg", content)
+        copy = default_storage.save(original, content)
+        yield original, copy
+        for name in (original, copy):
+            default_storage.delete(name)
+
+    def test_run_command(self, pictures):
+        original, copy = pictures
+        user = PlayerProfileFactory(user__picture=original).user
+        notification = Notification.objects.create(
+            target=user.profile.meta,
+            title="title",
+            description="description",
+            href="/",
+            picture=copy,
+        )
+
+        call_command("deduplicate_notification_pictures", stdout=StringIO())
+
+        notification.refresh_from_db()
+        assert notification.picture_user == user
+        assert not notification.picture
+        assert notification.get_picture().name == original
+        assert default_storage.exists(original)
+        assert not default_storage.exists(copy)
+
+    def test_dry_run(self, pictures):
+        original, copy = pictures
+        PlayerProfileFactory(user__picture=original)
+        notification = Notification.objects.create(
+            title="title", description="description", href="/", picture=copy
+        )
+
+        call_command(
+            "deduplicate_notification_pictures", "--dry-run", stdout=StringIO()
+        )
+
+        notification.refresh_from_db()
+        assert notification.picture == copy
+        assert notification.picture_user is None
+        assert default_storage.exists(copy)
@@ -1,9 +1,6 @@
-import os
-from tempfile import NamedTemporaryFile
 from unittest.mock import patch
 
 import pytest
-from django.conf import settings
 from django.utils import timezone
 
 from followers.services import FollowService
@@ -202,6 +199,43 @@ class TestNotifications:
             icon="eye",
         ).exists()
 
+    def test_bulk_notify_refreshes_existing_notifications(
+        self, player_profile, coach_profile
+    ) -> None:
+        """
+        Bulk fan-out refreshes existing notifications instead of duplicating them.
+        """
+        NotificationService.bulk_notify_pm_rank()
+        Notification.objects.filter(title="Ranking PM").update(seen=True)
+
+        NotificationService.bulk_notify_pm_rank()
+
+        notifications = Notification.objects.filter(title="Ranking PM")
+        assert notifications.filter(target=player_profile.meta).count() == 1
+        assert notifications.filter(target=coach_profile.meta).count() == 1
+        assert not notifications.filter(seen=True).exists()
+        assert set(notifications.values_list("template_name", flat=True)) == {"PM_RANK"}
+
+    def test_bulk_notify_visits_summary_params(
+        self, player_profile, coach_profile, guest_profile
+    ) -> None:
+        """
+        Per profile template params are stored by the bulk fan-out.
+        """
+        ProfileVisitation.upsert(coach_profile, player_profile)
+        ProfileVisitation.upsert(guest_profile, player_profile)
+        ProfileVisitation.upsert(player_profile, guest_profile)
+
+        NotificationService.bulk_notify_visits_summary()
+
+        notifications = Notification.objects.filter(template_name="VISITS_SUMMARY")
+        assert notifications.get(target=player_profile.meta).template_params == {
+            "visited_by_count": 2
+        }
+        assert notifications.get(target=guest_profile.meta).template_params == {
+            "visited_by_count": 1
+        }
+
     def test_notify_welcome(self, player_profile):
         """
         Test the notify_welcome function.
@@ -484,6 +518,21 @@ class TestNotifications:
             icon="inquiry",
         ).exists()
 
+    def test_new_inquiry_shows_sender_picture(self, player_profile, coach_profile):
+        """
+        Test that inquiry notification shows the picture of the sender.
+        """
+        InquiryRequest.objects.create(
+            sender=coach_profile.user, recipient=player_profile.user
+        )
+
+        notification = Notification.objects.get(
+            target=player_profile.meta, icon="inquiry"
+        )
+        assert notification.picture_user == coach_profile.user
+        assert notification.picture_profile_role == coach_profile.user.declared_role
+        assert "picture" not in notification.template_params
+
     def test_notify_profile_verified(self, player_profile):
         """
         Test the notify_profile_verified function.
@@ -523,29 +572,27 @@ class TestNotifications:
 
     def test_notification_with_picture(self, player_profile):
         """
-        Test that notification with picture is created correctly.
-        """
-        with NamedTemporaryFile(dir=settings.MEDIA_ROOT, suffix=".jpg") as temp_file:
-            temp_file.write(b"fake image data")
-            temp_file.flush()
-            picture_filename = os.path.basename(temp_file.name)
-            body = {
-                "title": "Test Notification",
-                "description": "This is a test notification with a picture.",
-                "href": "/test",
-                "icon": "test-icon",
-                "picture": picture_filename,
-                "picture_profile_role": "P",
-            }
-            NotificationService(player_profile.meta).create_notification(
-                NotificationBody(**body)
-            )
-
-            notification = Notification.objects.filter(
-                title=body["title"],
-            ).first()
-
-            assert notification is not None
-            assert notification.icon == "test-icon"
-            assert notification.picture == picture_filename
-            assert notification.picture_profile_role == "P"
+        Test that notification shows the current picture of its picture user.
+        """
+        body = {
+            "title": "Test Notification",
+            "description": "This is a test notification with a picture.",
+            "href": "/test",
+            "icon": "test-icon",
+            "picture_user_id": player_profile.user.pk,
+            "picture_profile_role": "P",
+        }
+        NotificationService(player_profile.meta).create_notification(
+            NotificationBody(**body)
+        )
+
+        notification = Notification.objects.filter(
+            title=body["title"],
+        ).first()
+
+        assert notification is not None
+        assert notification.icon == "test-icon"
+        assert notification.picture_user == player_profile.user
+        assert not notification.picture
+        assert notification.get_picture() == (player_profile.user.picture or None)
+        assert notification.picture_profile_role == "P"
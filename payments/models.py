@@ -51,7 +51,11 @@ class Transaction(models.Model):
     )
     def success(self) -> None:
         """Set transaction status as SUCCESS"""
+        from premium.snapshot import invalidate_premium_products
+
         self.product.apply_product_for_transaction(self)
+        if profile := self.user.profile:
+            invalidate_premium_products(profile.premium_products_id)
         _logger.info(
             f"Transaction {self.uuid} for user ID={self.user.pk} has been approved."
         )
@@ -9,6 +9,7 @@ from django.db import models
 from django.utils import timezone
 
 from payments.models import Transaction
+from premium.snapshot import invalidate_premium_products
 from premium.tasks import premium_expired
 from premium.utils import get_date_days_after
 
@@ -354,6 +355,8 @@ class PremiumProduct(models.Model):
                 product=self
             )
 
+        invalidate_premium_products(self.pk)
+
     def save(self, *args, **kwargs):
         if not self.user:
             self.user = self.profile.user
@@ -1,8 +1,11 @@
+from celery.signals import task_postrun, task_prerun
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from inquiries.tasks import notify_limit_reached
-from premium import models
+from premium import models, snapshot
+from roles import definitions
+from utils.cache import invalidate_cache_tags, role_tag
 
 
 @receiver(post_save, sender=models.PremiumInquiriesProduct)
@@ -19,3 +22,30 @@ def post_save_premium_inquiries_product(sender, instance, created, **kwargs):
         ):
             notify_limit_reached.delay(instance.user_inquiry.pk)
 
+
+@receiver(post_save, sender=models.PromoteProfileProduct)
+def post_save_promote_profile_product(sender, instance, **kwargs):
+    """
+    Promoted profiles are listed first, invalidate cached listings of the role.
+    """
+    if profile := instance.product.profile:
+        invalidate_cache_tags(
+            role_tag(definitions.PROFILE_TYPE_SHORT_MAP[profile.PROFILE_TYPE])
+        )
+
+
+_task_snapshot_tokens = {}
+
+
+@task_prerun.connect
+def open_task_premium_snapshot_scope(task_id=None, **kwargs):
+    """
+    Each celery task works on its own premium products snapshot.
+    """
+    _task_snapshot_tokens[task_id] = snapshot.open_scope()
+
+
+@task_postrun.connect
+def close_task_premium_snapshot_scope(task_id=None, **kwargs):
+    if (token := _task_snapshot_tokens.pop(task_id, None)) is not None:
+        snapshot.close_scope(token)
@@ -0,0 +1,95 @@
+"""
+Request/task scoped snapshot of premium products state.
+
+Every `BaseProfile.products` access used to reload the profile and its
+premium products from the database. Within an active scope (HTTP request or
+Celery task) each `PremiumProduct` is loaded once, together with its premium,
+promotion and inquiries rows, and reused until it is explicitly invalidated.
+Outside a scope every access loads a fresh snapshot.
+"""
+import typing
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+if typing.TYPE_CHECKING:
+    from premium.models import PremiumProduct
+
+
+class _SnapshotStore(dict):
+    """Premium products loaded within a scope, keyed by their pk."""
+
+    def __init__(self, parent: typing.Optional["_SnapshotStore"] = None) -> None:
+        super().__init__()
+        self.parent = parent
+
+
+_snapshots: ContextVar[typing.Optional[_SnapshotStore]] = ContextVar(
+    "premium_snapshots", default=None
+)
+
+
+def _load_products(product_ids: typing.Iterable[int]) -> dict:
+    """Load premium products with all premium sub-products in one query."""
+    from premium.models import PremiumProduct
+
+    return PremiumProduct.objects.select_related(
+        "premium", "promotion", "inquiries"
+    ).in_bulk(list(product_ids))
+
+
+def open_scope() -> Token:
+    """Open a new scope in which premium products are loaded only once."""
+    return _snapshots.set(_SnapshotStore(parent=_snapshots.get()))
+
+
+def close_scope(token: Token) -> None:
+    """Close the scope opened with given token."""
+    _snapshots.reset(token)
+
+
+@contextmanager
+def premium_snapshot_scope():
+    token = open_scope()
+    try:
+        yield
+    finally:
+        close_scope(token)
+
+
+def get_premium_products(product_id: int) -> typing.Optional["PremiumProduct"]:
+    """Get premium products snapshot, load it if it is not known yet."""
+    store = _snapshots.get()
+    if store is not None and product_id in store:
+        return store[product_id]
+
+    product = _load_products([product_id]).get(product_id)
+    if store is not None:
+        store[product_id] = product
+    return product
+
+
+def prefetch_premium_products(profiles: typing.Iterable) -> None:
+    """Load premium products of given profiles in bulk within current scope."""
+    store = _snapshots.get()
+    if store is None:
+        return
+
+    product_ids = {
+        profile.premium_products_id
+        for profile in profiles
+        if profile is not None and profile.premium_products_id is not None
+    } - store.keys()
+    if product_ids:
+        loaded = _load_products(product_ids)
+        store.update({pk: loaded.get(pk) for pk in product_ids})
+
+
+def invalidate_premium_products(product_id: typing.Optional[int]) -> None:
+    """
+    Drop premium products snapshot, so next access reads fresh state.
+    Enclosing scopes are invalidated as well, e.g. request running eager task.
+    """
+    store = _snapshots.get()
+    while store is not None:
+        store.pop(product_id, None)
+        store = store.parent
@@ -0,0 +1,64 @@
+import pytest
+
+from premium.models import PremiumType
+from premium.snapshot import (
+    get_premium_products,
+    invalidate_premium_products,
+    premium_snapshot_scope,
+    prefetch_premium_products,
+)
+from utils.factories import PlayerProfileFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestPremiumSnapshot:
+    def test_products_loaded_once_within_scope(
+        self, player_profile, django_assert_num_queries
+    ):
+        with premium_snapshot_scope():
+            with django_assert_num_queries(1):
+                assert not player_profile.is_premium
+                assert not player_profile.is_promoted
+                assert not player_profile.has_premium_inquiries
+                assert player_profile.premium is None
+                assert player_profile.promotion is None
+
+    def test_products_fresh_outside_scope(self, player_profile):
+        assert not player_profile.is_premium
+
+        player_profile.setup_premium_profile(PremiumType.TRIAL)
+
+        assert player_profile.is_premium
+        assert player_profile.is_promoted
+        assert player_profile.has_premium_inquiries
+
+    def test_setup_premium_invalidates_snapshot(self, player_profile):
+        with premium_snapshot_scope():
+            assert not player_profile.is_premium
+
+            player_profile.setup_premium_profile(PremiumType.TRIAL)
+
+            assert player_profile.is_premium
+            assert player_profile.premium_already_tested
+
+    def test_invalidate_premium_products(self, player_profile):
+        product_id = player_profile.premium_products_id
+
+        with premium_snapshot_scope():
+            first = get_premium_products(product_id)
+            assert get_premium_products(product_id) is first
+
+            invalidate_premium_products(product_id)
+
+            assert get_premium_products(product_id) is not first
+
+    def test_prefetch_premium_products(self, django_assert_num_queries):
+        profiles = PlayerProfileFactory.create_batch(3)
+
+        with premium_snapshot_scope():
+            with django_assert_num_queries(1):
+                prefetch_premium_products(profiles)
+            with django_assert_num_queries(0):
+                assert not any(profile.is_premium for profile in profiles)
+                assert not any(profile.is_promoted for profile in profiles)
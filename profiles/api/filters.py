@@ -2,14 +2,14 @@ import typing
 from decimal import Decimal
 from typing import List
 
-from django.db.models import ExpressionWrapper, F, FloatField, QuerySet
-from django.db.models import functions as django_base_functions
+from django.db.models import QuerySet
 from django_filters import rest_framework as filters
 
 from api.filters import MultipleFilter, NumberInFilter
 from clubs.models import League
 from profiles.models import CoachProfile, PlayerProfile
 from transfers.models import ProfileTransferRequest
+from utils.geo import filter_within_radius
 
 
 class TransferRequestCatalogueFilter(filters.FilterSet):
@@ -51,65 +51,26 @@ class TransferRequestCatalogueFilter(filters.FilterSet):
         Filter a queryset based on proximity to a specified geolocation.
 
         This method filters the queryset to include only items that are within a
-        specified radius from a given latitude and longitude,
-        using the Haversine formula.
+        specified radius from a given latitude and longitude. Stadium addresses are
+        prefiltered with bounding box, exact distance uses the Haversine formula.
         """
 
         latitude = self.data.get("latitude")
         longitude = self.data.get("longitude")
-        radius = self.data.get("radius", 1)  # Default radius of 1 kilometer
+        # Use a default radius of 1 kilometer if not provided
+        radius = Decimal(self.data.get("radius") or 1)
 
         # Proceed only if latitude and longitude are provided
         if latitude and longitude:
-            latitude = Decimal(latitude)
-            longitude = Decimal(longitude)
-            radius = Decimal(radius)
-            earth_radius = 6371  # Earth's radius in kilometers
-
-            # Use a default radius if not provided
-            default_radius = 1  # Default radius in kilometers
-            radius = Decimal(radius) if radius else default_radius
-
-            return (
-                queryset.annotate(
-                    distance=ExpressionWrapper(
-                        earth_radius
-                        * django_base_functions.ACos(
-                            django_base_functions.Cos(
-                                django_base_functions.Radians(latitude)
-                            )
-                            * django_base_functions.Cos(
-                                django_base_functions.Radians(
-                                    F(
-                                        "requesting_team__team_history__club__stadion_address__latitude"  # noqa 501
-                                    )
-                                )
-                            )
-                            * django_base_functions.Cos(
-                                django_base_functions.Radians(
-                                    F(
-                                        "requesting_team__team_history__club__stadion_address__longitude"  # noqa 501
-                                    )
-                                )
-                                - django_base_functions.Radians(longitude)
-                            )
-                            + django_base_functions.Sin(
-                                django_base_functions.Radians(latitude)
-                            )
-                            * django_base_functions.Sin(
-                                django_base_functions.Radians(
-                                    F(
-                                        "requesting_team__team_history__club__stadion_address__latitude"  # noqa 501
-                                    )
-                                )
-                            )
-                        ),
-                        output_field=FloatField(),
-                    )
-                )
-                .filter(distance__lt=radius)
-                .distinct()
-            )
+            stadion_address = "requesting_team__team_history__club__stadion_address"
+            return filter_within_radius(
+                queryset,
+                Decimal(latitude),
+                Decimal(longitude),
+                radius,
+                latitude_field=f"{stadion_address}__latitude",
+                longitude_field=f"{stadion_address}__longitude",
+            ).distinct()
         return queryset
 
     def filter_by_league_ids(
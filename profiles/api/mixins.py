@@ -2,14 +2,12 @@ import logging
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
-from django.utils import timezone
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from profiles import models
 from profiles.api.errors import InvalidProfileRole, ProfileDoesNotExist
-from profiles.errors import ProfileVisitHistoryDoesNotExistException
 from profiles.services import ProfileService, ProfileVisitHistoryService
 
 User = get_user_model()
@@ -84,15 +82,9 @@ class ProfileRetrieveMixin:
             logger.info(f"Skipping visit tracking for anonymous profile: {requestor}")
             return
 
-        try:
-            history = visit_history_service.get_user_profile_visit_history(
-                user=profile_object.user, created_at=timezone.now()
-            )
-            visit_history_service.increment(instance=history, requestor=requestor)
-        except ProfileVisitHistoryDoesNotExistException:
-            logger.info("Profile visit history does not exist. Creating one..")
-            history = visit_history_service.create(user=profile_object.user)
-            visit_history_service.increment(instance=history, requestor=requestor)
+        visit_history_service.register_visit(
+            user=profile_object.user, requestor=requestor
+        )
 
         if (
             not isinstance(requestor, AnonymousUser)
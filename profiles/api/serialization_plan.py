@@ -0,0 +1,94 @@
+"""
+Compiled serialization of plain profile attributes for ProfileSerializer.
+
+A plan lists attributes to serialize with converters resolved upfront:
+enum fields get label maps of their choices, other values are converted
+by type (values of basic types are returned as they are).
+Plans are built once per (model, attribute names) pair.
+"""
+
+import functools
+import typing
+
+from django.db.models import Model
+from django.utils.translation import gettext as _
+
+from api.serializers import ProfileEnumChoicesSerializer
+from profiles.api import consts
+
+Converter = typing.Callable[[typing.Any], typing.Any]
+
+
+def _identity(value):
+    return value
+
+
+# same output as fields of TYPE_TO_SERIALIZER_MAPPING, without field calls
+TYPE_TO_REPRESENTATION: typing.Dict[type, Converter] = {
+    type_: field.to_representation
+    for type_, field in consts.TYPE_TO_SERIALIZER_MAPPING.items()
+}
+TYPE_TO_REPRESENTATION.update(
+    {type_: _identity for type_ in (int, float, bool, str, type(None))}
+)
+
+
+def compile_enum(model: typing.Type[Model], field_name: str) -> Converter:
+    """Converter of enum field to {"id": ..., "name": ...} of its choice"""
+
+    def serialize_with_field(value) -> dict:
+        return ProfileEnumChoicesSerializer(
+            required=False, model=model, source=field_name
+        ).to_representation(value)
+
+    try:
+        choices = getattr(model, field_name).__dict__["field"].choices
+        labels = {str(key): label for key, label in choices}
+    except (AttributeError, KeyError, TypeError):
+        return serialize_with_field
+
+    def serialize(value) -> dict:
+        value = str(value)
+        if value not in labels:
+            # raises the same error as serializer field would
+            return serialize_with_field(value)
+        label = labels[value]
+        return {"id": value, "name": _(str(label)) if label else ""}
+
+    return serialize
+
+
+class SerializationPlan(typing.NamedTuple):
+    # (attribute name, converter of enum or None)
+    fields: typing.Tuple[typing.Tuple[str, typing.Optional[Converter]], ...]
+
+    def serialize(self, obj, ret: dict) -> dict:
+        """Put serialized attributes of obj into ret"""
+        type_to_representation = TYPE_TO_REPRESENTATION
+        for field_name, enum in self.fields:
+            value = getattr(obj, field_name)
+            if enum is not None and value:
+                ret[field_name] = enum(value)
+            else:
+                ret[field_name] = type_to_representation.get(type(value), str)(value)
+        return ret
+
+
+@functools.lru_cache(maxsize=256)
+def get_serialization_plan(
+    model: typing.Type[Model],
+    field_names: typing.Tuple[str, ...],
+    enums: typing.Tuple[str, ...] = (),
+    exclude: typing.Tuple[str, ...] = (),
+) -> SerializationPlan:
+    """Plan serializing given attributes of model instances"""
+    return SerializationPlan(
+        tuple(
+            (
+                field_name,
+                compile_enum(model, field_name) if field_name in enums else None,
+            )
+            for field_name in field_names
+            if not field_name.startswith("_") and field_name not in exclude
+        )
+    )
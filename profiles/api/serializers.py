@@ -24,6 +24,7 @@ from labels.services import LabelService
 from profiles import errors, models, services
 from profiles.api import consts
 from profiles.api import errors as api_errors
+from profiles.api.serialization_plan import get_serialization_plan
 from profiles.services import ProfileVideoService
 from roles.definitions import CLUB_ROLES, GUEST_SHORT, PROFILE_TYPE_SHORT_MAP
 from users.models import UserPreferences
@@ -979,28 +980,16 @@ class ProfileSerializer(serializers.Serializer):
 
         obj = obj or self.instance
         ret = super().to_representation(obj)
-        fields: list[str] = self.serialize_fields or obj.__dict__.keys()
-
-        for field_name in fields:
-            if field_name.startswith("_"):
-                continue
-
-            field_value = getattr(obj, field_name)
-
-            if field_name in self.enums and field_value:
-                serializer_field = ProfileEnumChoicesSerializer(
-                    required=False,
-                    model=self.model,
-                    source=field_name,
-                )
-            else:
-                serializer_field: serializers.Field = self.get_serializer_field(
-                    field_value
-                )
-            ret[field_name] = serializer_field.to_representation(field_value)
+        plan = get_serialization_plan(
+            type(obj),
+            tuple(self.serialize_fields or obj.__dict__),
+            self.enums,
+            self.exclude_fields,
+        )
+        plan.serialize(obj, ret)
 
-            if not isinstance(obj, models.PlayerProfile):
-                ret.pop("player_stats", None)
+        if not isinstance(obj, models.PlayerProfile):
+            ret.pop("player_stats", None)
 
         for field_name in self.exclude_fields:
             ret.pop(field_name, None)
@@ -1011,25 +1000,17 @@ class ProfileSerializer(serializers.Serializer):
             "team_history_object" in ret
             and hasattr(obj, "team_object")
             and obj.team_object
-        ):
-            team_history_serializer_context = {
-                "request": self.context.get("request"),
-                "profile_uuid": obj.uuid,
-            }
-
             # Check if there is a primary team contributor for the team history
-            primary_contributor = obj.team_object.teamcontributor_set.filter(
-                is_primary=True, profile_uuid=obj.uuid
-            ).first()
-
-            if primary_contributor:
-                team_history_serializer = self.TeamHistoryBaseProfileSerializer(
-                    obj.team_object,
-                    context=team_history_serializer_context,
-                )
-                ret["team_history_object"] = team_history_serializer.data
-            else:
-                ret["team_history_object"] = None
+            and services.TeamContributorService.has_primary_contribution(obj)
+        ):
+            team_history_serializer = self.TeamHistoryBaseProfileSerializer(
+                obj.team_object,
+                context={
+                    "request": self.context.get("request"),
+                    "profile_uuid": obj.uuid,
+                },
+            )
+            ret["team_history_object"] = team_history_serializer.data
         else:
             ret["team_history_object"] = None
 
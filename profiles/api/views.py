@@ -4,17 +4,15 @@ import uuid
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import ValidationError
 from django.db.models import (
-    Case,
-    Count,
-    IntegerField,
     ObjectDoesNotExist,
     QuerySet,
-    When,
 )
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from rest_framework import exceptions, status
 from rest_framework.permissions import AllowAny, IsAuthenticatedOrReadOnly
@@ -32,7 +30,8 @@ from backend.settings import cfg
 from external_links import serializers as external_links_serializers
 from external_links.errors import LinkSourceNotFound, LinkSourceNotFoundServiceException
 from external_links.services import ExternalLinksService
-from labels.utils import fetch_all_labels
+from labels.utils import fetch_all_labels, prefetch_labels
+from premium.snapshot import prefetch_premium_products
 from profiles import errors, models
 from profiles.api import errors as api_errors
 from profiles.api import serializers
@@ -40,6 +39,7 @@ from profiles.api.managers import SerializersManager
 from profiles.api.mixins import ProfileRetrieveMixin
 from profiles.filters import ProfileListAPIFilter
 from profiles.models import PROFILE_MODEL_MAP, ProfileMeta
+from profiles.serializers_detailed.base_serializers import BaseProfileSerializer
 from profiles.services import (
     ProfileFilterService,
     ProfileService,
@@ -56,6 +56,7 @@ from users.api.serializers import (
 )
 from users.errors import UserPreferencesDoesNotExistHTTPException
 from utils.cache import CachedResponse
+from utils.reference_data import reference_data
 
 if TYPE_CHECKING:
     pass
@@ -165,10 +166,15 @@ class ProfileAPI(ProfileListAPIFilter, EndpointView, ProfileRetrieveMixin):
         Full list of choices can be found in roles/definitions.py
         """
         with CachedResponse(
-            f"{cfg.redis.key_prefix.list_profiles}:{request.get_full_path()}", request
+            f"{cfg.redis.key_prefix.list_profiles}:{self.get_list_cache_key()}",
+            request,
+            tags=self.get_cache_tags(),
+            single_flight=True,
+            # refresh task replays the request anonymously (with guest's seed)
+            stale_while_revalidate=not self.is_list_cached_per_user(),
         ) as cache:
-            if cached_data := cache.data:
-                return Response(cached_data)
+            if cached_response := cache.response:
+                return cached_response
 
             qs: QuerySet = self.get_queryset()
             serializer_class = self.get_serializer_class(
@@ -178,6 +184,12 @@ class ProfileAPI(ProfileListAPIFilter, EndpointView, ProfileRetrieveMixin):
                 serializer_class = serializers.ProfileSerializer
 
             paginated_query = self.paginate_queryset(qs)
+            prefetch_premium_products(paginated_query)
+            prefetch_labels(paginated_query, label_context="base")
+            visit_history_service.prefetch_visit_summaries(paginated_query)
+            TeamContributorService.prefetch_primary_contributions(paginated_query)
+            if issubclass(serializer_class, BaseProfileSerializer):
+                serializer_class.prefetch(paginated_query)
 
             # Get I18n-aware context from the mixin
             context = self.get_serializer_context()
@@ -241,33 +253,24 @@ class ProfileAPI(ProfileListAPIFilter, EndpointView, ProfileRetrieveMixin):
         """
         Retrieve the count of profiles matching the specified filter criteria.
 
-        This method processes a GET request containing various filter parameters
-        and returns the count of profiles that match these filters, without
-        actually fetching or returning the profile data. It's useful for getting
-        a quick overview of how many profiles meet certain criteria before
-        fetching the detailed data.
-
-        The method works by extracting query parameters from the request,
-        applying these filters to the queryset using ProfileListAPIFilter, and
-        then counting the number of profiles in the filtered queryset.
+        Profiles are counted on the database side (COUNT(DISTINCT id), without
+        sorting), result is cached per normalized filter set. For very broad
+        filters the count is estimated and marked as approximate.
         """
-        # Extract and format query parameters
-        query_params = {
-            key: request.query_params.get(key) for key in request.query_params
-        }
-
-        # Instantiate ProfileListAPIFilter with formatted query parameters
-        filter_service = ProfileListAPIFilter()
-        filter_service.request = request
-        filter_service.query_params = query_params  # Set the formatted query parameters
-
-        # Apply the filters and get the filtered queryset
-        filtered_queryset = filter_service.get_queryset()
-
-        # Get the count of the filtered queryset
-        count = len(filtered_queryset)
+        with CachedResponse(
+            f"{cfg.redis.key_prefix.profiles_count}:{self.get_count_cache_key()}",
+            request,
+            tags=self.get_cache_tags(),
+            single_flight=True,
+        ) as cache:
+            if cached_response := cache.response:
+                return cached_response
 
-        return Response({"count": count})
+            count, approximate = self.service.count_profiles(
+                self.get_count_queryset(), settings.APPROXIMATE_PROFILE_COUNT_FROM
+            )
+            cache.data = {"count": count, "approximate": approximate}
+            return Response({"count": count, "approximate": approximate})
 
     def update_profile_contact(
         self, request: Request, profile_uuid: uuid.UUID
@@ -348,6 +351,7 @@ class ProfileAPI(ProfileListAPIFilter, EndpointView, ProfileRetrieveMixin):
 
 
 class MixinProfilesFilter(ProfileListAPIFilter):
+    SEARCH_DOCUMENT = "search_document"  # of filtered ProfileMeta
     PARAMS_PARSERS = {
         "latitude": api_utils.convert_float,
         "longitude": api_utils.convert_float,
@@ -385,7 +389,7 @@ class PopularProfilesAPIView(MixinProfilesFilter, EndpointView):
 
     def get_queryset(self) -> QuerySet:
         self.queryset = ProfileMeta.objects.annotate(
-            visitors_count=Count("visited_objects")
+            visitors_count=Coalesce("visit_summary__visitors", 0)
         ).order_by("-visitors_count")
         self.filter_queryset()
         return self.queryset.distinct()
@@ -408,13 +412,15 @@ class PopularProfilesAPIView(MixinProfilesFilter, EndpointView):
         with CachedResponse(
             cache_key=f"{cfg.redis.key_prefix.popular_profiles}:{request.get_full_path()}",
             request=request,
+            tags=self.get_cache_tags(),
         ) as cache:
-            if cached_data := cache.data:
-                return Response(cached_data)
+            if cached_response := cache.response:
+                return cached_response
 
             qs = self.get_queryset()
             qs = self.paginate_queryset(qs)
             qs = [obj.profile for obj in qs]
+            prefetch_premium_products(qs)
             context = self.get_serializer_context()
             serializer = serializers.GenericProfileSerializer(
                 qs, many=True, context=context
@@ -451,18 +457,10 @@ class SuggestedProfilesAPIView(EndpointView):
         profile = user.profile
         params = {"user__last_activity__gte": timezone.now() - timedelta(days=30)}
 
-        ordering = None
-        if loc := user.userpreferences.localization:
+        loc = user.userpreferences.localization
+        if loc:
             cities_nearby = profile_service.get_cities_nearby(loc)
             params["user__userpreferences__localization__in"] = cities_nearby
-            city_id_order = list(cities_nearby.values_list("id", flat=True))
-            ordering = Case(
-                *[
-                    When(user__userpreferences__localization__pk=cid, then=pos)
-                    for pos, cid in enumerate(city_id_order)
-                ],
-                output_field=IntegerField(),
-            )
 
         if profile.__class__ is models.PlayerProfile:
             qs_model = random.choice(
@@ -479,9 +477,9 @@ class SuggestedProfilesAPIView(EndpointView):
             **params,
         ).exclude(user__pk=user.pk)
 
-        if ordering:
-            qs = qs.annotate(city_order=ordering).order_by(
-                "city_order", "-user__last_activity"
+        if loc:
+            qs = profile_service.annotate_city_distance(qs, loc).order_by(
+                "city_distance", "-user__last_activity"
             )
         else:
             qs = qs.order_by("-user__last_activity")
@@ -517,31 +515,25 @@ class ProfilesNearbyAPIView(MixinProfilesFilter, EndpointView):
         ):
             return Response(status=status.HTTP_204_NO_CONTENT)
         with CachedResponse(
-            cache_key=f"user:{user.id}:{cfg.redis.key_prefix.profiles_nearby}:{request.get_full_path()}",
+            cache_key=f"{cfg.redis.key_prefix.profiles_nearby}:user:{user.id}:{request.get_full_path()}",
             request=request,
+            tags=self.get_cache_tags(),
         ) as cache:
-            if cached_data := cache.data:
-                return Response(cached_data)
+            if cached_response := cache.response:
+                return cached_response
 
-            cities_nearby = profile_service.get_cities_nearby(
-                user.userpreferences.localization
-            )
-            city_id_order = list(cities_nearby.values_list("id", flat=True))
-            ordering = Case(
-                *[
-                    When(user__userpreferences__localization__pk=cid, then=pos)
-                    for pos, cid in enumerate(city_id_order)
-                ],
-                output_field=IntegerField(),
-            )
+            localization = user.userpreferences.localization
+            cities_nearby = profile_service.get_cities_nearby(localization)
             self.queryset = (
-                ProfileMeta.objects.filter(
-                    user__userpreferences__localization__in=cities_nearby,
+                profile_service.annotate_city_distance(
+                    ProfileMeta.objects.filter(
+                        user__userpreferences__localization__in=cities_nearby,
+                    ),
+                    localization,
                 )
-                .annotate(city_order=ordering)
                 .exclude(user__pk=user.pk)
                 .exclude(user__display_status=User.DisplayStatus.NOT_SHOWN)
-                .order_by("city_order", "-user__last_activity")
+                .order_by("city_distance", "-user__last_activity")
             )
             qs = self.filter_queryset()
             paginated_qs = self.paginate_queryset(qs)
@@ -667,7 +659,7 @@ class PlayerPositionAPI(EndpointView):
         """
         Retrieve all player positions ordered by ID.
         """
-        positions = models.PlayerPosition.objects.all()
+        positions = reference_data.get("positions")
         context = self.get_serializer_context()
         serializer = serializers.PlayerPositionSerializer(
             positions, many=True, context=context
@@ -687,7 +679,7 @@ class CoachLicencesAPIView(EndpointView):
         """
         Return a list of coach licences choices.
         """
-        licences = models.LicenceType.objects.all()
+        licences = reference_data.get("licences")
         serializer = serializers.LicenceTypeSerializer(licences, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
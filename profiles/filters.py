@@ -1,26 +1,31 @@
 import typing
 from datetime import timedelta
 from functools import cached_property
+from urllib.parse import urlencode
 
-from django.db.models import BooleanField, Case, Count, F, QuerySet, Value, When
+from django.db.models import BooleanField, Case, F, QuerySet, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from api import errors as api_errors
 from api import utils as api_utils
 from api.errors import InvalidAPIRequestParam
 from api.filters import APIFilter
-from labels.utils import (
-    apply_label_filters,
-    get_profile_specific_ids,
-    get_user_related_ids,
-    validate_labels,
-)
+from labels.utils import validate_labels
 from profiles import models, services
 from profiles.api.errors import IncorrectProfileRole
+from utils.cache import league_tag, role_tag
 
 
 class ProfileListAPIFilter(APIFilter):
+    """
+    Filters and sorts listed profiles by their ProfileSearchDocument,
+    joined one-to-one, so listings don't need DISTINCT.
+    """
+
     service = services.ProfileFilterService()
+    # relation from filtered objects to their ProfileSearchDocument
+    SEARCH_DOCUMENT = services.ProfileFilterService.SEARCH_DOCUMENT
 
     # define other filter params requiring validation below.
     # New values will be added to self.query_params
@@ -62,6 +67,68 @@ class ProfileListAPIFilter(APIFilter):
         except ValueError:
             raise IncorrectProfileRole
 
+    # params which don't affect number of listed profiles
+    SORTING_PARAMS = ("sort", "shuffle")
+
+    def get_cache_tags(self) -> typing.List[str]:
+        """Tags of cached listing - roles and leagues covered by the listing"""
+        params = self.request.query_params
+        roles = params.getlist("role") or list(models.PROFILE_MODEL_MAP)
+        leagues = params.getlist("league") + params.getlist("transfer_status_league")
+        return [role_tag(role) for role in roles] + [
+            league_tag(league) for league in leagues
+        ]
+
+    def get_count_cache_key(self) -> str:
+        """
+        Normalized filter set, independent of params order and sorting.
+        Includes user if filters depend on them (not_me, observed).
+        """
+        self.define_query_params()
+        params = {
+            key: sorted(value) if isinstance(value, list) else value
+            for key, value in self.query_params.items()
+            if key not in self.SORTING_PARAMS
+        }
+        params["role"] = self.request.query_params.get("role")
+        if (
+            params.get("not_me") or params.get("observed")
+        ) and self.request.user.is_authenticated:
+            params["user"] = self.request.user.pk
+        return urlencode(sorted(params.items()), doseq=True)
+
+    def get_shuffle_seed(self) -> int:
+        """Seed of shuffled listing, the same for the user during the day"""
+        return services.RandomizationService.get_daily_user_seed(self.request.user)
+
+    def is_list_cached_per_user(self) -> bool:
+        """Listing shuffled for authenticated user is cached with user's seed"""
+        self.define_query_params()
+        return bool(self.query_params.get("shuffle")) and (
+            self.request.user.is_authenticated
+        )
+
+    def get_list_cache_key(self) -> str:
+        """Listing is cached per request, shuffled one also per shuffle seed"""
+        self.define_query_params()
+        key = self.request.get_full_path()
+        if self.query_params.get("shuffle"):
+            key += f":seed:{self.get_shuffle_seed()}"
+        return key
+
+    def get_listed_queryset(self) -> QuerySet:
+        """Profiles of the role listed by api, having a search document"""
+        role = models.REVERSED_MODEL_MAP[self.model]
+        return self.model.objects.to_list_by_api(
+            role=self.request.query_params.get("role")
+        ).filter(**{f"{self.SEARCH_DOCUMENT}__role": role})
+
+    def get_count_queryset(self) -> QuerySet:
+        """Filtered queryset without sorting and ordering, to be counted"""
+        self.queryset = self.get_listed_queryset()
+        self.filter_queryset(self.queryset)
+        return self.queryset.order_by()
+
     def filter_last_activity(self) -> None:
         """Filter queryset by last activity"""
         if last_activity := self.query_params.get("last_activity"):
@@ -95,7 +162,8 @@ class ProfileListAPIFilter(APIFilter):
         return qs.annotate(
             is_profile_promoted=Case(
                 When(
-                    premium_products__promotion__valid_until__gt=now, then=Value(True)
+                    **{f"{self.SEARCH_DOCUMENT}__promoted_until__gt": now},
+                    then=Value(True),
                 ),
                 default=Value(False),
                 output_field=BooleanField(),
@@ -104,53 +172,48 @@ class ProfileListAPIFilter(APIFilter):
 
     def get_queryset(self) -> typing.Union[QuerySet, typing.List]:
         """Get queryset based on role, apply filters, and handle shuffle parameter."""
-        self.queryset = self.model.objects.to_list_by_api(
-            role=self.request.query_params.get("role")
-        )
+        self.queryset = self.get_listed_queryset()
         self.filter_queryset(self.queryset)
         self.sort_queryset()
 
-        return self.queryset.distinct()
+        return self.queryset
 
     def sort_queryset(self) -> None:
         """Sort queryset based on sort parameter"""
         if sort_param := self.query_params.get("sort"):
             if self.request.query_params.get("role") == "P":
+                pm_score = F(f"{self.SEARCH_DOCUMENT}__pm_score")
                 if sort_param == "-pm_score":
                     self.queryset = self.queryset.order_by(
-                        F("playermetrics__pm_score").desc(nulls_last=True)
+                        pm_score.desc(nulls_last=True)
                     )
                 elif sort_param == "pm_score":
                     self.queryset = self.queryset.order_by(
-                        F("playermetrics__pm_score").asc(nulls_last=True)
+                        pm_score.asc(nulls_last=True)
                     )
 
             if sort_param == "popularity":
-                self.queryset = (
-                    self.queryset.annotate(
-                        popularity_count=Count("meta__visited_objects")
-                    )
-                    .order_by("popularity_count")
-                    .distinct()
-                )
+                self.queryset = self.queryset.annotate(
+                    popularity_count=Coalesce("meta__visit_summary__visitors", 0)
+                ).order_by("popularity_count")
             elif sort_param == "-popularity":
-                self.queryset = (
-                    self.queryset.annotate(
-                        popularity_count=Count("meta__visited_objects")
-                    )
-                    .order_by("-popularity_count")
-                    .distinct()
-                )
+                self.queryset = self.queryset.annotate(
+                    popularity_count=Coalesce("meta__visit_summary__visitors", 0)
+                ).order_by("-popularity_count")
         else:
             self.queryset = self.sort_promoted_first(self.queryset)
 
         if self.query_params.get("shuffle"):
-            self.queryset = self.queryset.order_by("?")
+            self.queryset = self.service.shuffle(
+                self.queryset, self.get_shuffle_seed(), self.SEARCH_DOCUMENT
+            )
 
     def filter_queryset(self, queryset: QuerySet) -> QuerySet:
         """Filter given queryset based on validated query_params"""
         self.define_query_params()
-        self.queryset = self.queryset or queryset
+        # don't evaluate queryset here (bool(queryset) fetches all the rows)
+        if getattr(self, "queryset", None) is None:
+            self.queryset = queryset
 
         if self.model is models.PlayerProfile:
             self.player_filters()
@@ -219,7 +282,9 @@ class ProfileListAPIFilter(APIFilter):
         """Filter queryset by language"""
         if language := self.query_params.get("language"):
             try:
-                self.queryset = self.service.filter_language(self.queryset, language)
+                self.queryset = self.service.filter_language(
+                    self.queryset, language, self.SEARCH_DOCUMENT
+                )
             except ValueError as e:
                 raise api_errors.InvalidLanguageCode(e)
 
@@ -232,11 +297,13 @@ class ProfileListAPIFilter(APIFilter):
         """Filter queryset by language"""
         if country := self.query_params.get("country"):
             try:
-                self.queryset = self.service.filter_country(self.queryset, country)
+                self.queryset = self.service.filter_country(
+                    self.queryset, country, self.SEARCH_DOCUMENT
+                )
             except ValueError as e:
                 raise api_errors.InvalidCountryCode(e)
 
-    def filter_localization(self, user_relation: str = "user") -> None:
+    def filter_localization(self) -> None:
         """Filter queryset by localization"""
         longitude, latitude, radius = (
             self.query_params.get("longitude"),
@@ -245,38 +312,48 @@ class ProfileListAPIFilter(APIFilter):
         )
         if longitude and latitude:
             self.queryset = self.service.filter_localization(
-                self.queryset, latitude, longitude, radius, user_relation
+                self.queryset, latitude, longitude, radius, self.SEARCH_DOCUMENT
             )
 
     def filter_league(self) -> None:
         """Filter queryset by player league"""
         if league := self.query_params.get("league"):
-            self.queryset = self.service.filter_league(self.queryset, league)
+            self.queryset = self.service.filter_league(
+                self.queryset, league, self.SEARCH_DOCUMENT
+            )
 
     def filter_gender(self) -> None:
         """Filter queryset by player gender"""
         if gender := self.query_params.get("gender"):
-            self.queryset = self.service.filter_player_gender(self.queryset, gender)
+            self.queryset = self.service.filter_player_gender(
+                self.queryset, gender, self.SEARCH_DOCUMENT
+            )
 
     def filter_position(self) -> None:
         """Filter queryset by player position"""
         if position := self.query_params.get("position"):
             self.queryset = self.service.filter_qs_by_player_position_id(
-                self.queryset, position
+                self.queryset, position, self.SEARCH_DOCUMENT
             )
 
     def filter_youth(self) -> None:
         """Filter queryset by youth players"""
         if self.query_params.get("youth"):
-            self.queryset = self.service.filter_youth_players(self.queryset)
+            self.queryset = self.service.filter_youth_players(
+                self.queryset, self.SEARCH_DOCUMENT
+            )
 
     def filter_age(self) -> None:
         """Filter queryset by age"""
         if min_age := self.query_params.get("min_age"):
-            self.queryset = self.service.filter_min_age(self.queryset, min_age)
+            self.queryset = self.service.filter_min_age(
+                self.queryset, min_age, self.SEARCH_DOCUMENT
+            )
 
         if max_age := self.query_params.get("max_age"):
-            self.queryset = self.service.filter_max_age(self.queryset, max_age)
+            self.queryset = self.service.filter_max_age(
+                self.queryset, max_age, self.SEARCH_DOCUMENT
+            )
 
     def filter_licence(self) -> None:
         """Filter queryset by licence"""
@@ -289,27 +366,20 @@ class ProfileListAPIFilter(APIFilter):
                 raise api_errors.ChoiceFieldValueErrorHTTPException(
                     field="licence", choices=available_names, model="LicenceType"
                 )
-            self.queryset = self.queryset.filter(
-                user__licences__licence__name__in=licence_names
-            ).distinct()
+            self.queryset = self.service.filter_licences(
+                self.queryset, licence_names, self.SEARCH_DOCUMENT
+            )
 
     def filter_by_labels(self) -> None:
         """
         Filters the queryset based on label criteria.
 
-        The method relies on utility functions to validate label names, get specific
-        IDs for profile and user-related labels, and apply these filters to the
-        queryset.
+        Label names are validated first, then profiles having any of these
+        labels (as profile or user labels) are kept.
         """
         if label_names := self.query_params.get("labels"):
-            valid_label_names = validate_labels(label_names)
-            profile_specific_ids = get_profile_specific_ids(
-                self.model, valid_label_names
-            )
-            user_related_ids = get_user_related_ids(valid_label_names)
-
-            self.queryset = apply_label_filters(
-                self.queryset, profile_specific_ids, user_related_ids, self.model
+            self.queryset = self.service.filter_labels(
+                self.queryset, validate_labels(label_names), self.SEARCH_DOCUMENT
             )
 
     def filter_players_by_transfer_status(self) -> None:
@@ -317,7 +387,7 @@ class ProfileListAPIFilter(APIFilter):
         transfer_statuses = self.query_params.get("transfer_status")
         if transfer_statuses:
             self.queryset = self.service.filter_transfer_status(
-                self.queryset, transfer_statuses
+                self.queryset, transfer_statuses, self.SEARCH_DOCUMENT
             )
 
     def filter_by_transfer_status_league(self) -> None:
@@ -326,7 +396,7 @@ class ProfileListAPIFilter(APIFilter):
         """
         if league_ids := self.query_params.get("transfer_status_league"):
             self.queryset = self.service.filter_by_transfer_status_league(
-                self.queryset, league_ids
+                self.queryset, league_ids, self.SEARCH_DOCUMENT
             )
 
     def filter_by_additional_info(self) -> None:
@@ -334,7 +404,9 @@ class ProfileListAPIFilter(APIFilter):
         Filter the queryset by additional information related to the profile's transfer status.
         """
         if info := self.query_params.get("additional_info"):
-            self.queryset = self.service.filter_by_additional_info(self.queryset, info)
+            self.queryset = self.service.filter_by_additional_info(
+                self.queryset, info, self.SEARCH_DOCUMENT
+            )
 
     def filter_by_number_of_trainings(self) -> None:
         """
@@ -342,7 +414,7 @@ class ProfileListAPIFilter(APIFilter):
         """
         if trainings := self.query_params.get("number_of_trainings"):
             self.queryset = self.service.filter_by_number_of_trainings(
-                self.queryset, trainings
+                self.queryset, trainings, self.SEARCH_DOCUMENT
             )
 
     def filter_by_benefits(self) -> None:
@@ -350,14 +422,18 @@ class ProfileListAPIFilter(APIFilter):
         Filter the queryset by benefits associated with the profile's transfer status.
         """
         if benefits := self.query_params.get("benefits"):
-            self.queryset = self.service.filter_by_benefits(self.queryset, benefits)
+            self.queryset = self.service.filter_by_benefits(
+                self.queryset, benefits, self.SEARCH_DOCUMENT
+            )
 
     def filter_by_salary(self) -> None:
         """
         Filter the queryset by salary range as indicated in the profile's transfer status.
         """
         if salary := self.query_params.get("salary"):
-            self.queryset = self.service.filter_by_salary(self.queryset, salary)
+            self.queryset = self.service.filter_by_salary(
+                self.queryset, salary, self.SEARCH_DOCUMENT
+            )
 
     def filter_by_pm_score(self) -> None:
         """Filter queryset based on the range of PlayMaker Score"""
@@ -365,10 +441,14 @@ class ProfileListAPIFilter(APIFilter):
         max_score = self.query_params.get("max_pm_score")
 
         if min_score is not None:
-            self.queryset = self.service.filter_min_pm_score(self.queryset, min_score)
+            self.queryset = self.service.filter_min_pm_score(
+                self.queryset, min_score, self.SEARCH_DOCUMENT
+            )
 
         if max_score is not None:
-            self.queryset = self.service.filter_max_pm_score(self.queryset, max_score)
+            self.queryset = self.service.filter_max_pm_score(
+                self.queryset, max_score, self.SEARCH_DOCUMENT
+            )
 
     def observed(self) -> None:
         """Include only profiles that are observed by the user"""
@@ -0,0 +1,72 @@
+import pickle
+import time
+import typing
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from rest_framework.renderers import JSONRenderer
+
+from utils.cache import CachedJSONResponse, CachedResponse
+
+LEGACY_CACHE_KEY = "benchmark:legacy"
+CACHE_KEY = "benchmark:rendered"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare CPU time of a cache hit of profile catalogue page: legacy "
+        "(pickled data rendered by stock JSONRenderer) and rendered content."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--query", default="role=P&page_size=10", help="Catalogue query string"
+        )
+        parser.add_argument("--repeat", type=int, default=1000)
+
+    def handle(self, *args, **options) -> None:
+        request = RequestFactory().get(
+            reverse("api:profiles:create_or_list_profiles"),
+            QUERY_STRING=options["query"],
+        )
+        # computed (and rendered) as by stale-while-revalidate refresh
+        request.cache_refresh = True
+        match = resolve(request.path_info)
+        response = match.func(request, *match.args, **match.kwargs)
+        if response.status_code != 200:
+            raise CommandError(f"Catalogue responded with {response.status_code}.")
+        data = response.data
+
+        cache.set(LEGACY_CACHE_KEY, {"data": data, "generations": {}})
+        with CachedResponse(CACHE_KEY, request) as response_cache:
+            response_cache.data = data
+        repeat = options["repeat"]
+
+        legacy = self.measure(
+            lambda: JSONRenderer().render(cache.get(LEGACY_CACHE_KEY)["data"]),
+            repeat,
+        )
+        rendered = self.measure(
+            lambda: CachedJSONResponse(CachedResponse._unpack(cache.get(CACHE_KEY))),
+            repeat,
+        )
+        legacy_size = len(pickle.dumps(cache.get(LEGACY_CACHE_KEY)))
+        rendered_size = len(pickle.dumps(cache.get(CACHE_KEY)))
+        cache.delete_many([LEGACY_CACHE_KEY, CACHE_KEY])
+
+        self.stdout.write(
+            f"{len(data.get('results', []))} profiles x {repeat} hits: "
+            f"legacy {legacy * 1000:.3f}ms ({legacy_size} bytes cached), "
+            f"rendered {rendered * 1000:.3f}ms ({rendered_size} bytes cached) "
+            f"CPU time per hit ({legacy / rendered:.1f}x faster)"
+        )
+
+    @staticmethod
+    def measure(func: typing.Callable, repeat: int) -> float:
+        """Mean CPU time of single call, in seconds"""
+        start = time.process_time()
+        for _ in range(repeat):
+            func()
+        return (time.process_time() - start) / repeat
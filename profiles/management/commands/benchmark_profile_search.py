@@ -0,0 +1,105 @@
+import random
+import time
+import typing
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import Q
+
+from profiles import utils
+from profiles.services import ProfileService
+
+User = get_user_model()
+
+FIRST_NAMES = ["Łukasz", "Paweł", "Jan", "Zofia", "Małgorzata", "Krzysztof", "Anna"]
+LAST_NAMES = ["Kowalski", "Żółkiewski", "Nowak", "Wiśniewska", "Lewandowski", "Bąk"]
+
+
+class _Rollback(Exception):
+    """Raised to discard synthetic users after benchmark"""
+
+
+def legacy_search_profiles_by_name(search_term: str) -> typing.List[int]:
+    """Previous, python-side implementation of name search (for comparison)"""
+    search_term = utils.preprocess_search_term(search_term)
+    users_with_declared_role = User.objects.filter(
+        Q(declared_role__isnull=False) | Q(historical_role__isnull=False)
+    )
+    return [
+        user.id
+        for user in users_with_declared_role
+        if search_term
+        in utils.preprocess_search_term(
+            (user.first_name or "") + " " + (user.last_name or "")
+        )
+        and user.should_be_listed
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare legacy and indexed profile name search on synthetic users. "
+        "Synthetic users are created in a transaction which is rolled back."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--terms", nargs="+", default=["kowal", "lukasz", "zofia nowak", "bak"]
+        )
+
+    def handle(self, *args, **options) -> None:
+        try:
+            with transaction.atomic():
+                self.create_users(options["users"])
+                for term in options["terms"]:
+                    self.benchmark(term, options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write("Synthetic users removed.")
+
+    def create_users(self, count: int) -> None:
+        users = []
+        for i in range(count):
+            first_name = random.choice(FIRST_NAMES)
+            last_name = f"{random.choice(LAST_NAMES)}{i}"
+            users.append(
+                User(
+                    email=f"search-benchmark-{i}@playmaker.invalid",
+                    password="!",
+                    first_name=first_name,
+                    last_name=last_name,
+                    declared_role="P",
+                    search_name=User.build_search_name(first_name, last_name),
+                )
+            )
+        User.objects.bulk_create(users, batch_size=5000)
+        self.stdout.write(f"Created {count} synthetic users.")
+
+    def benchmark(self, term: str, repeat: int) -> None:
+        legacy = self.measure(lambda: legacy_search_profiles_by_name(term), repeat)
+        indexed = self.measure(lambda: self.indexed_first_page(term), repeat)
+        self.stdout.write(
+            f"'{term}': legacy {legacy * 1000:.1f} ms, "
+            f"indexed {indexed * 1000:.1f} ms, "
+            f"speedup x{legacy / indexed if indexed else float('inf'):.1f}"
+        )
+
+    @staticmethod
+    def indexed_first_page(term: str) -> typing.List[int]:
+        """Count + first page, the same way ProfileSearchView paginates"""
+        qs = ProfileService.search_profiles_by_name(term)
+        qs.count()
+        return list(qs.values_list("id", flat=True)[:5])
+
+    @staticmethod
+    def measure(func: typing.Callable, repeat: int) -> float:
+        """Best time out of `repeat` runs, in seconds"""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
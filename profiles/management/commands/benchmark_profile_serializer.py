@@ -0,0 +1,90 @@
+import time
+import typing
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers
+
+from api.serializers import ProfileEnumChoicesSerializer
+from profiles.api import consts
+from profiles.api.serialization_plan import get_serialization_plan
+from profiles.api.serializers import ProfileSerializer
+from profiles.models import PROFILE_MODEL_MAP
+from profiles.services import TeamContributorService
+
+
+def legacy_serialize_attributes(obj, enums: typing.Tuple[str, ...]) -> dict:
+    """Previous, per attribute serialization of profile (for comparison)"""
+    ret = {}
+    for field_name in obj.__dict__.keys():
+        if field_name.startswith("_"):
+            continue
+        field_value = getattr(obj, field_name)
+        if field_name in enums and field_value:
+            serializer_field = ProfileEnumChoicesSerializer(
+                required=False, model=type(obj), source=field_name
+            )
+        else:
+            serializer_field = consts.TYPE_TO_SERIALIZER_MAPPING.get(
+                type(field_value), serializers.CharField()
+            )
+        ret[field_name] = serializer_field.to_representation(field_value)
+    return ret
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare legacy and compiled serialization of profile attributes "
+        "on a page of existing profiles, report queries of whole page."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--role", default="P", choices=PROFILE_MODEL_MAP.keys())
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, **options) -> None:
+        model = PROFILE_MODEL_MAP[options["role"]]
+        profiles = list(model.objects.all()[: options["page_size"]])
+        if not profiles:
+            raise CommandError(f"No {model.__name__} to serialize.")
+        repeat = options["repeat"]
+        enums = ProfileSerializer.enums
+
+        legacy = self.measure(
+            lambda: [legacy_serialize_attributes(obj, enums) for obj in profiles],
+            repeat,
+        )
+        compiled = self.measure(
+            lambda: [
+                get_serialization_plan(type(obj), tuple(obj.__dict__), enums).serialize(
+                    obj, {}
+                )
+                for obj in profiles
+            ],
+            repeat,
+        )
+        self.stdout.write(
+            f"{len(profiles)} profiles x {repeat}: legacy {legacy * 1000:.1f}ms, "
+            f"compiled {compiled * 1000:.1f}ms per page "
+            f"({legacy / compiled:.1f}x faster)"
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            TeamContributorService.prefetch_primary_contributions(profiles)
+            start = time.perf_counter()
+            ProfileSerializer(profiles, many=True).data
+            elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"Whole page serialized in {elapsed * 1000:.1f}ms "
+            f"with {len(queries)} queries"
+        )
+
+    @staticmethod
+    def measure(func: typing.Callable, repeat: int) -> float:
+        """Mean time of single call, in seconds"""
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return (time.perf_counter() - start) / repeat
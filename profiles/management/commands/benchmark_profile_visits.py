@@ -0,0 +1,136 @@
+import threading
+import time
+import typing
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.utils import timezone
+
+from profiles.models import (
+    PlayerProfile,
+    ProfileVisitation,
+    ProfileVisitHistory,
+    ProfileVisitSummary,
+)
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test of visit counting: many threads visit one (popular) profile "
+        "at once, then counters are checked to be exact. "
+        "Synthetic users are removed afterwards."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--threads", type=int, default=16)
+        parser.add_argument("--visits", type=int, default=50, help="Per thread")
+        parser.add_argument(
+            "--visitors", type=int, default=8, help="Distinct visiting profiles"
+        )
+
+    def handle(self, *args, **options) -> None:
+        threads, visits = options["threads"], options["visits"]
+        prefix = f"visits-benchmark-{uuid.uuid4().hex[:8]}"
+        try:
+            visited = self.create_profile(f"{prefix}-visited")
+            visitors = [
+                self.create_profile(f"{prefix}-visitor-{i}")
+                for i in range(options["visitors"])
+            ]
+            ProfileVisitSummary.refresh([visited.meta_id])
+            elapsed = self.hammer(visited, visitors, threads, visits)
+            total = threads * visits
+            self.stdout.write(
+                f"{total} visits from {threads} threads in {elapsed:.2f}s "
+                f"({total / elapsed:.0f} visits/s)"
+            )
+            self.check_counters(visited, visitors, total)
+        finally:
+            User.objects.filter(email__startswith=prefix).delete()
+            self.stdout.write("Synthetic users removed.")
+
+    @staticmethod
+    def create_profile(name: str) -> PlayerProfile:
+        user = User.objects.create_user(
+            email=f"{name}@playmaker.invalid", password=None, first_name=name
+        )
+        profile = PlayerProfile(user=user)
+        profile.save()
+        return PlayerProfile.objects.select_related("meta", "visitation").get(
+            pk=profile.pk
+        )
+
+    @staticmethod
+    def visit(visited: PlayerProfile, visitor: PlayerProfile) -> None:
+        """Count a visit the same way profile retrieve view does"""
+        ProfileVisitHistory.register_visit(user=visited.user, requestor=visitor)
+        ProfileVisitation.upsert(visitor=visitor, visited=visited)
+
+    def hammer(
+        self,
+        visited: PlayerProfile,
+        visitors: typing.List[PlayerProfile],
+        threads: int,
+        visits: int,
+    ) -> float:
+        """Run visits from all threads at once, return elapsed time in seconds"""
+        barrier = threading.Barrier(threads)
+        errors = []
+
+        def worker(index: int) -> None:
+            try:
+                barrier.wait()
+                for i in range(visits):
+                    self.visit(visited, visitors[(index + i) % len(visitors)])
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        if errors:
+            raise CommandError(f"{len(errors)} threads failed, first: {errors[0]!r}")
+        return elapsed
+
+    def check_counters(
+        self, visited: PlayerProfile, visitors: typing.List[PlayerProfile], total: int
+    ) -> None:
+        visited.visitation.refresh_from_db()
+        counters = {
+            "history": ProfileVisitHistory.objects.get(
+                user=visited.user, created_at=timezone.localdate()
+            ).counter_playerprofile,
+            "visitations": ProfileVisitation.objects.filter(
+                visited=visited.meta
+            ).count(),
+            "visitors this year": visited.visitation.visitors_count_this_year,
+            "summary visits": ProfileVisitSummary.objects.get(
+                meta=visited.meta
+            ).visits_this_month,
+            "summary visitors": ProfileVisitSummary.objects.get(
+                meta=visited.meta
+            ).visitors,
+        }
+        expected = {
+            "history": total,
+            "visitations": len(visitors),
+            "visitors this year": total,
+            "summary visits": total,
+            "summary visitors": len(visitors),
+        }
+        lost = {
+            name: (counters[name], value)
+            for name, value in expected.items()
+            if counters[name] != value
+        }
+        if lost:
+            raise CommandError(f"Inexact counters (actual, expected): {lost}")
+        self.stdout.write(self.style.SUCCESS(f"All counters exact: {counters}"))
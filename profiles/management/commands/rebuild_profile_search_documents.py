@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from profiles.models import ProfileSearchDocument
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild search documents (ProfileSearchDocument) of all listed profiles, "
+        "or of given profile metas only."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--meta-ids", nargs="+", type=int)
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options) -> None:
+        start = time.perf_counter()
+        refreshed = ProfileSearchDocument.refresh(
+            options["meta_ids"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            f"Rebuilt {refreshed} search documents "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from pm_core.services.stubs.player_stub import PlayerApiServiceStub
+
+from mapper.models import MapperEntity
+from profiles.metrics_refresh import PlayerMetricsBulkRefresh
+from profiles.models import PlayerProfile
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh metrics and scoring of players mapped to scrapper in bulk. "
+        "With --benchmark data comes from scrapper api stub and nothing is "
+        "saved, only throughput of the pipeline is reported."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--ids", type=int, nargs="*", help="PlayerProfile ids")
+        parser.add_argument("--limit", type=int, default=None)
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument("--rate", type=float, default=20.0, help="Calls/s")
+        parser.add_argument("--retries", type=int, default=2)
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--only", choices=("metrics", "scoring"), default=None)
+        parser.add_argument("--benchmark", action="store_true")
+
+    def handle(self, *args, **options) -> None:
+        players = PlayerProfile.objects.filter(
+            mapper__mapperentity__database_source=(
+                MapperEntity.MapperDataSource.MONGODB
+            ),
+            mapper__mapperentity__related_type=MapperEntity.MapperRelatedModel.PLAYER,
+        ).order_by("pk")
+        if options["ids"]:
+            players = players.filter(pk__in=options["ids"])
+        if options["limit"]:
+            players = players[: options["limit"]]
+
+        refresher_kwargs = (
+            {"api_method": PlayerApiServiceStub} if options["benchmark"] else {}
+        )
+        refresher = PlayerMetricsBulkRefresh(
+            **refresher_kwargs,
+            workers=options["workers"],
+            rate=options["rate"],
+            retries=options["retries"],
+            batch_size=options["batch_size"],
+        )
+        refresh_kwargs = {
+            "refresh_metrics": options["only"] in (None, "metrics"),
+            "refresh_scoring": options["only"] in (None, "scoring"),
+        }
+        if options["benchmark"]:
+            with transaction.atomic():
+                report = refresher.refresh(players, **refresh_kwargs)
+                transaction.set_rollback(True)
+        else:
+            report = refresher.refresh(players, **refresh_kwargs)
+
+        self.stdout.write(
+            f"Refreshed {report.refreshed} players in {report.elapsed:.2f}s "
+            f"({report.throughput:.1f} players/s), failed: {report.failed}, "
+            f"without scrapper uuid: {report.without_uuid}"
+        )
@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from profiles.models import ProfileVisitSummary
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute visit summaries (ProfileVisitSummary) of all profiles, "
+        "or of given profile metas only."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--meta-ids", nargs="+", type=int)
+
+    def handle(self, *args, **options) -> None:
+        start = time.perf_counter()
+        summaries = ProfileVisitSummary.refresh(options["meta_ids"])
+        self.stdout.write(
+            f"Refreshed {len(summaries)} visit summaries "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
@@ -0,0 +1,296 @@
+"""
+Bulk refresh of PlayerMetrics from scrapper.
+
+Mapper uuids and season range of all players are resolved upfront with
+single queries, scrapper data is fetched concurrently by a bounded pool of
+threads (calls are throttled per host and retried on connection errors),
+refreshed metrics are written with bulk_update.
+"""
+
+import functools
+import logging
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.db import connection
+from requests.exceptions import ConnectionError
+
+from adapters.base_adapter import API_METHOD, ScrapperAPI
+from mapper.models import MapperEntity
+from profiles.models import PlayerMetrics, PlayerProfile, ProfileSearchDocument
+from utils.reference_data import reference_data
+
+logger = logging.getLogger(__name__)
+
+METRICS_FIELDS = (
+    "games",
+    "games_updated",
+    "games_summary",
+    "games_summary_updated",
+    "season",
+    "season_updated",
+    "season_summary",
+    "season_summary_updated",
+)
+SCORING_FIELDS = (
+    "pm_score",
+    "pm_score_updated",
+    "pm_score_history",
+    "season_score",
+    "season_score_updated",
+)
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` calls per second (in bursts of `burst`)"""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed"""
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_limiters: typing.Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host: str, rate: float, burst: int = 1) -> RateLimiter:
+    """Limiter shared by all refreshes calling given host"""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None or (limiter.rate, limiter.burst) != (rate, burst):
+            limiter = _limiters[host] = RateLimiter(rate, burst)
+        return limiter
+
+
+def get_scrapper_host() -> str:
+    from backend.settings import cfg
+
+    return urlsplit(cfg.scrapper.base_url).netloc
+
+
+class ThrottledAPI:
+    """
+    Proxy of scrapper api, throttles calls with the limiter and retries
+    them on connection errors (last error is raised to the adapter).
+    """
+
+    def __init__(
+        self,
+        api_method: typing.Type[API_METHOD],
+        limiter: RateLimiter,
+        retries: int = 2,
+        backoff: float = 0.5,
+    ) -> None:
+        self._api = api_method()
+        self._limiter = limiter
+        self._retries = retries
+        self._backoff = backoff
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._api, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            for attempt in range(self._retries + 1):
+                self._limiter.acquire()
+                try:
+                    return attr(*args, **kwargs)
+                except ConnectionError:
+                    if attempt == self._retries:
+                        raise
+                    time.sleep(self._backoff * 2**attempt)
+
+        return call
+
+
+class RefreshReport(typing.NamedTuple):
+    refreshed: int
+    failed: int
+    without_uuid: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Refreshed players per second"""
+        return self.refreshed / self.elapsed if self.elapsed else 0.0
+
+
+class PlayerMetricsBulkRefresh:
+    """Refresh metrics and/or scoring of many players at once"""
+
+    def __init__(
+        self,
+        api_method: typing.Type[API_METHOD] = ScrapperAPI,
+        workers: int = 8,
+        rate: float = 20.0,
+        retries: int = 2,
+        backoff: float = 0.5,
+        batch_size: int = 200,
+        host: typing.Optional[str] = None,
+    ) -> None:
+        self.api_method = api_method
+        self.workers = workers
+        self.batch_size = batch_size
+        self.limiter = get_rate_limiter(
+            host or (get_scrapper_host() if api_method is ScrapperAPI else "stub"),
+            rate,
+            burst=max(1, workers),
+        )
+        self.api_factory = functools.partial(
+            ThrottledAPI,
+            api_method,
+            self.limiter,
+            retries=retries,
+            backoff=backoff,
+        )
+
+    @staticmethod
+    def get_player_uuids(players: typing.Iterable[PlayerProfile]) -> typing.Dict:
+        """{mapper_id of player: scrapper uuid} with a single query"""
+        return dict(
+            MapperEntity.objects.filter(
+                target_id__in=[player.mapper_id for player in players],
+                database_source=MapperEntity.MapperDataSource.MONGODB,
+                related_type=MapperEntity.MapperRelatedModel.PLAYER,
+                mapper_id__isnull=False,
+            ).values_list("target_id", "mapper_id")
+        )
+
+    @staticmethod
+    def get_season_range() -> typing.List:
+        return list(reference_data.get("seasons")[:4])
+
+    @staticmethod
+    def get_metrics(player_ids: typing.Iterable[int]) -> typing.List[PlayerMetrics]:
+        """Metrics of players, missing ones are created"""
+        player_ids = set(player_ids)
+        existing = set(
+            PlayerMetrics.objects.filter(player_id__in=player_ids).values_list(
+                "player_id", flat=True
+            )
+        )
+        PlayerMetrics.objects.bulk_create(
+            [PlayerMetrics(player_id=pk) for pk in player_ids - existing],
+            ignore_conflicts=True,
+        )
+        return list(
+            PlayerMetrics.objects.filter(player_id__in=player_ids).select_related(
+                "player__user"
+            )
+        )
+
+    def refresh_one(
+        self,
+        metrics: PlayerMetrics,
+        adapter_kwargs: dict,
+        refresh_metrics: bool,
+        refresh_scoring: bool,
+    ) -> bool:
+        """Fetch data of single player into (unsaved) metrics"""
+        try:
+            if refresh_metrics:
+                metrics.refresh_metrics(
+                    self.api_factory, commit=False, adapter_kwargs=adapter_kwargs
+                )
+            if refresh_scoring:
+                metrics.refresh_scoring(
+                    self.api_factory, commit=False, adapter_kwargs=adapter_kwargs
+                )
+            return True
+        except Exception as e:
+            logger.exception(f"Unable to refresh metrics of {metrics.player}: {e}")
+            return False
+
+    def _run_in_thread(self, *args) -> bool:
+        try:
+            return self.refresh_one(*args)
+        finally:
+            # serializers resolve names from database in worker threads
+            connection.close()
+
+    def refresh(
+        self,
+        players: typing.Iterable[PlayerProfile],
+        refresh_metrics: bool = True,
+        refresh_scoring: bool = True,
+        commit: bool = True,
+    ) -> RefreshReport:
+        start = time.perf_counter()
+        players = list(players)
+        uuids = self.get_player_uuids(players)
+        season_range = self.get_season_range()
+        mapper_ids = {player.pk: player.mapper_id for player in players}
+        metrics = self.get_metrics(
+            pk for pk, mapper_id in mapper_ids.items() if mapper_id in uuids
+        )
+        jobs = [
+            (
+                obj,
+                {
+                    "season_range": season_range,
+                    "player_uuid": uuids[mapper_ids[obj.player_id]],
+                },
+                refresh_metrics,
+                refresh_scoring,
+            )
+            for obj in metrics
+        ]
+
+        if self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(
+                    executor.map(lambda job: self._run_in_thread(*job), jobs)
+                )
+        else:
+            results = [self.refresh_one(*job) for job in jobs]
+
+        refreshed = [obj for obj, ok in zip(metrics, results) if ok]
+        fields = (METRICS_FIELDS if refresh_metrics else ()) + (
+            SCORING_FIELDS if refresh_scoring else ()
+        )
+        if commit and refreshed and fields:
+            PlayerMetrics.objects.bulk_update(
+                refreshed, fields, batch_size=self.batch_size
+            )
+            if refresh_scoring:
+                # bulk_update sends no signals which would refresh pm_score
+                refreshed_ids = {obj.player_id for obj in refreshed}
+                ProfileSearchDocument.refresh(
+                    player.meta_id
+                    for player in players
+                    if player.pk in refreshed_ids and player.meta_id
+                )
+
+        report = RefreshReport(
+            refreshed=len(refreshed),
+            failed=len(metrics) - len(refreshed),
+            without_uuid=len(players) - len(metrics),
+            elapsed=time.perf_counter() - start,
+        )
+        logger.info(f"PlayerMetrics bulk refresh: {report}")
+        return report
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Indexes used by bounding box prefilter of radius based lookups
+    (see utils.geo.filter_within_radius).
+    """
+
+    dependencies = [
+        ("profiles", "0179_alter_profilemeta_user"),
+        ("cities_light", "0011_alter_city_country_alter_city_region_and_more"),
+        ("address", "0003_auto_20200830_1851"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX IF NOT EXISTS cities_light_city_lat_lng_idx "
+            "ON cities_light_city (latitude, longitude);",
+            reverse_sql="DROP INDEX IF EXISTS cities_light_city_lat_lng_idx;",
+        ),
+        migrations.RunSQL(
+            "CREATE INDEX IF NOT EXISTS address_address_lat_lng_idx "
+            "ON address_address (latitude, longitude);",
+            reverse_sql="DROP INDEX IF EXISTS address_address_lat_lng_idx;",
+        ),
+    ]
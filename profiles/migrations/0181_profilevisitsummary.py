@@ -0,0 +1,31 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("profiles", "0180_geo_coordinates_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProfileVisitSummary",
+            fields=[
+                (
+                    "meta",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="visit_summary",
+                        serialize=False,
+                        to="profiles.profilemeta",
+                    ),
+                ),
+                ("visits_last_30_days", models.PositiveIntegerField(default=0)),
+                ("visits_this_month", models.PositiveIntegerField(default=0)),
+                ("visits_this_year", models.PositiveIntegerField(default=0)),
+                ("visitors", models.PositiveIntegerField(default=0)),
+                ("refreshed_on", models.DateField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    One visitation per (visitor, visited) pair, required by the atomic upsert
+    of ProfileVisitation. Duplicates (created by concurrent visits) are removed,
+    keeping the latest one.
+    """
+
+    dependencies = [
+        ("profiles", "0181_profilevisitsummary"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "DELETE FROM profiles_profilevisitation AS a "
+            "USING profiles_profilevisitation AS b "
+            "WHERE a.visitor_id = b.visitor_id AND a.visited_id = b.visited_id "
+            'AND (a."timestamp", a.id) < (b."timestamp", b.id);',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="profilevisitation",
+            constraint=models.UniqueConstraint(
+                fields=("visitor", "visited"), name="unique_profile_visitation"
+            ),
+        ),
+    ]
@@ -0,0 +1,183 @@
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Documents of existing profiles are built by beat within minutes (or by
+    `rebuild_profile_search_documents`), then kept up to date by signals
+    and rebuilt nightly.
+    """
+
+    dependencies = [
+        ("cities_light", "0011_alter_city_country_alter_city_region_and_more"),
+        ("clubs", "0098_auto_20250708_0003"),
+        ("profiles", "0182_profilevisitation_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProfileSearchDocument",
+            fields=[
+                (
+                    "meta",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="profiles.profilemeta",
+                    ),
+                ),
+                ("role", models.CharField(max_length=2)),
+                ("birth_date", models.DateField(null=True)),
+                ("gender", models.CharField(max_length=1, null=True)),
+                (
+                    "citizenship",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=100),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "spoken_languages",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=10),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "positions",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(), default=list, size=None
+                    ),
+                ),
+                ("pm_score", models.IntegerField(null=True)),
+                (
+                    "labels",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=255),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "licences",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=255),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                ("promoted_until", models.DateTimeField(null=True)),
+                ("transfer_status", models.CharField(max_length=255, null=True)),
+                (
+                    "transfer_leagues",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(), default=list, size=None
+                    ),
+                ),
+                (
+                    "transfer_additional_info",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=10),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "transfer_benefits",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=255),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                ("transfer_trainings", models.CharField(max_length=10, null=True)),
+                ("transfer_salary", models.CharField(max_length=10, null=True)),
+                ("refreshed_at", models.DateTimeField()),
+                (
+                    "league",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="clubs.league",
+                    ),
+                ),
+                (
+                    "localization",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="cities_light.city",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=models.Index(
+                fields=["role", "birth_date"], name="search_doc_birth_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=models.Index(
+                fields=["role", "pm_score"], name="search_doc_pm_score_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=models.Index(
+                fields=["role", "promoted_until"], name="search_doc_promoted_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=models.Index(
+                fields=["role", "transfer_status"], name="search_doc_transfer_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["positions"], name="search_doc_positions_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["labels"], name="search_doc_labels_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["licences"], name="search_doc_licences_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["citizenship"], name="search_doc_citizenship_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["spoken_languages"], name="search_doc_languages_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="profilesearchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["transfer_leagues"], name="search_doc_tr_leagues_gin"
+            ),
+        ),
+    ]
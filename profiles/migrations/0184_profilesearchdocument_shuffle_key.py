@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+import profiles.models
+
+
+class Migration(migrations.Migration):
+    """
+    Random key of each search document, mixed with a daily user seed to order
+    the shuffled catalogue. Existing documents get distinct random keys.
+    """
+
+    dependencies = [
+        ("profiles", "0183_profilesearchdocument"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profilesearchdocument",
+            name="shuffle_key",
+            field=models.IntegerField(default=profiles.models.get_random_shuffle_key),
+        ),
+        migrations.RunSQL(
+            "UPDATE profiles_profilesearchdocument "
+            "SET shuffle_key = floor(random() * 2147483648)::integer;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
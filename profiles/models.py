@@ -1,17 +1,22 @@
 import logging
+import random
 import typing
 import uuid
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional
 
 from address.models import AddressField
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.core import validators
-from django.db import models
+from django.db import models, router
 from django.db.models import QuerySet
+from django.db.models.signals import post_save
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -35,10 +40,12 @@ from premium.models import (
     PremiumType,
     PromoteProfileProduct,
 )
+from premium.snapshot import get_premium_products
 from profiles import utils as profile_utils
 from profiles.mixins import TeamObjectsDisplayMixin, VisitationMixin
 from roles import definitions
 from users.models import User
+from utils.db import increment_json_key, upsert
 from voivodeships.models import Voivodeships
 
 logger = logging.getLogger(__name__)
@@ -358,12 +365,10 @@ class BaseProfile(models.Model, EventLogMixin):
 
     @property
     def products(self) -> PremiumProduct:
-        """Get premium products for profile"""
-        try:
-            self.refresh_from_db()
-            return self.premium_products
-        except Exception:
+        """Get premium products snapshot for profile"""
+        if self.premium_products_id is None:
             return self.premium_products
+        return get_premium_products(self.premium_products_id) or self.premium_products
 
     @property
     def is_promoted(self) -> bool:
@@ -1038,36 +1043,50 @@ class PlayerMetrics(models.Model):
             self.save()
 
     def refresh_metrics(
-        self, method: typing.Type[API_METHOD] = ScrapperAPI, *args, **kwargs
+        self,
+        method: typing.Type[API_METHOD] = ScrapperAPI,
+        *args,
+        commit: bool = True,
+        adapter_kwargs: typing.Optional[dict] = None,
+        **kwargs,
     ) -> None:
         """
         get metrics from api and save into model
         fantasy is currently unavailable
         """
         start = datetime.now()
-        stats = self.get_season_data(method)
-        stats_summary = self.get_season_summary_data(method)
-        self.update_season(stats)
-        print(f"\t> PlayerStatsSeasonAdapter: {datetime.now() - start}")
+        stats = self.get_season_data(method, adapter_kwargs)
+        stats_summary = self.get_season_summary_data(method, adapter_kwargs)
+        self.update_season(stats, commit=False)
+        logger.debug(f"PlayerStatsSeasonAdapter: {datetime.now() - start}")
 
         start = datetime.now()
-        games = self.get_games_data(method)
+        games = self.get_games_data(method, adapter_kwargs)
         games_summary = games[:3]
-        self.update_games(games)
-        print(f"\t> PlayerLastGamesAdapter: {datetime.now() - start}")
+        self.update_games(games, commit=False)
+        logger.debug(f"PlayerLastGamesAdapter: {datetime.now() - start}")
 
         self.update_summaries(games_summary, stats_summary, None)
-        self.save()
+        if commit:
+            self.save()
 
-    def refresh_scoring(self, method: typing.Type[API_METHOD] = ScrapperAPI) -> None:
+    def refresh_scoring(
+        self,
+        method: typing.Type[API_METHOD] = ScrapperAPI,
+        *args,
+        commit: bool = True,
+        adapter_kwargs: typing.Optional[dict] = None,
+        **kwargs,
+    ) -> None:
         """Refresh scoring section"""
-        data = self.get_score(method)
+        data = self.get_score(method, adapter_kwargs)
         pm_score, season_score = data.get("pm_score"), data.get("season_score")
 
         self.update_pm_score(pm_score, commit=False)
         self.update_season_score(season_score, commit=False)
         # add here new updaters related to scoring
-        self.save()
+        if commit:
+            self.save()
 
     def get_and_update_pm_score(
         self, method: typing.Type[API_METHOD] = ScrapperAPI
@@ -1084,54 +1103,81 @@ class PlayerMetrics(models.Model):
         self.update_season_score(data.get("season_score"))
 
     def get_games_data(
-        self, method: typing.Type[API_METHOD] = ScrapperAPI
+        self,
+        method: typing.Type[API_METHOD] = ScrapperAPI,
+        adapter_kwargs: typing.Optional[dict] = None,
     ) -> typing.List:
         player_obj = self.player
         games_adapter = PlayerGamesAdapter(
-            player=player_obj, strategy=strategy.AlwaysUpdate, api_method=method
+            player=player_obj,
+            strategy=strategy.AlwaysUpdate,
+            api_method=method,
+            **(adapter_kwargs or {}),
         )
         games_adapter.get_latest_seasons_player_games()
         serializer = games_adapter.serialize()
         return serializer.data
 
     def get_games_summary_data(
-        self, method: typing.Type[API_METHOD] = ScrapperAPI
+        self,
+        method: typing.Type[API_METHOD] = ScrapperAPI,
+        adapter_kwargs: typing.Optional[dict] = None,
     ) -> typing.List:
         player_obj = self.player
         games_adapter = PlayerGamesAdapter(
-            player=player_obj, strategy=strategy.AlwaysUpdate, api_method=method
+            player=player_obj,
+            strategy=strategy.AlwaysUpdate,
+            api_method=method,
+            **(adapter_kwargs or {}),
         )
         games_adapter.get_player_games()
         serializer = games_adapter.serialize(limit=3)
         return serializer.data
 
     def get_season_data(
-        self, method: typing.Type[API_METHOD] = ScrapperAPI
+        self,
+        method: typing.Type[API_METHOD] = ScrapperAPI,
+        adapter_kwargs: typing.Optional[dict] = None,
     ) -> typing.Dict:
         player_obj = self.player
         stats_adapter = PlayerSeasonStatsAdapter(
-            player=player_obj, strategy=strategy.AlwaysUpdate, api_method=method
+            player=player_obj,
+            strategy=strategy.AlwaysUpdate,
+            api_method=method,
+            **(adapter_kwargs or {}),
         )
         stats_adapter.get_latest_seasons_stats(primary_league=False)
         serializer = stats_adapter.serialize()
         return serializer.data
 
     def get_season_summary_data(
-        self, method: typing.Type[API_METHOD] = ScrapperAPI
+        self,
+        method: typing.Type[API_METHOD] = ScrapperAPI,
+        adapter_kwargs: typing.Optional[dict] = None,
     ) -> typing.Dict:
         player_obj = self.player
         stats_adapter = PlayerSeasonStatsAdapter(
-            player=player_obj, strategy=strategy.AlwaysUpdate, api_method=method
+            player=player_obj,
+            strategy=strategy.AlwaysUpdate,
+            api_method=method,
+            **(adapter_kwargs or {}),
         )
         stats_adapter.get_season_stats()
         serializer = stats_adapter.serialize()
         return serializer.data_summary
 
-    def get_score(self, method: typing.Type[API_METHOD] = ScrapperAPI) -> dict:
+    def get_score(
+        self,
+        method: typing.Type[API_METHOD] = ScrapperAPI,
+        adapter_kwargs: typing.Optional[dict] = None,
+    ) -> dict:
         """get scoring for player"""
         player_obj = self.player
         score_adapter = PlayerScoreAdapter(
-            player=player_obj, strategy=strategy.AlwaysUpdate, api_method=method
+            player=player_obj,
+            strategy=strategy.AlwaysUpdate,
+            api_method=method,
+            **(adapter_kwargs or {}),
         )
         score_adapter.get_scoring()
 
@@ -1414,9 +1460,13 @@ class LicenceType(models.Model):
         This method queries the LicenceType model, excluding any entries where
         the key is null, and returns a list of unique names of the licences.
         """
-        return list(
-            LicenceType.objects.exclude(key__isnull=True).values_list("name", flat=True)
-        )
+        from utils.reference_data import reference_data
+
+        return [
+            licence.name
+            for licence in reference_data.get("licences")
+            if licence.key is not None
+        ]
 
     class Meta:
         ordering = ["order"]
@@ -2236,13 +2286,13 @@ class Visitation(models.Model):
 
     def increment_visitors_count_this_year(self) -> None:
         """
-        Increment the count of visitors for the current year.
+        Increment the count of visitors for the current year
+        (atomically, in the database).
         """
         current_year = str(timezone.now().year)
-        self._visitors_count_per_year[current_year] = (
-            self._visitors_count_per_year.get(current_year, 0) + 1
+        self._visitors_count_per_year[current_year] = increment_json_key(
+            self, "_visitors_count_per_year", current_year
         )
-        self.save()
 
 
 class ProfileVisitation(models.Model):
@@ -2264,6 +2314,11 @@ class ProfileVisitation(models.Model):
 
     class Meta:
         ordering = ["-timestamp"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["visitor", "visited"], name="unique_profile_visitation"
+            )
+        ]
 
     def __str__(self):
         return (
@@ -2276,12 +2331,23 @@ class ProfileVisitation(models.Model):
         Create or update ProfileVisitation pased on profiles objects.
         If visitation exists, update timestamp.
         """
-        if obj := cls.objects.filter(
-            visitor=visitor.meta, visited=visited.meta
-        ).first():
-            obj.refresh()
-        else:
-            obj = cls.objects.create(visitor=visitor.meta, visited=visited.meta)
+        obj = cls(visitor=visitor.meta, visited=visited.meta)
+        obj.pk, created = upsert(
+            obj, unique_fields=("visitor", "visited"), update_fields=("timestamp",)
+        )
+        obj._state.adding = False
+        obj._state.db = router.db_for_write(cls)
+        # raw upsert doesn't send post_save, receivers (notification) rely on it
+        post_save.send(
+            sender=cls,
+            instance=obj,
+            created=created,
+            update_fields=None,
+            raw=False,
+            using=obj._state.db,
+        )
+        if created:
+            ProfileVisitSummary.count_visitor(visited.meta_id)
         visited.visitation.increment_visitors_count_this_year()
 
         return obj
@@ -2319,15 +2385,42 @@ class ProfileVisitHistory(models.Model):
     created_at = models.DateField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def increment(self, requestor: typing.Union[BaseProfile, AnonymousUser]):
-        """Increments counter based on requester"""
+    @classmethod
+    def get_counter_field(
+        cls, requestor: typing.Union[BaseProfile, AnonymousUser]
+    ) -> str:
+        """Name of the counter of visits made by given requester"""
         counter_field = f"counter_{requestor.__class__.__name__.lower()}"
-        try:
-            counter = getattr(self, counter_field)
-        except AttributeError:
+        if not hasattr(cls, counter_field):
             raise AttributeError(f"Invalid counter field: {counter_field}")
-        setattr(self, counter_field, counter + 1)
-        self.save()
+        return counter_field
+
+    def increment(self, requestor: typing.Union[BaseProfile, AnonymousUser]):
+        """Increments counter based on requester"""
+        counter_field = self.get_counter_field(requestor)
+        ProfileVisitHistory.objects.filter(pk=self.pk).update(
+            **{counter_field: models.F(counter_field) + 1},
+            updated_at=timezone.now(),
+        )
+        setattr(self, counter_field, getattr(self, counter_field) + 1)
+        ProfileVisitSummary.count_visit(self.user_id)
+
+    @classmethod
+    def register_visit(
+        cls, user: User, requestor: typing.Union[BaseProfile, AnonymousUser]
+    ) -> None:
+        """
+        Count a visit of the user's profile in today's history
+        (created if it doesn't exist yet) with a single atomic upsert.
+        """
+        counter_field = cls.get_counter_field(requestor)
+        upsert(
+            cls(user=user, **{counter_field: 1}),
+            unique_fields=("user", "created_at"),
+            update_fields=("updated_at",),
+            increment_fields=(counter_field,),
+        )
+        ProfileVisitSummary.count_visit(user.pk)
 
     @property
     def total_visits(self) -> int:
@@ -2362,6 +2455,439 @@ class ProfileVisitHistory(models.Model):
         ]
 
 
+class ProfileVisitSummary(models.Model):
+    """
+    Precomputed visit counts of a profile, read instead of aggregating
+    ProfileVisitHistory and ProfileVisitation rows of every profile.
+    Counters are incremented with each visit and recomputed daily
+    (or when found outdated), which moves the rolling windows.
+    """
+
+    meta = models.OneToOneField(
+        "ProfileMeta",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="visit_summary",
+    )
+    # visits of the user's profiles (ProfileVisitHistory)
+    visits_last_30_days = models.PositiveIntegerField(default=0)
+    visits_this_month = models.PositiveIntegerField(default=0)
+    visits_this_year = models.PositiveIntegerField(default=0)
+    # profiles which have ever visited the profile (ProfileVisitation)
+    visitors = models.PositiveIntegerField(default=0)
+    refreshed_on = models.DateField()
+
+    VISITS_FIELDS = ("visits_last_30_days", "visits_this_month", "visits_this_year")
+
+    @property
+    def is_outdated(self) -> bool:
+        return self.refreshed_on < timezone.now().date()
+
+    @classmethod
+    def refresh(
+        cls, meta_ids: typing.Optional[typing.Iterable[int]] = None
+    ) -> typing.List["ProfileVisitSummary"]:
+        """
+        Recompute summaries of given profile metas (all of them if not given)
+        with a few aggregate queries, return them.
+        """
+        today = timezone.now().date()
+        since = {
+            "visits_last_30_days": today - timezone.timedelta(days=30),
+            "visits_this_month": today.replace(day=1),
+            "visits_this_year": today.replace(month=1, day=1),
+        }
+        metas = ProfileMeta.objects.all()
+        visitations = ProfileVisitation.objects.all()
+        history = ProfileVisitHistory.objects.filter(
+            created_at__gte=min(since.values())
+        )
+        if meta_ids is not None:
+            meta_ids = set(meta_ids)
+            metas = metas.filter(pk__in=meta_ids)
+            visitations = visitations.filter(visited__in=meta_ids)
+            history = history.filter(user__in=metas.values("user_id"))
+
+        total = sum(
+            (
+                models.F(field.attname)
+                for field in ProfileVisitHistory._meta.fields
+                if field.attname.startswith("counter_")
+            ),
+            models.Value(0),
+        )
+        visits = {
+            row.pop("user_id"): row
+            for row in history.values("user_id").annotate(
+                **{
+                    name: models.Sum(total, filter=models.Q(created_at__gte=date))
+                    for name, date in since.items()
+                }
+            )
+        }
+        visitors = dict(
+            visitations.values("visited")
+            .annotate(count=models.Count("pk"))
+            .values_list("visited", "count")
+        )
+
+        summaries = []
+        for meta_id, user_id in metas.values_list("pk", "user_id"):
+            user_visits = visits.get(user_id, {})
+            summaries.append(
+                cls(
+                    meta_id=meta_id,
+                    visitors=visitors.get(meta_id, 0),
+                    refreshed_on=today,
+                    **{name: user_visits.get(name) or 0 for name in since},
+                )
+            )
+
+        existing = set(
+            cls.objects.filter(
+                pk__in=[summary.pk for summary in summaries]
+            ).values_list("pk", flat=True)
+            if meta_ids is not None
+            else cls.objects.values_list("pk", flat=True)
+        )
+        cls.objects.bulk_create(
+            [summary for summary in summaries if summary.pk not in existing],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+        cls.objects.bulk_update(
+            [summary for summary in summaries if summary.pk in existing],
+            [*cls.VISITS_FIELDS, "visitors", "refreshed_on"],
+            batch_size=1000,
+        )
+        return summaries
+
+    @classmethod
+    def count_visit(cls, user_id: int) -> None:
+        """Count a visit of the user's profile (ProfileVisitHistory)."""
+        if not cls.objects.filter(
+            meta__user_id=user_id, refreshed_on=timezone.now().date()
+        ).update(**{name: models.F(name) + 1 for name in cls.VISITS_FIELDS}):
+            cls.refresh(
+                ProfileMeta.objects.filter(user_id=user_id).values_list("pk", flat=True)
+            )
+
+    @classmethod
+    def count_visitor(cls, meta_id: int) -> None:
+        """Count a new profile visiting the profile (ProfileVisitation)."""
+        if not cls.objects.filter(
+            pk=meta_id, refreshed_on=timezone.now().date()
+        ).update(visitors=models.F("visitors") + 1):
+            cls.refresh([meta_id])
+
+    @classmethod
+    def prefetch(cls, metas: typing.Iterable["ProfileMeta"]) -> None:
+        """
+        Load summaries of given metas (e.g. page of profiles) in a single query,
+        recomputing missing or outdated ones.
+        """
+        metas = [meta for meta in metas if meta is not None]
+        models.prefetch_related_objects(metas, "visit_summary")
+        outdated = {
+            meta.pk: meta
+            for meta in metas
+            if not hasattr(meta, "visit_summary") or meta.visit_summary.is_outdated
+        }
+        if outdated:
+            for summary in cls.refresh(outdated):
+                outdated[summary.meta_id].visit_summary = summary
+
+    def __str__(self):
+        return f"Visits of {self.meta_id}: {self.visits_last_30_days} (30 days)"
+
+
+def get_random_shuffle_key() -> int:
+    return random.getrandbits(31)
+
+
+class ProfileSearchDocument(models.Model):
+    """
+    Denormalized filterable and sortable attributes of a listed profile.
+    Profile catalogue (ProfileListAPIFilter) filters and sorts by columns of
+    this single row instead of joining preferences, transfer status,
+    positions, metrics, labels, licences and promotion of each profile
+    (and deduplicating the join). Documents are refreshed by signals when
+    any of these changes and rebuilt nightly.
+    Shuffled catalogue is ordered by random `shuffle_key` mixed with a daily
+    seed of the user, the key is kept when the document is refreshed.
+    """
+
+    # fields assigned on document creation only
+    PRESERVED_FIELDS = ("shuffle_key",)
+
+    meta = models.OneToOneField(
+        "ProfileMeta",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    role = models.CharField(max_length=2)
+    # user preferences
+    birth_date = models.DateField(null=True)
+    gender = models.CharField(max_length=1, null=True)
+    citizenship = ArrayField(models.CharField(max_length=100), default=list)
+    localization = models.ForeignKey(
+        "cities_light.City", on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    spoken_languages = ArrayField(models.CharField(max_length=10), default=list)
+    # profile
+    positions = ArrayField(models.IntegerField(), default=list)
+    league = models.ForeignKey(
+        "clubs.League", on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    pm_score = models.IntegerField(null=True)
+    labels = ArrayField(models.CharField(max_length=255), default=list)
+    licences = ArrayField(models.CharField(max_length=255), default=list)
+    promoted_until = models.DateTimeField(null=True)
+    # transfer status, null if the profile has none
+    transfer_status = models.CharField(max_length=255, null=True)
+    transfer_leagues = ArrayField(models.IntegerField(), default=list)
+    transfer_additional_info = ArrayField(models.CharField(max_length=10), default=list)
+    transfer_benefits = ArrayField(models.CharField(max_length=255), default=list)
+    transfer_trainings = models.CharField(max_length=10, null=True)
+    transfer_salary = models.CharField(max_length=10, null=True)
+    refreshed_at = models.DateTimeField()
+    shuffle_key = models.IntegerField(default=get_random_shuffle_key)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["role", "birth_date"], name="search_doc_birth_date_idx"
+            ),
+            models.Index(fields=["role", "pm_score"], name="search_doc_pm_score_idx"),
+            models.Index(
+                fields=["role", "promoted_until"], name="search_doc_promoted_idx"
+            ),
+            models.Index(
+                fields=["role", "transfer_status"], name="search_doc_transfer_idx"
+            ),
+            GinIndex(fields=["positions"], name="search_doc_positions_gin"),
+            GinIndex(fields=["labels"], name="search_doc_labels_gin"),
+            GinIndex(fields=["licences"], name="search_doc_licences_gin"),
+            GinIndex(fields=["citizenship"], name="search_doc_citizenship_gin"),
+            GinIndex(fields=["spoken_languages"], name="search_doc_languages_gin"),
+            GinIndex(fields=["transfer_leagues"], name="search_doc_tr_leagues_gin"),
+        ]
+
+    @classmethod
+    def get_fields_to_update(cls) -> typing.List[str]:
+        return [
+            field.attname
+            for field in cls._meta.concrete_fields
+            if not field.primary_key and field.name not in cls.PRESERVED_FIELDS
+        ]
+
+    @classmethod
+    def refresh(
+        cls,
+        meta_ids: typing.Optional[typing.Iterable[int]] = None,
+        batch_size: int = 500,
+    ) -> int:
+        """
+        Rebuild documents of given profile metas (all of them if not given)
+        with a few queries per batch of profiles, return number of documents.
+        Documents of metas without a listed profile are removed.
+        """
+        started = timezone.now()
+        metas = ProfileMeta.objects.all()
+        if meta_ids is not None:
+            meta_ids = set(meta_ids)
+            if not meta_ids:
+                return 0
+            metas = metas.filter(pk__in=meta_ids)
+        metas_by_class = defaultdict(list)
+        for meta_id, profile_class in metas.order_by("pk").values_list(
+            "pk", "_profile_class"
+        ):
+            metas_by_class[profile_class.lower()].append(meta_id)
+
+        refreshed = set()
+        for model, role in REVERSED_MODEL_MAP.items():
+            model_meta_ids = metas_by_class.get(model.__name__.lower(), [])
+            for start in range(0, len(model_meta_ids), batch_size):
+                documents = cls.build(
+                    model, role, model_meta_ids[start : start + batch_size]
+                )
+                cls.save_documents(documents)
+                refreshed.update(document.pk for document in documents)
+
+        if meta_ids is None:
+            cls.objects.filter(refreshed_at__lt=started).delete()
+        else:
+            cls.objects.filter(pk__in=meta_ids - refreshed).delete()
+        return len(refreshed)
+
+    @classmethod
+    def refresh_missing(cls, batch_size: int = 500) -> int:
+        """
+        Build documents of profiles which have none, e.g. created without
+        signals (bulk_create, fixtures), as they aren't listed until then.
+        """
+        meta_ids = ProfileMeta.objects.filter(search_document__isnull=True)
+        return cls.refresh(meta_ids.values_list("pk", flat=True), batch_size)
+
+    @classmethod
+    def refresh_users(cls, user_ids: typing.Iterable[int]) -> int:
+        """Rebuild documents of all profiles of given users"""
+        return cls.refresh(
+            ProfileMeta.objects.filter(user_id__in=set(user_ids)).values_list(
+                "pk", flat=True
+            )
+        )
+
+    @classmethod
+    def build(
+        cls, model: typing.Type["BaseProfile"], role: str, meta_ids: typing.List[int]
+    ) -> typing.List["ProfileSearchDocument"]:
+        """Documents of profiles of given model and metas (not saved)"""
+        related = [
+            "user__userpreferences",
+            "meta__transfer_status",
+            "premium_products__promotion",
+        ]
+        prefetched = [
+            "user__userpreferences__spoken_languages",
+            "user__licences__licence",
+            "meta__transfer_status__league",
+        ]
+        if any(field.name == "team_object" for field in model._meta.fields):
+            related.append("team_object__league_history")
+        if model is PlayerProfile:
+            related.append("playermetrics")
+            prefetched.append("player_positions")
+        profiles = list(
+            model.objects.filter(meta_id__in=meta_ids)
+            .select_related(*related)
+            .prefetch_related(*prefetched)
+        )
+        labels = cls.get_labels(model, profiles)
+        now = timezone.now()
+        return [
+            cls.from_profile(profile, role, labels.get(profile.pk, set()), now)
+            for profile in profiles
+        ]
+
+    @staticmethod
+    def get_labels(
+        model: typing.Type["BaseProfile"], profiles: typing.List["BaseProfile"]
+    ) -> typing.Dict[int, typing.Set[str]]:
+        """
+        {profile id: label names} of given profiles, including labels of
+        their users, loaded with a single query
+        """
+        from labels.models import Label
+
+        profile_type = ContentType.objects.get_for_model(model)
+        user_type = ContentType.objects.get_for_model(User)
+        profile_ids = defaultdict(list)  # (content type id, object id): profiles
+        for profile in profiles:
+            profile_ids[(profile_type.pk, profile.pk)].append(profile.pk)
+            profile_ids[(user_type.pk, profile.user_id)].append(profile.pk)
+
+        labels = defaultdict(set)
+        rows = Label.objects.filter(
+            models.Q(
+                content_type=profile_type,
+                object_id__in=[profile.pk for profile in profiles],
+            )
+            | models.Q(
+                content_type=user_type,
+                object_id__in=[profile.user_id for profile in profiles],
+            ),
+            label_definition__isnull=False,
+        ).values_list("content_type_id", "object_id", "label_definition__label_name")
+        for content_type_id, object_id, label_name in rows:
+            for profile_id in profile_ids[(content_type_id, object_id)]:
+                labels[profile_id].add(label_name)
+        return labels
+
+    @classmethod
+    def from_profile(
+        cls,
+        profile: "BaseProfile",
+        role: str,
+        labels: typing.Set[str],
+        refreshed_at: datetime,
+    ) -> "ProfileSearchDocument":
+        """Document of profile with its relations already loaded"""
+        preferences = getattr(profile.user, "userpreferences", None)
+        transfer_status = getattr(profile.meta, "transfer_status", None)
+        promotion = getattr(profile.premium_products, "promotion", None)
+        metrics = getattr(profile, "playermetrics", None)
+        team = getattr(profile, "team_object", None)
+        league_history = getattr(team, "league_history", None)
+
+        spoken_languages, positions, transfer_leagues = set(), set(), set()
+        if preferences is not None:
+            spoken_languages = {
+                language.code for language in preferences.spoken_languages.all()
+            }
+        if isinstance(profile, PlayerProfile):
+            positions = {
+                position.player_position_id
+                for position in profile.player_positions.all()
+            }
+        if transfer_status is not None:
+            transfer_leagues = {league.pk for league in transfer_status.league.all()}
+
+        return cls(
+            meta_id=profile.meta_id,
+            role=role,
+            birth_date=getattr(preferences, "birth_date", None),
+            gender=getattr(preferences, "gender", None),
+            citizenship=list(getattr(preferences, "citizenship", None) or []),
+            localization_id=getattr(preferences, "localization_id", None),
+            spoken_languages=sorted(spoken_languages),
+            positions=sorted(positions),
+            league_id=getattr(league_history, "league_id", None),
+            pm_score=getattr(metrics, "pm_score", None),
+            labels=sorted(labels),
+            licences=sorted(
+                {licence.licence.name for licence in profile.user.licences.all()}
+            ),
+            promoted_until=getattr(promotion, "valid_until", None),
+            transfer_status=getattr(transfer_status, "status", None),
+            transfer_leagues=sorted(transfer_leagues),
+            transfer_additional_info=[
+                info
+                for info in getattr(transfer_status, "additional_info", None) or []
+                if info
+            ],
+            transfer_benefits=[
+                benefit
+                for benefit in getattr(transfer_status, "benefits", None) or []
+                if benefit
+            ],
+            transfer_trainings=getattr(transfer_status, "number_of_trainings", None),
+            transfer_salary=getattr(transfer_status, "salary", None),
+            refreshed_at=refreshed_at,
+        )
+
+    @classmethod
+    def save_documents(cls, documents: typing.List["ProfileSearchDocument"]) -> None:
+        existing = set(
+            cls.objects.filter(
+                pk__in=[document.pk for document in documents]
+            ).values_list("pk", flat=True)
+        )
+        cls.objects.bulk_create(
+            [document for document in documents if document.pk not in existing],
+            ignore_conflicts=True,
+        )
+        cls.objects.bulk_update(
+            [document for document in documents if document.pk in existing],
+            cls.get_fields_to_update(),
+        )
+
+    def __str__(self):
+        return f"Search document of {self.meta_id}"
+
+
 class Catalog(models.Model):
     name = models.CharField(max_length=255, unique=True, blank=True, null=True)
     slug = models.CharField(max_length=255, blank=False, null=False, editable=False)
@@ -2391,6 +2917,16 @@ class ProfileMeta(models.Model, VisitationMixin):
         """
         return getattr(self, self._profile_class.lower())
 
+    @property
+    def role(self) -> typing.Optional[str]:
+        """
+        Returns short role definition (P, T, C, ...) of the related profile,
+        without fetching the profile itself.
+        """
+        for role, model in PROFILE_MODEL_MAP.items():
+            if model.__name__.lower() == self._profile_class.lower():
+                return role
+
     @property
     def transfer_object(
         self,
@@ -32,6 +32,8 @@ from profiles.services import (
     PositionData,
     ProfileService,
     ProfileVisitHistoryService,
+    TeamContributorService,
+    TransferStatusService,
 )
 from roles.definitions import PROFILE_TYPE_SHORT_MAP
 from transfers.models import ProfileTransferStatus
@@ -118,6 +120,15 @@ class BaseProfileSerializer(serializers.ModelSerializer):
     promotion = PromoteProfileProductSerializer(read_only=True)
     social_stats = serializers.SerializerMethodField()
 
+    @staticmethod
+    def prefetch(profiles: List[PROFILE_TYPE]) -> None:
+        """
+        Load social stats and transfer objects of profiles to be serialized
+        (e.g. page of a list) in bulk, so they add no queries per profile.
+        """
+        ProfileService.prefetch_social_stats(profiles)
+        TransferStatusService.prefetch_transfer_objects(profiles)
+
     def get_social_stats(self, obj: BaseProfile) -> dict:
         """Get social stats for the profile."""
         request = self.context.get("request")
@@ -138,7 +149,7 @@ class BaseProfileSerializer(serializers.ModelSerializer):
     def get_visits(self, obj: BaseProfile) -> int:
         """Get profile visits from last month."""
         history_service = ProfileVisitHistoryService()
-        return history_service.profile_visit_history_last_month(obj.user)
+        return history_service.profile_visits_last_month(obj)
 
     def update(self, instance: PROFILE_TYPE, validated_data: dict):
         self.validate_data()
@@ -245,11 +256,7 @@ class BaseProfileSerializer(serializers.ModelSerializer):
 
             # Check if there is a primary team contributor for the team history
             if hasattr(instance, "team_object") and instance.team_object:
-                primary_contributor = instance.team_object.teamcontributor_set.filter(
-                    is_primary=True, profile_uuid=instance.uuid
-                ).first()
-
-                if primary_contributor:
+                if TeamContributorService.has_primary_contribution(instance):
                     team_history_serializer = TeamHistoryBaseProfileSerializer(
                         instance.team_object,
                         context=team_history_serializer_context,
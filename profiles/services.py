@@ -1,20 +1,20 @@
 import datetime
 import hashlib
+import json
 import logging
 import typing
 import uuid
 from dataclasses import dataclass, field
-from decimal import Decimal
 
 from cities_light.models import City
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import MultipleObjectsReturned
-from django.db import IntegrityError
+from django.db import IntegrityError, connections
 from django.db import models as django_base_models
 from django.db.models import (
     Case,
-    F,
+    Count,
     IntegerField,
     Model,
     ObjectDoesNotExist,
@@ -35,6 +35,7 @@ from clubs import services as club_services
 from clubs.models import Club as CClub
 from clubs.models import Team as CTeam
 from followers.models import GenericFollow
+from notifications.fanout import NotificationFanOut
 from notifications.tasks import create_notification
 from notifications.templates import NotificationBody, NotificationTemplate
 from profiles import errors, models, utils
@@ -61,7 +62,9 @@ from roles.definitions import (
     PlayerPositionShortcutsPL,
 )
 from users.models import User
-from utils import GENDER_BASED_ROLES, get_current_season
+from utils import GENDER_BASED_ROLES
+from utils.geo import distance_expression, filter_within_radius
+from utils.reference_data import reference_data
 
 logger = logging.getLogger(__name__)
 locale_service = LocaleDataService()
@@ -107,6 +110,7 @@ class NotificationService:
         """
         # Force Polish for consistent database storage
         with translation.override('pl'):
+            picture_user_id = picture_profile_role = None
             if profile := kwargs.pop("profile", None):
                 hide_profile = kwargs.pop("hide_profile", False)
                 full_name = profile.user.get_full_name()
@@ -119,21 +123,34 @@ class NotificationService:
                         gender_index = int(profile.user.userpreferences.gender == "K")
                         subject = GENDER_BASED_ROLES[role_short][gender_index]
                         kwargs["profile"] = f"{subject} {full_name}"
-                        kwargs["picture"] = profile.user.picture.name
-                        kwargs["picture_profile_role"] = role_short
+                        picture_user_id = profile.user_id
+                        picture_profile_role = role_short
                 except (KeyError, IndexError):
                     kwargs["profile"] = full_name
 
-            return NotificationBody(**template.value, kwargs=kwargs)
+            return NotificationBody(
+                **template.value,
+                picture_user_id=picture_user_id,
+                picture_profile_role=picture_profile_role,
+                kwargs=kwargs,
+            )
+
+    @classmethod
+    def bulk_notify(cls, template: NotificationTemplate) -> int:
+        """
+        Send notification based on the template to all eligible profiles.
+        Eligibility of each template is defined in notifications.fanout.
+        """
+        return NotificationFanOut(
+            template, cls.parse_body(template), cls.get_queryset()
+        ).run()
 
     @classmethod
     def bulk_notify_check_trial(cls) -> None:
         """
         Send notifications for users who haven't tested the trial.
         """
-        for meta in cls.get_queryset():
-            if meta.profile.products and not meta.profile.products.trial_tested:
-                cls(meta).notify_check_trial()
+        cls.bulk_notify(NotificationTemplate.CHECK_TRIAL)
 
     def notify_check_trial(self) -> None:
         """
@@ -149,9 +166,7 @@ class NotificationService:
         """
         Send notifications for non-premium users.
         """
-        for meta in cls.get_queryset():
-            if not meta.profile.is_premium:
-                cls(meta).notify_go_premium()
+        cls.bulk_notify(NotificationTemplate.GO_PREMIUM)
 
     def notify_go_premium(self) -> None:
         """
@@ -167,9 +182,7 @@ class NotificationService:
         """
         Send notifications for unverified profiles.
         """
-        for meta in cls.get_queryset():
-            if not meta.profile.external_links.links.exists():
-                cls(meta).notify_verify_profile()
+        cls.bulk_notify(NotificationTemplate.VERIFY_PROFILE)
 
     def notify_verify_profile(self) -> None:
         """
@@ -185,10 +198,7 @@ class NotificationService:
         """
         Send notifications for hidden profiles.
         """
-        for meta in cls.get_queryset().filter(
-            user__display_status=User.DisplayStatus.NOT_SHOWN
-        ):
-            cls(meta).notify_profile_hidden()
+        cls.bulk_notify(NotificationTemplate.PROFILE_HIDDEN)
 
     def notify_profile_hidden(self) -> None:
         """
@@ -213,8 +223,7 @@ class NotificationService:
         """
         Send notifications for new PM rankings.
         """
-        for meta in cls.get_queryset():
-            cls(meta).notify_pm_rank()
+        cls.bulk_notify(NotificationTemplate.PM_RANK)
 
     def notify_pm_rank(self) -> None:
         """
@@ -230,9 +239,7 @@ class NotificationService:
         """
         Send notifications for users with new visit summaries.
         """
-        for meta in cls.get_queryset():
-            if meta.count_who_visited_me > 0:
-                cls(meta).notify_visits_summary()
+        cls.bulk_notify(NotificationTemplate.VISITS_SUMMARY)
 
     def notify_visits_summary(self) -> None:
         """
@@ -310,11 +317,7 @@ class NotificationService:
         """
         Send notifications for setting transfer requests.
         """
-        for meta in cls.get_queryset().filter(
-            _profile_class__in=["coachprofile", "clubprofile", "managerprofile"]
-        ):
-            if not hasattr(meta, "transfer_request"):
-                cls(meta).notify_set_transfer_requests()
+        cls.bulk_notify(NotificationTemplate.SET_TRANSFER_REQUESTS)
 
     def notify_set_transfer_requests(self) -> None:
         """
@@ -330,9 +333,7 @@ class NotificationService:
         """
         Send notifications for setting status.
         """
-        for meta in cls.get_queryset().filter(_profile_class="playerprofile"):
-            if not hasattr(meta, "transfer_status"):
-                cls(meta).notify_set_status()
+        cls.bulk_notify(NotificationTemplate.SET_STATUS)
 
     def notify_set_status(self) -> None:
         """
@@ -348,8 +349,7 @@ class NotificationService:
         """
         Send notifications for inviting friends.
         """
-        for meta in cls.get_queryset():
-            cls(meta).notify_invite_friends()
+        cls.bulk_notify(NotificationTemplate.INVITE_FRIENDS)
 
     def notify_invite_friends(self) -> None:
         """
@@ -365,9 +365,7 @@ class NotificationService:
         """
         Send notifications for adding links.
         """
-        for meta in cls.get_queryset():
-            if meta.profile.external_links.links.count() == 0:
-                cls(meta).notify_add_links()
+        cls.bulk_notify(NotificationTemplate.ADD_LINKS)
 
     def notify_add_links(self) -> None:
         """
@@ -383,9 +381,7 @@ class NotificationService:
         """
         Send notifications for adding videos.
         """
-        for meta in cls.get_queryset().filter(_profile_class="playerprofile"):
-            if meta.user.user_video.count() == 0:
-                cls(meta).notify_add_video()
+        cls.bulk_notify(NotificationTemplate.ADD_VIDEO)
 
     def notify_add_video(self) -> None:
         """
@@ -410,17 +406,14 @@ class NotificationService:
         """
         Test notification.
         """
-        for meta in cls.get_queryset().filter(user__is_staff=True):
-            cls(meta).notify_test()
+        cls.bulk_notify(NotificationTemplate.TEST)
 
     @classmethod
     def bulk_notify_assign_club(cls) -> None:
         """
         Send notifications for assigning clubs.
         """
-        for meta in cls.get_queryset():
-            if not meta.profile.team_history_object:
-                cls(meta).notify_assign_club()
+        cls.bulk_notify(NotificationTemplate.ASSIGN_CLUB)
 
     def notify_assign_club(self) -> None:
         """
@@ -617,6 +610,74 @@ class ProfileVerificationService:
 
 
 class ProfileService:
+    SOCIAL_STATS_ATTR = "_social_stats"
+
+    @classmethod
+    def prefetch_social_stats(cls, profiles: typing.Iterable[BaseProfile]) -> None:
+        """
+        Count followers, following and visitors of users of given profiles
+        (e.g. page of a list) with one grouped query each and attach them
+        to the users, to be read by UserSocialStatsSerializer.
+        """
+        users = {
+            profile.user_id: profile.user for profile in profiles if profile is not None
+        }
+        if not users:
+            return
+        # counted for the profile of user's role, usually the listed profile
+        user_profiles = {user_id: user.profile for user_id, user in users.items()}
+        subjects = [profile for profile in user_profiles.values() if profile]
+
+        followers_condition = Q(pk__in=[])
+        content_types = ContentType.objects.get_for_models(
+            *{type(profile) for profile in subjects}
+        )
+        for model, content_type in content_types.items():
+            followers_condition |= Q(
+                content_type=content_type,
+                object_id__in=[p.pk for p in subjects if type(p) is model],
+            )
+        followers = {
+            (content_type_id, object_id): count
+            for content_type_id, object_id, count in GenericFollow.objects.filter(
+                followers_condition
+            )
+            .values("content_type", "object_id")
+            .annotate(count=Count("pk"))
+            .values_list("content_type", "object_id", "count")
+            .order_by()
+        }
+        following = dict(
+            GenericFollow.objects.filter(user_id__in=users)
+            .values("user_id")
+            .annotate(count=Count("pk"))
+            .values_list("user_id", "count")
+            .order_by()
+        )
+        views = dict(
+            models.ProfileVisitation.objects.filter(
+                visited_id__in={profile.meta_id for profile in subjects}
+            )
+            .values("visited_id")
+            .annotate(count=Count("pk"))
+            .values_list("visited_id", "count")
+            .order_by()
+        )
+
+        for user_id, user in users.items():
+            profile = user_profiles[user_id]
+            if profile:
+                content_type = content_types[type(profile)]
+                profile_followers = followers.get((content_type.pk, profile.pk), 0)
+                profile_views = views.get(profile.meta_id, 0)
+            else:
+                profile_followers = profile_views = 0
+            user.__dict__[cls.SOCIAL_STATS_ATTR] = {
+                "followers": profile_followers,
+                "views": profile_views,
+                "following": following.get(user_id, 0),
+            }
+
     @staticmethod
     def set_and_create_user_profile(user: User) -> models.PROFILE_TYPE:
         """get type of profile and create profile"""
@@ -750,30 +811,32 @@ class ProfileService:
         """
         Search for users whose concatenated first name and last name
         match the given search term.
-        The search is case-insensitive and space-insensitive
+        The search is case-insensitive, accent-insensitive and space-insensitive.
+        Matching is done on indexed User.search_name, users whose name starts
+        with the search term are ranked first.
         """
         # Validate the search term
         if not search_term or len(search_term) < 3:
             raise ValueError("Search term must be at least 3 characters long.")
         search_term = utils.preprocess_search_term(search_term)
 
-        # First, get users who have a declared role
-        users_with_declared_role = User.objects.filter(
-            Q(declared_role__isnull=False) | Q(historical_role__isnull=False)
-        )
-        # Then, apply the custom search term processing
-        matching_users = filter(
-            lambda user: search_term
-            in utils.preprocess_search_term(
-                (user.first_name or "") + " " + (user.last_name or "")
+        return (
+            User.objects.listed()
+            .filter(
+                Q(declared_role__isnull=False) | Q(historical_role__isnull=False),
+                search_name__contains=search_term,
             )
-            and user.should_be_listed,
-            users_with_declared_role,
+            .annotate(
+                search_rank=Case(
+                    When(search_name__startswith=search_term, then=Value(0)),
+                    default=Value(1),
+                    output_field=IntegerField(),
+                ),
+                search_name_length=django_base_functions.Length("search_name"),
+            )
+            .order_by("search_rank", "search_name_length", "search_name", "pk")
         )
 
-        matching_user_ids = [user.id for user in matching_users]
-        return User.objects.filter(id__in=matching_user_ids)
-
     @staticmethod
     def is_player_or_guest_profile(profile) -> bool:
         return type(profile).__name__.lower() in ["playerprofile", "guestprofile"]
@@ -811,75 +874,128 @@ class ProfileService:
     @staticmethod
     def get_cities_nearby(city: City, radius: int = 60) -> QuerySet:
         """
-        Get cities nearby the given city.
-        This method filters cities based on their geographical location.
+        Get cities nearby the given city, ordered by distance.
+        Cities are prefiltered with bounding box on their (indexed) coordinates.
         """
+        if city.latitude is None or city.longitude is None:
+            return City.objects.none()
+        return filter_within_radius(
+            City.objects.all(), city.latitude, city.longitude, radius
+        ).order_by("distance")
 
-        latitude = city.latitude
-        longitude = city.longitude
-        earth_radius = 6371  # km
-
-        return (
-            City.objects.annotate(
-                distance=earth_radius
-                * django_base_functions.ACos(
-                    django_base_functions.Cos(django_base_functions.Radians(latitude))
-                    * django_base_functions.Cos(
-                        django_base_functions.Radians(F("latitude"))
-                    )
-                    * django_base_functions.Cos(
-                        django_base_functions.Radians(F("longitude"))
-                        - django_base_functions.Radians(longitude)
-                    )
-                    + django_base_functions.Sin(django_base_functions.Radians(latitude))
-                    * django_base_functions.Sin(
-                        django_base_functions.Radians(F("latitude"))
-                    )
-                )
+    @staticmethod
+    def annotate_city_distance(
+        queryset: QuerySet, city: City, user_relation: str = "user"
+    ) -> QuerySet:
+        """
+        Annotate profiles with distance between their city and the given one,
+        NULL if the given city has no coordinates.
+        """
+        if city.latitude is None or city.longitude is None:
+            return queryset.annotate(
+                city_distance=Value(None, output_field=django_base_models.FloatField())
+            )
+        localization = f"{user_relation}__userpreferences__localization"
+        return queryset.annotate(
+            city_distance=distance_expression(
+                city.latitude,
+                city.longitude,
+                f"{localization}__latitude",
+                f"{localization}__longitude",
             )
-            .filter(distance__lt=radius)
-            .order_by("distance")
         )
 
 
 class ProfileFilterService:
     profile_service = ProfileService
 
+    # relation from filtered profiles to their ProfileSearchDocument
+    SEARCH_DOCUMENT = "meta__search_document"
+
+    @staticmethod
+    def estimate_count(queryset: django_base_models.QuerySet) -> typing.Optional[int]:
+        """
+        Estimate number of distinct objects based on query planner statistics,
+        without executing the query. None if estimation is not available.
+        """
+        if connections[queryset.db].vendor != "postgresql":
+            return None
+        try:
+            plan = queryset.values("pk").distinct().explain(format="json")
+            return int(json.loads(plan)[0]["Plan"]["Plan Rows"])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logger.warning(f"Unable to estimate queryset count: {e}")
+            return None
+
+    @classmethod
+    def count_profiles(
+        cls, queryset: django_base_models.QuerySet, approximate_from: int
+    ) -> typing.Tuple[int, bool]:
+        """
+        Count profiles with single COUNT(DISTINCT id) query.
+        For broad filters (estimated at least `approximate_from` profiles)
+        estimation is returned instead. Returns (count, is_approximate).
+        """
+        queryset = queryset.order_by()
+        estimate = cls.estimate_count(queryset)
+        if estimate is not None and estimate >= approximate_from:
+            return estimate, True
+        count = django_base_models.Count("pk", distinct=True)
+        return queryset.aggregate(count=count)["count"], False
+
     @staticmethod
     def filter_youth_players(
-        queryset: django_base_models.QuerySet,
+        queryset: django_base_models.QuerySet, document: str = SEARCH_DOCUMENT
     ) -> django_base_models.QuerySet:
         """Filter profiles queryset to get profiles of youth users (under 21 yo)"""
         max_youth_birth_date = utils.get_past_date(years=21)
-        return queryset.filter(
-            user__userpreferences__birth_date__gte=max_youth_birth_date
-        )
+        return queryset.filter(**{f"{document}__birth_date__gte": max_youth_birth_date})
 
     @staticmethod
     def filter_min_age(
-        queryset: django_base_models.QuerySet, age: int
+        queryset: django_base_models.QuerySet,
+        age: int,
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
         """Filter profile queryset with minimum user age"""
         min_birth_date = utils.get_past_date(years=age)
-        return queryset.exclude(user__userpreferences__birth_date__isnull=True).filter(
-            user__userpreferences__birth_date__lte=min_birth_date
-        )
+        return queryset.filter(**{f"{document}__birth_date__lte": min_birth_date})
 
     @staticmethod
     def filter_max_age(
-        queryset: django_base_models.QuerySet, age: int
+        queryset: django_base_models.QuerySet,
+        age: int,
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
         """Filter profile queryset with maximum user age"""
         max_birth_date = utils.get_past_date(years=age + 1)
-        return queryset.exclude(user__userpreferences__birth_date__isnull=True).filter(
-            user__userpreferences__birth_date__gte=max_birth_date
-        )
+        return queryset.filter(**{f"{document}__birth_date__gte": max_birth_date})
+
+    @staticmethod
+    def shuffle(
+        queryset: django_base_models.QuerySet,
+        seed: int,
+        document: str = SEARCH_DOCUMENT,
+    ) -> django_base_models.QuerySet:
+        """
+        Order queryset randomly, but the same way for the same seed: by random
+        key of search document XOR-ed with the seed (stable between pages).
+        """
+        return queryset.annotate(
+            shuffle_order=django_base_models.F(f"{document}__shuffle_key").bitxor(seed)
+        ).order_by("shuffle_order", "pk")
 
     @staticmethod
     def filter_player_position(
-        queryset: django_base_models.QuerySet, positions: list
+        queryset: django_base_models.QuerySet,
+        positions: list,
+        seed: int = 0,
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
-        """Filter profile queryset with maximum user age"""
+        """
+        Filter profile queryset by position shortcuts, main positions first,
+        then shuffled by given seed.
+        """
         return (
             queryset.filter(player_positions__player_position__shortcut__in=positions)
             .annotate(
@@ -892,58 +1008,43 @@ class ProfileFilterService:
                     output_field=django_base_models.BooleanField(),
                 )
             )
-            .order_by("-is_main_for_positions", "?")
+            .annotate(
+                shuffle_order=django_base_models.F(f"{document}__shuffle_key").bitxor(
+                    seed
+                )
+            )
+            .order_by("-is_main_for_positions", "shuffle_order", "pk")
         )
 
     @staticmethod
     def filter_qs_by_player_position_id(
-        queryset: django_base_models.QuerySet, positions: typing.List[int]
+        queryset: django_base_models.QuerySet,
+        positions: typing.List[int],
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
         """Filter queryset by player position id."""
-        return queryset.filter(player_positions__player_position_id__in=positions)
+        return queryset.filter(**{f"{document}__positions__overlap": positions})
 
     @staticmethod
     def filter_league(
-        queryset: django_base_models.QuerySet, league_ids: list
+        queryset: django_base_models.QuerySet,
+        league_ids: list,
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
         """
-        Filter a queryset of profiles based on their association with the specified
-        league IDs.
-
-        The method prioritizes profiles who are associated with the leagues in the
-        current season. If a profile has been associated with one of the given leagues in
-        the current season, they are included in the results.
-        If they haven't been associated in the current season but have been in
-        past seasons, they are also included. However, profiles with current season
-        associations are prioritized over those with only past associations.
+        Filter a queryset of profiles based on the league of their team
+        (team_object), in any season.
         """
-        current_season = get_current_season()
-
-        distinct_user_ids = (
-            queryset.filter(team_object__league_history__league__in=league_ids)
-            .annotate(
-                is_current_season=Case(
-                    When(
-                        team_object__league_history__season__name=current_season,
-                        then=Value(1),
-                    ),
-                    default=Value(0),
-                    output_field=IntegerField(),
-                )
-            )
-            .order_by("user_id", "-is_current_season")
-            .values_list("user_id", flat=True)
-            .distinct()
-        )
-
-        return queryset.filter(user_id__in=distinct_user_ids)
+        return queryset.filter(**{f"{document}__league__in": league_ids})
 
     @staticmethod
     def filter_player_gender(
-        queryset: django_base_models.QuerySet, gender: str
+        queryset: django_base_models.QuerySet,
+        gender: str,
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
         """Filter player's queryset by gender"""
-        return queryset.filter(user__userpreferences__gender__in=gender)
+        return queryset.filter(**{f"{document}__gender__in": gender})
 
     @staticmethod
     def filter_localization(
@@ -951,64 +1052,48 @@ class ProfileFilterService:
         latitude: float,
         longitude: float,
         radius: int,
-        user_relation: str = "user",
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
         """
         Filter queryset with objects within radius based on
         longitude, latitude and radius (radius distance from target).
-        Function uses Haversine formula (distance between two points on a sphere)
+        Cities within radius are looked up first (bounding box on indexed
+        coordinates + Haversine formula), then objects are filtered by city.
         """
-        earth_radius = 6371
-        latitude = Decimal(latitude)
-        longitude = Decimal(longitude)
-
-        return queryset.annotate(
-            distance=earth_radius
-            * django_base_functions.ACos(
-                django_base_functions.Cos(django_base_functions.Radians(latitude))
-                * django_base_functions.Cos(
-                    django_base_functions.Radians(
-                        f"{user_relation}__userpreferences__localization__latitude"
-                    )
-                )
-                * django_base_functions.Cos(
-                    django_base_functions.Radians(
-                        f"{user_relation}__userpreferences__localization__longitude"
-                    )
-                    - django_base_functions.Radians(longitude)
-                )
-                + django_base_functions.Sin(django_base_functions.Radians(latitude))
-                * django_base_functions.Sin(
-                    django_base_functions.Radians(
-                        f"{user_relation}__userpreferences__localization__latitude"
-                    )
-                )
-            )
-        ).filter(distance__lt=radius)
+        cities = filter_within_radius(City.objects.all(), latitude, longitude, radius)
+        return queryset.filter(**{f"{document}__localization__in": cities})
 
     @staticmethod
     def filter_country(
-        queryset: django_base_models.QuerySet, country: list
+        queryset: django_base_models.QuerySet,
+        country: list,
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
         """
         Validate each country code, then return queryset filtered by given countries
         """
         return queryset.filter(
-            user__userpreferences__citizenship__overlap=[
-                locale_service.validate_country_code(code) for code in country
-            ]
+            **{
+                f"{document}__citizenship__overlap": [
+                    locale_service.validate_country_code(code) for code in country
+                ]
+            }
         )
 
     @staticmethod
     def filter_language(
-        queryset: django_base_models.QuerySet, language: list
+        queryset: django_base_models.QuerySet,
+        language: list,
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
         """Validate each language code, then return queryset filtered by given
         spoken languages"""
         return queryset.filter(
-            user__userpreferences__spoken_languages__code__in=[
-                locale_service.validate_language_code(code) for code in language
-            ]
+            **{
+                f"{document}__spoken_languages__overlap": [
+                    locale_service.validate_language_code(code) for code in language
+                ]
+            }
         )
 
     @staticmethod
@@ -1049,9 +1134,29 @@ class ProfileFilterService:
         ).values_list("object_id", flat=True)
         return list(followed_profile_ids)
 
+    @staticmethod
+    def filter_licences(
+        queryset: QuerySet,
+        licence_names: typing.List[str],
+        document: str = SEARCH_DOCUMENT,
+    ) -> QuerySet:
+        """Filter profiles of users having any of given licences"""
+        return queryset.filter(**{f"{document}__licences__overlap": licence_names})
+
+    @staticmethod
+    def filter_labels(
+        queryset: QuerySet,
+        label_names: typing.List[str],
+        document: str = SEARCH_DOCUMENT,
+    ) -> QuerySet:
+        """Filter profiles having (or whose users have) any of given labels"""
+        return queryset.filter(**{f"{document}__labels__overlap": label_names})
+
     @staticmethod
     def filter_transfer_status(
-        queryset: django_base_models.QuerySet, statuses: list
+        queryset: django_base_models.QuerySet,
+        statuses: list,
+        document: str = SEARCH_DOCUMENT,
     ) -> django_base_models.QuerySet:
         """
         Filter a queryset of profiles based on multiple transfer statuses.
@@ -1064,60 +1169,74 @@ class ProfileFilterService:
         condition = Q()
         for status in statuses:
             if status == "5":
-                condition |= Q(meta__transfer_status__isnull=True)
+                condition |= Q(**{f"{document}__transfer_status__isnull": True})
             else:
-                condition |= Q(meta__transfer_status__status=status)
+                condition |= Q(**{f"{document}__transfer_status": status})
 
         return queryset.filter(condition)
 
     @staticmethod
     def filter_by_transfer_status_league(
-        queryset: QuerySet, league_ids: typing.List[int]
+        queryset: QuerySet,
+        league_ids: typing.List[int],
+        document: str = SEARCH_DOCUMENT,
     ) -> QuerySet:
         """
         Filter the queryset based on the league IDs associated with the profile's transfer status.
         """
-        return queryset.filter(meta__transfer_status__league__id__in=league_ids)
+        return queryset.filter(**{f"{document}__transfer_leagues__overlap": league_ids})
 
     @staticmethod
     def filter_by_additional_info(
-        queryset: QuerySet, info: typing.List[str]
+        queryset: QuerySet, info: typing.List[str], document: str = SEARCH_DOCUMENT
     ) -> QuerySet:
         """
         Filter the queryset based on additional information associated with the profile's transfer status.
         """
-        return queryset.filter(meta__transfer_status__additional_info__overlap=info)
+        return queryset.filter(
+            **{f"{document}__transfer_additional_info__overlap": info}
+        )
 
     @staticmethod
-    def filter_by_number_of_trainings(queryset: QuerySet, trainings: str) -> QuerySet:
+    def filter_by_number_of_trainings(
+        queryset: QuerySet, trainings: str, document: str = SEARCH_DOCUMENT
+    ) -> QuerySet:
         """
         Filter the queryset based on the number of trainings specified in the profile's transfer status.
         """
-        return queryset.filter(meta__transfer_status__number_of_trainings=trainings)
+        return queryset.filter(**{f"{document}__transfer_trainings": trainings})
 
     @staticmethod
-    def filter_by_benefits(queryset: QuerySet, benefits: typing.List[str]) -> QuerySet:
+    def filter_by_benefits(
+        queryset: QuerySet, benefits: typing.List[str], document: str = SEARCH_DOCUMENT
+    ) -> QuerySet:
         """
         Filter the queryset based on benefits associated with the profile's transfer status.
         """
-        return queryset.filter(meta__transfer_status__benefits__overlap=benefits)
+        return queryset.filter(**{f"{document}__transfer_benefits__overlap": benefits})
 
     @staticmethod
-    def filter_by_salary(queryset: QuerySet, salary: str) -> QuerySet:
+    def filter_by_salary(
+        queryset: QuerySet, salary: str, document: str = SEARCH_DOCUMENT
+    ) -> QuerySet:
         """
         Filter the queryset based on the salary specified in the profile's transfer status.
         """
-        return queryset.filter(meta__transfer_status__salary=salary)
+        return queryset.filter(**{f"{document}__transfer_salary": salary})
 
     @staticmethod
-    def filter_min_pm_score(queryset: QuerySet, min_score: int) -> QuerySet:
+    def filter_min_pm_score(
+        queryset: QuerySet, min_score: int, document: str = SEARCH_DOCUMENT
+    ) -> QuerySet:
         """Filter profiles with a minimum PlayMaker Score"""
-        return queryset.filter(playermetrics__pm_score__gte=min_score)
+        return queryset.filter(**{f"{document}__pm_score__gte": min_score})
 
     @staticmethod
-    def filter_max_pm_score(queryset: QuerySet, max_score: int) -> QuerySet:
+    def filter_max_pm_score(
+        queryset: QuerySet, max_score: int, document: str = SEARCH_DOCUMENT
+    ) -> QuerySet:
         """Filter profiles with a maximum PlayMaker Score"""
-        return queryset.filter(playermetrics__pm_score__lte=max_score)
+        return queryset.filter(**{f"{document}__pm_score__lte": max_score})
 
     @staticmethod
     def filter_by_position(
@@ -1445,6 +1564,42 @@ class ProfileVideoService:
 
 class TeamContributorService:
     profile_service = ProfileService()
+    PRIMARY_CONTRIBUTION_ATTR = "_has_primary_contribution"
+
+    @classmethod
+    def prefetch_primary_contributions(
+        cls, profiles: typing.Iterable[BaseProfile]
+    ) -> None:
+        """
+        Check in bulk (e.g. for page of a list) if profiles are primary
+        contributors of their current team, read by `has_primary_contribution`.
+        """
+        profiles = [
+            profile
+            for profile in profiles
+            if profile is not None and getattr(profile, "team_object_id", None)
+        ]
+        if not profiles:
+            return
+        primary = set(
+            models.TeamContributor.objects.filter(
+                is_primary=True,
+                profile_uuid__in={profile.uuid for profile in profiles},
+                team_history__in={profile.team_object_id for profile in profiles},
+            ).values_list("profile_uuid", "team_history")
+        )
+        for profile in profiles:
+            profile.__dict__[cls.PRIMARY_CONTRIBUTION_ATTR] = (
+                profile.uuid,
+                profile.team_object_id,
+            ) in primary
+
+    @classmethod
+    def has_primary_contribution(cls, profile: BaseProfile) -> bool:
+        """Whether profile is primary contributor of its current team"""
+        if cls.PRIMARY_CONTRIBUTION_ATTR not in profile.__dict__:
+            cls.prefetch_primary_contributions([profile])
+        return profile.__dict__.get(cls.PRIMARY_CONTRIBUTION_ATTR, False)
 
     @staticmethod
     def get_team_contributor_or_404(team_contributor_id: int) -> models.TeamContributor:
@@ -2127,20 +2282,20 @@ class LanguageService:
     def get_language_by_id(language_id: int) -> models.Language:
         """Get a language by id."""
         try:
-            language = models.Language.objects.get(id=language_id)
-            return language
-        except models.Language.DoesNotExist:
-            raise errors.LanguageDoesNotExistException()
-        except TypeError:
+            language_id = int(language_id)
+        except (TypeError, ValueError):
             raise errors.ExpectedIntException
+        try:
+            return reference_data.get("languages").by_id[language_id]
+        except KeyError:
+            raise errors.LanguageDoesNotExistException()
 
     @staticmethod
     def get_language_by_code(code: str) -> models.Language:
         """Get a Language by code."""
         try:
-            language = models.Language.objects.get(code=code)
-            return language
-        except models.Language.DoesNotExist:
+            return reference_data.get("languages").by_code[code]
+        except KeyError:
             raise errors.LanguageDoesNotExistException()
         except TypeError:
             raise errors.ExpectedIntException
@@ -2149,6 +2304,20 @@ class LanguageService:
 class TransferStatusService:
     """Service for transfer status operation."""
 
+    @staticmethod
+    def prefetch_transfer_objects(profiles: typing.Iterable[BaseProfile]) -> None:
+        """
+        Load transfer requests and statuses of given profiles (e.g. page
+        of a list) in bulk, so `ProfileMeta.transfer_object` does not query.
+        """
+        profiles = [profile for profile in profiles if profile is not None]
+        django_base_models.prefetch_related_objects(profiles, "meta")
+        django_base_models.prefetch_related_objects(
+            [profile.meta for profile in profiles if profile.meta is not None],
+            "transfer_request",
+            "transfer_status__league",
+        )
+
     @staticmethod
     def prepare_generic_type_content(
         content: dict, profile: models.BaseProfile
@@ -2293,6 +2462,12 @@ class ProfileVisitHistoryService:
         """Increment the profile visit count for a user."""
         instance.increment(requestor=requestor)
 
+    def register_visit(
+        self, user: User, requestor: typing.Union[BaseProfile, AnonymousUser]
+    ) -> None:
+        """Count a visit of the user's profile in today's visit history."""
+        self.model.register_visit(user=user, requestor=requestor)
+
     def create(self, **kwargs) -> models.ProfileVisitHistory:
         """Create a new profile visit history entry with specified kwargs."""
         return self.model.objects.create(**kwargs)
@@ -2303,6 +2478,23 @@ class ProfileVisitHistoryService:
             user=user, date=utils.get_past_date(days=30)
         )
 
+    @staticmethod
+    def prefetch_visit_summaries(profiles: typing.Iterable[BaseProfile]) -> None:
+        """Load visit summaries of given profiles (e.g. page of a list) in bulk."""
+        profiles = [profile for profile in profiles if profile is not None]
+        django_base_models.prefetch_related_objects(profiles, "meta")
+        models.ProfileVisitSummary.prefetch(profile.meta for profile in profiles)
+
+    def profile_visits_last_month(self, profile: BaseProfile) -> int:
+        """
+        Get the total number of visits of profile's user in the last 30 days,
+        read from precomputed visit summary.
+        """
+        if profile.meta is None:
+            return self.profile_visit_history_last_month(profile.user)
+        self.prefetch_visit_summaries([profile])
+        return profile.meta.visit_summary.visits_last_30_days
+
 
 class RandomizationService:
     @staticmethod
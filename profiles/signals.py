@@ -1,16 +1,23 @@
 import logging
 
-from django.db.models.signals import post_save
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
+from clubs.models import Season
+from labels.models import Label, LabelDefinition
+from premium.models import PromoteProfileProduct
 from profiles.services import NotificationService
 from profiles.tasks import (
     create_post_create_profile__periodic_tasks,
     post_create_other_profile,
     post_create_player_profile,
 )
-from users.models import User
+from transfers.models import ProfileTransferStatus
+from users.models import User, UserPreferences
+from utils.cache import REFERENCE_DATA_TAG, invalidate_cache_tags, role_tag
+from utils.reference_data import reference_data
 
 from . import models
 
@@ -85,3 +92,156 @@ def post_profile_visitation(sender, instance, created, **kwargs):
     """
     if created:
         NotificationService(instance.visited.profile.meta).notify_profile_visited()
+
+
+@receiver(post_save, sender=models.PlayerProfile)
+@receiver(post_save, sender=models.CoachProfile)
+@receiver(post_save, sender=models.ClubProfile)
+@receiver(post_save, sender=models.ManagerProfile)
+@receiver(post_save, sender=models.ScoutProfile)
+@receiver(post_save, sender=models.GuestProfile)
+@receiver(post_save, sender=models.RefereeProfile)
+@receiver(post_delete, sender=models.PlayerProfile)
+@receiver(post_delete, sender=models.CoachProfile)
+@receiver(post_delete, sender=models.ClubProfile)
+@receiver(post_delete, sender=models.ManagerProfile)
+@receiver(post_delete, sender=models.ScoutProfile)
+@receiver(post_delete, sender=models.GuestProfile)
+@receiver(post_delete, sender=models.RefereeProfile)
+def invalidate_profile_listings(sender, instance, **kwargs):
+    """
+    Invalidate cached profile listings of the profile role.
+    """
+    invalidate_cache_tags(role_tag(models.REVERSED_MODEL_MAP[sender]))
+
+
+@receiver(post_save, sender=Season)
+@receiver(post_save, sender=models.PlayerPosition)
+@receiver(post_save, sender=models.LicenceType)
+@receiver(post_save, sender=models.Language)
+@receiver(post_save, sender=LabelDefinition)
+@receiver(post_delete, sender=Season)
+@receiver(post_delete, sender=models.PlayerPosition)
+@receiver(post_delete, sender=models.LicenceType)
+@receiver(post_delete, sender=models.Language)
+@receiver(post_delete, sender=LabelDefinition)
+def reference_data_changed(sender, instance, **kwargs):
+    """
+    Forget reference data loaded by this and other processes.
+    """
+    reference_data.clear()
+    invalidate_cache_tags(REFERENCE_DATA_TAG)
+
+
+def refresh_player_search_documents(*player_ids: int) -> None:
+    models.ProfileSearchDocument.refresh(
+        models.PlayerProfile.objects.filter(
+            pk__in=player_ids, meta__isnull=False
+        ).values_list("meta_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=models.PlayerProfile)
+@receiver(post_save, sender=models.CoachProfile)
+@receiver(post_save, sender=models.ClubProfile)
+@receiver(post_save, sender=models.ManagerProfile)
+@receiver(post_save, sender=models.ScoutProfile)
+@receiver(post_save, sender=models.GuestProfile)
+@receiver(post_save, sender=models.RefereeProfile)
+@receiver(post_delete, sender=models.PlayerProfile)
+@receiver(post_delete, sender=models.CoachProfile)
+@receiver(post_delete, sender=models.ClubProfile)
+@receiver(post_delete, sender=models.ManagerProfile)
+@receiver(post_delete, sender=models.ScoutProfile)
+@receiver(post_delete, sender=models.GuestProfile)
+@receiver(post_delete, sender=models.RefereeProfile)
+def profile_search_document_changed(sender, instance, **kwargs):
+    """
+    Rebuild search document of the profile (removed with the profile).
+    """
+    if instance.meta_id:
+        models.ProfileSearchDocument.refresh([instance.meta_id])
+
+
+@receiver(post_save, sender=UserPreferences)
+@receiver(post_save, sender=models.CoachLicence)
+@receiver(post_delete, sender=models.CoachLicence)
+def user_search_documents_changed(sender, instance, **kwargs):
+    """
+    Rebuild search documents of all profiles of the user.
+    """
+    user_id = instance.owner_id if sender is models.CoachLicence else instance.user_id
+    models.ProfileSearchDocument.refresh_users([user_id])
+
+
+@receiver(m2m_changed, sender=UserPreferences.spoken_languages.through)
+def spoken_languages_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Rebuild search documents of users whose spoken languages changed.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        models.ProfileSearchDocument.refresh_users([instance.user_id])
+    elif pk_set:
+        models.ProfileSearchDocument.refresh_users(
+            UserPreferences.objects.filter(pk__in=pk_set).values_list(
+                "user_id", flat=True
+            )
+        )
+
+
+@receiver(post_save, sender=models.PlayerProfilePosition)
+@receiver(post_delete, sender=models.PlayerProfilePosition)
+def player_position_changed(sender, instance, **kwargs):
+    refresh_player_search_documents(instance.player_profile_id)
+
+
+@receiver(post_save, sender=models.PlayerMetrics)
+def player_metrics_changed(sender, instance, **kwargs):
+    refresh_player_search_documents(instance.player_id)
+
+
+@receiver(post_save, sender=ProfileTransferStatus)
+@receiver(post_delete, sender=ProfileTransferStatus)
+def transfer_status_changed(sender, instance, **kwargs):
+    models.ProfileSearchDocument.refresh([instance.meta_id])
+
+
+@receiver(m2m_changed, sender=ProfileTransferStatus.league.through)
+def transfer_status_leagues_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        models.ProfileSearchDocument.refresh([instance.meta_id])
+    elif pk_set:
+        models.ProfileSearchDocument.refresh(
+            ProfileTransferStatus.objects.filter(pk__in=pk_set).values_list(
+                "meta_id", flat=True
+            )
+        )
+
+
+@receiver(post_save, sender=Label)
+@receiver(post_delete, sender=Label)
+def label_changed(sender, instance, **kwargs):
+    """
+    Rebuild search documents of the labelled profile or user.
+    """
+    model = ContentType.objects.get_for_id(instance.content_type_id).model_class()
+    if model is User:
+        models.ProfileSearchDocument.refresh_users([instance.object_id])
+    elif model in models.REVERSED_MODEL_MAP:
+        models.ProfileSearchDocument.refresh(
+            model.objects.filter(pk=instance.object_id, meta__isnull=False).values_list(
+                "meta_id", flat=True
+            )
+        )
+
+
+@receiver(post_save, sender=PromoteProfileProduct)
+def promotion_changed(sender, instance, **kwargs):
+    if user_id := getattr(instance.product, "user_id", None):
+        models.ProfileSearchDocument.refresh_users([user_id])
@@ -8,6 +8,7 @@ from django_celery_beat.models import ClockedSchedule, PeriodicTask
 from mailing.schemas import EmailTemplateRegistry
 from mailing.services import MailingService
 from mailing.utils import build_email_context
+from premium.snapshot import invalidate_premium_products
 from profiles import models as profile_models
 from profiles.services import NotificationService
 
@@ -42,6 +43,8 @@ def setup_premium_profile(
     if premium.is_trial and premium_type != profile_models.PremiumType.TRIAL:
         pp_object.inquiries.reset_counter(reset_plan=False)
 
+    invalidate_premium_products(pp_object.pk)
+
 
 @shared_task
 def check_profile_one_hour_after(profile_id: int, model_name: str) -> None:
@@ -200,3 +203,30 @@ def post_create_other_profile(pk: int, profile_class_name: str) -> None:
         template = EmailTemplateRegistry.PROFESSIONAL_WELCOME
         context = build_email_context(profile.user, mailing_type=template.mailing_type)
         MailingService(template(context)).send_mail(profile.user)
+
+
+@shared_task
+def refresh_profile_visit_summaries() -> None:
+    """
+    Recompute visit summaries of all profiles, moving their rolling windows.
+    """
+    summaries = profile_models.ProfileVisitSummary.refresh()
+    logger.info(f"Refreshed visit summaries of {len(summaries)} profiles")
+
+
+@shared_task
+def rebuild_profile_search_documents() -> None:
+    """
+    Rebuild search documents of all listed profiles, including changes
+    which didn't send signals (e.g. bulk updates).
+    """
+    refreshed = profile_models.ProfileSearchDocument.refresh()
+    logger.info(f"Rebuilt search documents of {refreshed} profiles")
+
+
+@shared_task
+def build_missing_profile_search_documents() -> None:
+    """Build search documents of profiles which have none (not listed yet)"""
+    built = profile_models.ProfileSearchDocument.refresh_missing()
+    if built:
+        logger.info(f"Built missing search documents of {built} profiles")
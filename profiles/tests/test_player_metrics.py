@@ -2,7 +2,9 @@ from unittest import TestCase
 
 import pytest
 from pm_core.services.stubs.player_stub import PlayerApiServiceStub
+from requests.exceptions import ConnectionError
 
+from profiles.metrics_refresh import PlayerMetricsBulkRefresh, RateLimiter, ThrottledAPI
 from utils import factories
 
 
@@ -61,3 +63,62 @@ class PlayerMetricsTest(TestCase):
         assert self.metrics.season_score is None
         self.metrics.get_and_update_season_score(PlayerApiServiceStub)
         assert self.metrics.season_score
+
+
+@pytest.mark.django_db
+class TestPlayerMetricsBulkRefresh:
+    @pytest.fixture
+    def players(self):
+        factories.SeasonFactory.create_batch(4)
+        players = [
+            factories.PlayerProfileFactory.create_with_empty_metrics() for _ in range(3)
+        ]
+        for i, player in enumerate(players[:2]):
+            factories.MapperEntityFactory(target=player.mapper, mapper_id=f"uuid-{i}")
+        return players
+
+    def test_refresh(self, players) -> None:
+        """Mapped players are refreshed, the rest is reported"""
+        refresher = PlayerMetricsBulkRefresh(
+            api_method=PlayerApiServiceStub, workers=1, rate=0
+        )
+        report = refresher.refresh(players)
+
+        assert (report.refreshed, report.failed, report.without_uuid) == (2, 0, 1)
+        for player in players[:2]:
+            player.playermetrics.refresh_from_db()
+            assert player.playermetrics.games_updated
+            assert player.playermetrics.season_updated
+            assert player.playermetrics.pm_score
+        players[2].playermetrics.refresh_from_db()
+        assert players[2].playermetrics.games_updated is None
+
+    def test_refresh_without_commit(self, players) -> None:
+        refresher = PlayerMetricsBulkRefresh(
+            api_method=PlayerApiServiceStub, workers=1, rate=0
+        )
+        report = refresher.refresh(players, refresh_metrics=False, commit=False)
+
+        assert report.refreshed == 2
+        players[0].playermetrics.refresh_from_db()
+        assert players[0].playermetrics.pm_score is None
+
+
+def test_throttled_api_retries_connection_errors() -> None:
+    calls = []
+
+    class FlakyAPI:
+        def get_pm_score(self, player_id, params):
+            calls.append(player_id)
+            if len(calls) < 3:
+                raise ConnectionError
+            return 42
+
+    api = ThrottledAPI(FlakyAPI, RateLimiter(rate=0), retries=2, backoff=0)
+    assert api.get_pm_score("uuid", {}) == 42
+    assert len(calls) == 3
+
+    calls.clear()
+    api = ThrottledAPI(FlakyAPI, RateLimiter(rate=0), retries=1, backoff=0)
+    with pytest.raises(ConnectionError):
+        api.get_pm_score("uuid", {})
@@ -1,9 +1,13 @@
 import uuid
 
+import pytest
+from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
+from labels.utils import fetch_all_labels, prefetch_labels
+from profiles.models import PlayerProfile
 from utils import factories
 from utils.test.test_utils import UserManager
 
@@ -50,3 +54,27 @@ class TestGetProfileLabelsAPI(APITestCase):
         )
         assert len(response.data) == 2
         assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_prefetch_labels(django_assert_num_queries) -> None:
+    profiles = factories.PlayerProfileFactory.create_batch(3)
+    factories.LabelFactory(
+        content_type=ContentType.objects.get_for_model(PlayerProfile),
+        object_id=profiles[0].pk,
+        season_name=None,
+    )
+    factories.LabelFactory(object_id=profiles[1].user_id, season_name=None)
+    factories.LabelFactory(
+        object_id=profiles[1].user_id, season_name=None, visible_on_base=False
+    )
+    expected = [fetch_all_labels(profile, "base") for profile in profiles]
+
+    with django_assert_num_queries(3):  # season, profile and user labels
+        prefetch_labels(profiles, label_context="base")
+    with django_assert_num_queries(0):
+        labels = [fetch_all_labels(profile, "base") for profile in profiles]
+        [label.label_definition.label_name for label in sum(labels, [])]
+
+    assert labels == expected
+    assert [len(profile_labels) for profile_labels in labels] == [1, 1, 0]
@@ -113,6 +113,28 @@ class TestProfileListAPI(APITestCase):
         assert count_response.data["count"] == 1
         assert count_response.status_code == 200
 
+    def test_filtered_profile_count_ignores_sorting(self) -> None:
+        """count profiles on database side, sorting doesn't affect the count"""
+        factories.PlayerProfileFactory.create_batch(3)
+
+        for sort in ["-popularity", "-pm_score", ""]:
+            response = self.client.get(
+                self.count_url, {"role": "P", "sort": sort, "shuffle": True}
+            )
+
+            assert response.status_code == 200
+            assert response.data == {"count": 3, "approximate": False}
+
+    @override_settings(APPROXIMATE_PROFILE_COUNT_FROM=0)
+    def test_filtered_profile_count_approximate_for_broad_filters(self) -> None:
+        """broad filters are counted approximately (query planner estimate)"""
+        factories.PlayerProfileFactory.create_batch(3)
+
+        response = self.client.get(self.count_url, {"role": "P"})
+
+        assert response.status_code == 200
+        assert response.data["approximate"] is True
+
     @parameterized.expand([[{}], [{"role": "Piłkarz"}], [{"role": "p"}]])
     def test_get_bulk_profiles_invalid_param(self, param) -> None:
         """get profiles by invalid role param"""
@@ -1,13 +1,23 @@
 from datetime import timedelta
+from io import StringIO
 from unittest.mock import patch
 
 import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from profiles.models import BaseProfile, ProfileVisitation
+from profiles.models import (
+    BaseProfile,
+    PlayerProfile,
+    ProfileVisitation,
+    ProfileVisitHistory,
+    ProfileVisitSummary,
+)
+from profiles.services import ProfileVisitHistoryService
 from transfers.models import ProfileTransferStatus, ProfileTransferRequest
 from utils.factories import PlayerProfileFactory, TeamContributorFactory
 
@@ -286,3 +296,94 @@ def test_profile_without_transfer_objects_still_tracked(client, subject):
     # Check that visitation count was incremented
     subject.profile.refresh_from_db()
     assert subject.profile.visitation.visitors_count_this_year == 1
+
+
+def test_repeated_visit_updates_visitation(profile):
+    visitor = PlayerProfileFactory()
+    first = ProfileVisitation.upsert(visitor=visitor, visited=profile)
+    second = ProfileVisitation.upsert(visitor=visitor, visited=profile)
+
+    assert first.pk == second.pk
+    assert ProfileVisitation.objects.filter(visited=profile.meta).count() == 1
+    assert profile.visitation.visitors_count_this_year == 2
+    assert ProfileVisitSummary.objects.get(meta=profile.meta).visitors == 1
+
+
+def test_new_visitor_notified_once(profile):
+    visitor = PlayerProfileFactory()
+    with patch("profiles.signals.NotificationService") as service:
+        ProfileVisitation.upsert(visitor=visitor, visited=profile)
+        ProfileVisitation.upsert(visitor=visitor, visited=profile)
+
+    service.assert_called_once_with(profile.meta)
+    service.return_value.notify_profile_visited.assert_called_once_with()
+
+
+def test_register_visit(profile):
+    visitor = PlayerProfileFactory()
+    ProfileVisitHistory.register_visit(user=profile.user, requestor=visitor)
+    ProfileVisitHistory.register_visit(user=profile.user, requestor=AnonymousUser())
+    ProfileVisitHistory.register_visit(user=profile.user, requestor=AnonymousUser())
+
+    history = ProfileVisitHistory.objects.get(user=profile.user)
+    assert history.counter_playerprofile == 1
+    assert history.counter_anonymoususer == 2
+    assert ProfileVisitSummary.objects.get(meta=profile.meta).visits_this_month == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_visits_counted_exactly():
+    # raises CommandError if any increment is lost
+    call_command(
+        "benchmark_profile_visits", threads=4, visits=10, visitors=3, stdout=StringIO()
+    )
+
+
+class TestProfileVisitSummary:
+    def test_counters_follow_visits(self, profile):
+        _visit_factory(profile)
+        _visit_factory(profile)
+        history = ProfileVisitHistory.objects.create(user=profile.user)
+        history.increment(AnonymousUser())
+        history.increment(AnonymousUser())
+
+        summary = ProfileVisitSummary.objects.get(meta=profile.meta)
+        assert summary.visitors == 2
+        assert summary.visits_last_30_days == 2
+        assert summary.visits_this_month == 2
+        assert summary.visits_this_year == 2
+
+    def test_refresh_command_builds_missing_summaries(self, profile):
+        _visit_factory(profile)
+        ProfileVisitSummary.objects.all().delete()
+
+        call_command("refresh_profile_visit_summaries", stdout=StringIO())
+
+        assert ProfileVisitSummary.objects.get(meta=profile.meta).visitors == 1
+
+    def test_refresh_moves_windows(self, profile):
+        history = ProfileVisitHistory.objects.create(user=profile.user)
+        history.increment(AnonymousUser())
+        ProfileVisitHistory.objects.filter(pk=history.pk).update(
+            created_at=timezone.now().date() - timedelta(days=31)
+        )
+
+        (summary,) = ProfileVisitSummary.refresh([profile.meta_id])
+
+        assert summary.visits_last_30_days == 0
+        assert (
+            ProfileVisitSummary.objects.get(meta=profile.meta).visits_last_30_days == 0
+        )
+
+    def test_prefetch_visit_summaries(self, django_assert_num_queries):
+        profiles = PlayerProfileFactory.create_batch(3)
+        for profile in profiles:
+            _visit_factory(profile)
+        profiles = list(PlayerProfile.objects.filter(pk__in=[p.pk for p in profiles]))
+        service = ProfileVisitHistoryService()
+
+        with django_assert_num_queries(2):  # metas and their summaries
+            service.prefetch_visit_summaries(profiles)
+        with django_assert_num_queries(0):
+            assert [service.profile_visits_last_month(p) for p in profiles] == [0] * 3
+            assert [p.meta.visit_summary.visitors for p in profiles] == [1] * 3
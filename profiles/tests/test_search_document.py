@@ -0,0 +1,148 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from profiles.models import ProfileSearchDocument
+from profiles.services import RandomizationService
+from utils import factories
+from utils.cache import invalidate_cache_tags, role_tag
+
+pytestmark = pytest.mark.django_db
+
+
+def get_document(profile) -> ProfileSearchDocument:
+    return ProfileSearchDocument.objects.get(meta=profile.meta)
+
+
+def test_document_follows_profile_relations():
+    player = factories.PlayerProfileFactory()
+    position = factories.PlayerProfilePositionFactory(player_profile=player)
+    league = factories.LeagueFactory()
+    transfer_status = factories.TransferStatusFactory(status="2", meta=player.meta)
+    transfer_status.league.add(league)
+    label = factories.LabelFactory(content_object=player.user)
+    licence = factories.CoachLicenceFactory(owner=player.user)
+    metrics = player.playermetrics
+    metrics.pm_score = 55
+    metrics.save()
+
+    document = get_document(player)
+    assert document.role == "P"
+    assert document.positions == [position.player_position_id]
+    assert document.transfer_status == "2"
+    assert document.transfer_leagues == [league.pk]
+    assert document.labels == [label.label_definition.label_name]
+    assert document.licences == [licence.licence.name]
+    assert document.pm_score == 55
+
+    transfer_status.delete()
+    position.delete()
+    document = get_document(player)
+    assert document.transfer_status is None
+    assert document.transfer_leagues == []
+    assert document.positions == []
+
+
+def test_rebuild_fixes_outdated_documents():
+    player, coach = factories.PlayerProfileFactory(), factories.CoachProfileFactory()
+    ProfileSearchDocument.objects.filter(meta=player.meta).delete()
+    ProfileSearchDocument.objects.filter(meta=coach.meta).update(role="X")
+
+    call_command("rebuild_profile_search_documents", batch_size=1)
+
+    assert get_document(player).role == "P"
+    assert get_document(coach).role == "T"
+
+
+def test_document_removed_with_profile():
+    player = factories.PlayerProfileFactory()
+    meta = player.meta
+
+    player.delete()
+
+    assert not ProfileSearchDocument.objects.filter(meta=meta).exists()
+
+
+def test_catalogue_filters_single_document_per_profile(api_client):
+    player = factories.PlayerProfileFactory()
+    factories.PlayerProfilePositionFactory(player_profile=player)
+    factories.PlayerProfilePositionFactory(player_profile=player)
+    factories.PlayerProfileFactory()
+    positions = list(player.player_positions.values_list("player_position", flat=True))
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(
+            reverse("api:profiles:create_or_list_profiles"),
+            {"role": "P", "position": positions},
+        )
+
+    assert [result["uuid"] for result in response.data["results"]] == [str(player.uuid)]
+    listing = [
+        query["sql"]
+        for query in queries
+        if "profiles_profilesearchdocument" in query["sql"]
+    ]
+    assert listing
+    assert not any("DISTINCT" in sql for sql in listing)
+
+
+def test_shuffled_catalogue_is_stable_between_pages(api_client):
+    players = factories.PlayerProfileFactory.create_batch(6)
+    seed = RandomizationService.get_daily_user_seed(AnonymousUser())
+    uuids = {player.meta_id: str(player.uuid) for player in players}
+    documents = ProfileSearchDocument.objects.filter(meta__in=uuids)
+    expected = [
+        uuids[document.meta_id]
+        for document in sorted(
+            documents, key=lambda document: (document.shuffle_key ^ seed, document.pk)
+        )
+    ]
+
+    pages = [
+        api_client.get(
+            reverse("api:profiles:create_or_list_profiles"),
+            {"role": "P", "shuffle": True, "page_size": 3, "page": page},
+        ).data["results"]
+        for page in (1, 2)
+    ]
+
+    assert [result["uuid"] for page in pages for result in page] == expected
+
+
+@patch("app.celery.tasks.refresh_cached_response.delay")
+def test_user_shuffled_catalogue_recomputed_when_stale(refresh_mock, api_client):
+    factories.PlayerProfileFactory.create_batch(2)
+    api_client.force_authenticate(user=factories.GuestProfileFactory().user)
+    url = reverse("api:profiles:create_or_list_profiles")
+    api_client.get(url, {"role": "P", "shuffle": True})
+    player = factories.PlayerProfileFactory()
+    invalidate_cache_tags(role_tag("P"))
+
+    response = api_client.get(url, {"role": "P", "shuffle": True})
+
+    assert str(player.uuid) in [result["uuid"] for result in response.data["results"]]
+    refresh_mock.assert_not_called()
+
+
+def test_refresh_keeps_shuffle_key():
+    player = factories.PlayerProfileFactory()
+    shuffle_key = get_document(player).shuffle_key
+
+    ProfileSearchDocument.refresh([player.meta_id])
+
+    assert get_document(player).shuffle_key == shuffle_key
+
+
+def test_missing_documents_are_built():
+    player = factories.PlayerProfileFactory()
+    ProfileSearchDocument.objects.filter(meta=player.meta).delete()
+
+    assert ProfileSearchDocument.refresh_missing() == 1
+
+    assert get_document(player).role == "P"
+    assert ProfileSearchDocument.refresh_missing() == 0
@@ -94,3 +94,56 @@ class TestProfileSearchAPI(APITestCase):
             for user in response.data["results"]
         )
         assert jon_doe_present
+
+    def test_accent_insensitive_search(self):
+        """
+        Test that the search ignores polish diacritics.
+        """
+        user = UserFactory.create(
+            declared_role=definitions.PLAYER_SHORT,
+            first_name="Łukasz",
+            last_name="Żółkiewski",
+        )
+        PlayerProfileFactory.create(user=user)
+
+        response = self.client.get(self.profile_search_url, {"name": "lukasz zol"})
+
+        assert response.status_code == 200
+        assert [u["last_name"] for u in response.data["results"]] == ["Żółkiewski"]
+
+    def test_search_name_kept_in_sync(self):
+        """
+        Test that renamed user is found by the new name only.
+        """
+        self.user1.first_name = "Johnny"
+        self.user1.save(update_fields=["first_name"])
+
+        assert self.user1.search_name == "johnnydoe"
+        response = self.client.get(self.profile_search_url, {"name": "johnny"})
+        assert len(response.data["results"]) == 1
+        response = self.client.get(self.profile_search_url, {"name": "jondoe"})
+        assert len(response.data["results"]) == 0
+
+    def test_prefix_matches_ranked_first(self):
+        """
+        Test that users whose name starts with the search term come first.
+        """
+        user = UserFactory.create(
+            declared_role=definitions.PLAYER_SHORT, first_name="Adam", last_name="Jane"
+        )
+        PlayerProfileFactory.create(user=user)
+
+        response = self.client.get(self.profile_search_url, {"name": "jane"})
+
+        assert [u["first_name"] for u in response.data["results"]] == ["Jane", "Adam"]
+
+    def test_not_listed_users_excluded(self):
+        """
+        Test that hidden users are not returned.
+        """
+        self.user2.display_status = self.user2.DisplayStatus.NOT_SHOWN
+        self.user2.save()
+
+        response = self.client.get(self.profile_search_url, {"name": "Doe"})
+
+        assert [u["first_name"] for u in response.data["results"]] == ["Jon"]
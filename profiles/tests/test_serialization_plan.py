@@ -0,0 +1,59 @@
+import datetime
+
+import pytest
+
+from profiles.api.serialization_plan import get_serialization_plan
+from profiles.api.serializers import ProfileSerializer
+from profiles.models import PlayerProfile
+from profiles.services import TeamContributorService
+from utils import factories
+
+pytestmark = pytest.mark.django_db
+
+
+def test_plan_serializes_attributes():
+    profile = factories.PlayerProfileFactory(prefered_leg=2, height=180)
+    profile.birth_date = datetime.date(2000, 1, 2)
+    plan = get_serialization_plan(
+        PlayerProfile, tuple(profile.__dict__), ProfileSerializer.enums, ("weight",)
+    )
+
+    ret = plan.serialize(profile, {})
+
+    assert ret["prefered_leg"]["id"] == "2"
+    assert ret["prefered_leg"]["name"]
+    assert ret["height"] == 180
+    assert ret["birth_date"] == "2000-01-02"
+    assert ret["uuid"] == str(profile.uuid)
+    assert "weight" not in ret
+    assert not any(name.startswith("_") for name in ret)
+
+
+def test_plan_is_compiled_once():
+    fields = ("height", "prefered_leg")
+    assert get_serialization_plan(
+        PlayerProfile, fields, ProfileSerializer.enums
+    ) is get_serialization_plan(PlayerProfile, fields, ProfileSerializer.enums)
+
+
+def test_prefetch_primary_contributions(django_assert_num_queries):
+    profiles = factories.PlayerProfileFactory.create_batch(3)
+    factories.TeamContributorFactory(
+        profile_uuid=profiles[0].uuid,
+        is_primary=True,
+        team_history=[profiles[0].team_object],
+    )
+    factories.TeamContributorFactory(
+        profile_uuid=profiles[1].uuid,
+        is_primary=False,
+        team_history=[profiles[1].team_object],
+    )
+
+    with django_assert_num_queries(1):
+        TeamContributorService.prefetch_primary_contributions(profiles)
+
+    with django_assert_num_queries(0):
+        assert [
+            TeamContributorService.has_primary_contribution(profile)
+            for profile in profiles
+        ] == [True, False, False]
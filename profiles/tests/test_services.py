@@ -23,9 +23,12 @@ from profiles.services import (
 )
 from roles import definitions
 from roles.definitions import TRANSFER_STATUS_CHOICES_WITH_UNDEFINED
+from transfers.models import ProfileTransferStatus
+from users.api.serializers import UserSocialStatsSerializer
 from utils import testutils as utils
 from utils.factories import (
     SEASON_NAMES,
+    CityFactory,
     ClubProfileFactory,
     CoachProfileFactory,
     GuestProfileFactory,
@@ -37,8 +40,10 @@ from utils.factories import (
     SeasonFactory,
     TeamContributorFactory,
     TeamFactory,
+    TransferStatusFactory,
     UserFactory,
 )
+from utils.factories.followers_factories import GenericFollowFactory
 
 team_contributor_service = TeamContributorService()
 utils.silence_explamation_mark()
@@ -404,3 +409,65 @@ def test_new_profile_has_scheduled_tasks(factory):
                 clocked_time=mock_now.return_value + datetime.timedelta(days=4)
             ),
         ).exists()
+
+
+class TestProfilesPagePrefetch:
+    @pytest.fixture
+    def profiles(self):
+        return PlayerProfileFactory.create_batch(2)
+
+    @staticmethod
+    def reload(profiles):
+        return list(
+            models.PlayerProfile.objects.filter(
+                pk__in=[profile.pk for profile in profiles]
+            )
+            .select_related("user")
+            .order_by("pk")
+        )
+
+    def test_prefetch_social_stats(self, profiles, django_assert_num_queries):
+        content_type = ContentType.objects.get_for_model(models.PlayerProfile)
+        GenericFollowFactory(
+            user=UserFactory(), content_type=content_type, object_id=profiles[0].pk
+        )
+        GenericFollowFactory(
+            user=profiles[0].user, content_type=content_type, object_id=profiles[1].pk
+        )
+        models.ProfileVisitation.upsert(visitor=profiles[1], visited=profiles[0])
+        profiles = self.reload(profiles)
+
+        ProfileService.prefetch_social_stats(profiles)
+
+        with django_assert_num_queries(0):
+            stats = [
+                UserSocialStatsSerializer(profile.user).data for profile in profiles
+            ]
+        assert stats == [
+            {"followers": 1, "views": 1, "following": 1},
+            {"followers": 1, "views": 0, "following": 0},
+        ]
+
+    def test_prefetch_transfer_objects(self, profiles, django_assert_num_queries):
+        TransferStatusFactory(meta=profiles[0].meta)
+        profiles = self.reload(profiles)
+
+        TransferStatusService.prefetch_transfer_objects(profiles)
+
+        with django_assert_num_queries(0):
+            transfer_objects = [profile.meta.transfer_object for profile in profiles]
+            leagues = list(transfer_objects[0].league.all())
+        assert isinstance(transfer_objects[0], ProfileTransferStatus)
+        assert transfer_objects[1] is None
+        assert leagues == []
+
+
+def test_annotate_city_distance_without_coordinates():
+    city = CityFactory(latitude=None, longitude=None)
+    profile = PlayerProfileFactory(user__userpreferences__localization=city)
+
+    (annotated,) = ProfileService.annotate_city_distance(
+        models.PlayerProfile.objects.filter(pk=profile.pk), city
+    )
+
+    assert annotated.city_distance is None
@@ -47,7 +47,7 @@ from transfers.api.serializers import (
     UpdateOrCreateProfileTransferSerializer,
 )
 from transfers.models import ProfileTransferRequest
-from utils.cache import CachedResponse
+from utils.cache import TRANSFER_REQUESTS_TAG, CachedResponse
 
 profile_service = ProfileService()
 team_contributor_service = TeamContributorService()
@@ -442,9 +442,11 @@ class TransferRequestCatalogueAPIView(EndpointViewWithFilter):
         with CachedResponse(
             cache_key=f"{cfg.redis.key_prefix.transfer_requests}:{request.get_full_path()}",
             request=request,
+            tags=[TRANSFER_REQUESTS_TAG],
+            stale_while_revalidate=True,
         ) as cache:
-            if cached_data := cache.data:
-                return Response(cached_data)
+            if cached_response := cache.response:
+                return cached_response
 
             queryset = self.get_queryset()
             queryset = self.filter_queryset(queryset)
@@ -2,30 +2,27 @@ from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from transfers.models import ProfileTransferRequest, ProfileTransferStatus
-from transfers.tasks import (
-    clear_cache_for_transfer_requests,
-    clear_cache_for_transfer_status,
-    notify_players_about_new_transfer_request,
-)
+from transfers.tasks import notify_players_about_new_transfer_request
+from utils.cache import TRANSFER_REQUESTS_TAG, invalidate_cache_tags, role_tag
 
 
 @receiver(post_save, sender=ProfileTransferRequest)
 def profile_transfer_request_post_save(sender, instance, created, **kwargs):
     if created:
         notify_players_about_new_transfer_request.delay(instance.id)
-    clear_cache_for_transfer_requests.delay()
+    invalidate_cache_tags(TRANSFER_REQUESTS_TAG, role_tag(instance.meta.role))
 
 
 @receiver(post_delete, sender=ProfileTransferRequest)
 def profile_transfer_request_post_delete(sender, instance, **kwargs):
-    clear_cache_for_transfer_requests.delay()
+    invalidate_cache_tags(TRANSFER_REQUESTS_TAG, role_tag(instance.meta.role))
 
 
 @receiver(post_save, sender=ProfileTransferStatus)
 def profile_transfer_status_post_save(sender, instance, created, **kwargs):
-    clear_cache_for_transfer_status.delay()
+    invalidate_cache_tags(role_tag(instance.meta.role))
 
 
 @receiver(post_delete, sender=ProfileTransferStatus)
 def profile_transfer_status_post_delete(sender, instance, **kwargs):
-    clear_cache_for_transfer_status.delay()
+    invalidate_cache_tags(role_tag(instance.meta.role))
@@ -6,27 +6,10 @@ from mailing.services import MailingService
 from mailing.utils import build_email_context
 from profiles.models import PlayerProfile
 from transfers.models import ProfileTransferRequest
-from utils.cache import (
-    TRANSFER_REQUEST_CACHE_KEY,
-    TRANSFER_STATUS_CACHE_KEY,
-    clear_cache_for_key,
-)
 
 logger = get_task_logger(__name__)
 
 
-@shared_task
-def clear_cache_for_transfer_requests():
-    """Clear cache for transfer requests."""
-    clear_cache_for_key(TRANSFER_REQUEST_CACHE_KEY)
-
-
-@shared_task
-def clear_cache_for_transfer_status():
-    """Clear cache for transfer status."""
-    clear_cache_for_key(TRANSFER_STATUS_CACHE_KEY)
-
-
 @shared_task
 def notify_players_about_new_transfer_request(
     transfer_request_id: int,
@@ -0,0 +1,79 @@
+"""
+Write-behind buffer of authenticated users' activity.
+
+Requests only record (user id, timestamp) in Redis, `flush_user_activity`
+task periodically writes buffered activity to the database in bulk,
+so a user making many requests between flushes costs a single update.
+"""
+
+import datetime
+import logging
+import threading
+import typing
+
+from django.utils import timezone
+
+from utils.cache import get_cache_backend_type
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_BUFFER_KEY = "user_activity:buffer"
+ACTIVITY_HITS_KEY = "user_activity:hits"
+
+# used when cache backend is not Redis (e.g. LocMemCache in tests)
+_local_buffer: typing.Dict[int, float] = {}
+_local_hits = 0
+_local_lock = threading.Lock()
+
+
+def _get_redis_client():
+    from django_redis import get_redis_connection
+
+    return get_redis_connection("default")
+
+
+def record_activity(
+    user_id: int, timestamp: typing.Optional[datetime.datetime] = None
+) -> None:
+    """Buffer activity of user, only the latest timestamp is kept"""
+    global _local_hits
+
+    value = (timestamp or timezone.now()).timestamp()
+    if get_cache_backend_type() == "redis":
+        pipeline = _get_redis_client().pipeline(transaction=False)
+        pipeline.hset(ACTIVITY_BUFFER_KEY, user_id, value)
+        pipeline.incr(ACTIVITY_HITS_KEY)
+        pipeline.execute()
+        return
+
+    with _local_lock:
+        _local_buffer[user_id] = max(value, _local_buffer.get(user_id, value))
+        _local_hits += 1
+
+
+def pop_activity() -> typing.Tuple[typing.Dict[int, datetime.datetime], int]:
+    """
+    Take buffered activity out of the buffer.
+    Returns ({user_id: last activity}, number of recorded requests).
+    """
+    global _local_hits
+
+    if get_cache_backend_type() == "redis":
+        pipeline = _get_redis_client().pipeline(transaction=True)
+        pipeline.hgetall(ACTIVITY_BUFFER_KEY)
+        pipeline.get(ACTIVITY_HITS_KEY)
+        pipeline.delete(ACTIVITY_BUFFER_KEY, ACTIVITY_HITS_KEY)
+        buffer, hits, _ = pipeline.execute()
+        hits = int(hits or 0)
+    else:
+        with _local_lock:
+            buffer, hits = dict(_local_buffer), _local_hits
+            _local_buffer.clear()
+            _local_hits = 0
+
+    return {
+        int(user_id): datetime.datetime.fromtimestamp(
+            float(value), tz=datetime.timezone.utc
+        )
+        for user_id, value in buffer.items()
+    }, hits
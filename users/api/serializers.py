@@ -59,6 +59,9 @@ class UserSocialStatsSerializer(serializers.Serializer):
             representation["followers"] = None
             representation["following"] = None
             representation["views"] = None
+        elif ProfileService.SOCIAL_STATS_ATTR in instance.__dict__:
+            # counted in bulk by ProfileService.prefetch_social_stats
+            representation.update(instance.__dict__[ProfileService.SOCIAL_STATS_ATTR])
         else:
             if instance.profile:
                 representation["followers"] = instance.profile.who_follows_me.count()
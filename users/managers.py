@@ -10,6 +10,7 @@ from django.conf import settings
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.tokens import default_token_generator
 from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.db.models import F
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 from django.utils.translation import gettext_lazy as _
@@ -78,6 +79,22 @@ class CustomUserManager(BaseUserManager):
     def players(self):
         return self.filter(declared_role="P")
 
+    def listed(self):
+        """Database counterpart of User.should_be_listed"""
+        return (
+            self.filter(
+                first_name__isnull=False,
+                last_name__isnull=False,
+                display_status__in=[
+                    self.model.DisplayStatus.VERIFIED,
+                    self.model.DisplayStatus.UNDER_REVIEW,
+                ],
+            )
+            .exclude(first_name="")
+            .exclude(last_name="")
+            .exclude(first_name=F("last_name"))
+        )
+
 
 class SocialAuthMixin:
     """
@@ -0,0 +1,55 @@
+# Generated by Django 3.2.25 on 2026-10-17 10:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+from profiles.utils import preprocess_search_term
+
+
+def populate_search_name(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    batch = []
+    for user in User.objects.only("id", "first_name", "last_name").iterator(
+        chunk_size=2000
+    ):
+        user.search_name = preprocess_search_term(
+            f"{user.first_name or ''} {user.last_name or ''}"
+        )
+        batch.append(user)
+        if len(batch) >= 2000:
+            User.objects.bulk_update(batch, ["search_name"])
+            batch = []
+    User.objects.bulk_update(batch, ["search_name"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0021_remove_user_username"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="user",
+            name="search_name",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Normalized full name (accent-folded, without spaces) used by search.",
+                max_length=300,
+            ),
+        ),
+        migrations.RunPython(
+            populate_search_name, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_name"],
+                name="user_search_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
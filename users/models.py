@@ -6,6 +6,7 @@ from urllib.parse import urljoin
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
@@ -14,6 +15,7 @@ from django_countries import countries
 from django_fsm import FSMField, transition
 from pydantic import typing
 
+from profiles.utils import preprocess_search_term
 from roles import definitions
 from users.managers import CustomUserManager
 from utils import calculate_age, generate_fe_url_path
@@ -308,6 +310,13 @@ class User(AbstractUser, UserRoleMixin):
     last_activity = models.DateTimeField(
         _("Last Activity"), default=None, null=True, blank=True
     )
+    search_name = models.CharField(
+        max_length=300,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Normalized full name (accent-folded, without spaces) used by search.",
+    )
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
@@ -333,6 +342,11 @@ class User(AbstractUser, UserRoleMixin):
         ]
         return name_condition and display_status_condition
 
+    @staticmethod
+    def build_search_name(first_name: str, last_name: str) -> str:
+        """Build normalized full name, the same way search terms are processed"""
+        return preprocess_search_term(f"{first_name or ''} {last_name or ''}")
+
     def save(self, *args, **kwargs):
         if self.role in [
             definitions.GUEST_SHORT,
@@ -341,6 +355,12 @@ class User(AbstractUser, UserRoleMixin):
         ]:
             if self.state != self.STATE_ACCOUNT_VERIFIED:
                 self.state = self.STATE_ACCOUNT_VERIFIED
+
+        # keep search_name in sync with first/last name
+        self.search_name = self.build_search_name(self.first_name, self.last_name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"first_name", "last_name"} & {*update_fields}:
+            kwargs["update_fields"] = {*update_fields, "search_name"}
         super().save(*args, **kwargs)
 
     def update_activity(self):
@@ -380,6 +400,13 @@ class User(AbstractUser, UserRoleMixin):
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
+        indexes = [
+            GinIndex(
+                fields=["search_name"],
+                name="user_search_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
 
 class UserPreferences(models.Model):
@@ -10,9 +10,13 @@ from mailing.tasks import notify_admins
 from users.models import Ref, User, UserPreferences, UserRef
 from users.services import ReferralRewardService, UserService
 from users.tasks import send_email_to_confirm_new_user
+from utils.cache import invalidate_cache_tags, role_tag
 
 logger = logging.getLogger("project")
 
+# fields updated on (almost) every request, not worth invalidating listings
+ACTIVITY_TRACKING_FIELDS = {"last_activity", "last_login"}
+
 
 @receiver(user_logged_in)
 def log_user_login(sender, request, user, **kwargs):
@@ -57,3 +61,14 @@ def referral_rewards(sender, instance, created, **kwargs) -> None:
 
         if referral.is_user:
             ReferralRewardService(referral.user).check_and_reward()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=UserPreferences)
+def invalidate_user_listings(sender, instance, update_fields=None, **kwargs) -> None:
+    """User data is a part of listed profiles, invalidate cached listings."""
+    if update_fields and set(update_fields) <= ACTIVITY_TRACKING_FIELDS:
+        return
+    user = instance if sender is User else instance.user
+    if user.declared_role:
+        invalidate_cache_tags(role_tag(user.declared_role))
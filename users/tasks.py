@@ -1,9 +1,10 @@
 from celery import shared_task
 from celery.utils.log import get_task_logger
+from django.db import connection
 from django.utils import timezone
 
-from profiles.errors import ProfileVisitHistoryDoesNotExistException
-from profiles.services import ProfileVisitHistoryService
+from profiles.models import ProfileVisitHistory
+from users.activity import pop_activity
 from users.models import User
 from users.mongo_login_service import mongo_login_service
 from users.services import UserService
@@ -24,32 +25,71 @@ def send_email_to_confirm_new_user(*args, **kwargs) -> None:
     UserService.send_email_to_confirm_new_email_address(user)
 
 
-@shared_task
-def update_user_last_activity(*args, **kwargs):
-    """
-    Update user's last activity date.
-    """
-    user = _get_user(kwargs.get("user_id"))
-    user.update_activity()
+ACTIVITY_FLUSH_CHUNK_SIZE = 1000
+
+
+def _bulk_update_last_activity(activity: dict) -> int:
+    """Set last activity of many users with UPDATE ... FROM (VALUES ...)"""
+    table = connection.ops.quote_name(User._meta.db_table)
+    items = sorted(activity.items())
+    updated = 0
+    with connection.cursor() as cursor:
+        for start in range(0, len(items), ACTIVITY_FLUSH_CHUNK_SIZE):
+            chunk = items[start : start + ACTIVITY_FLUSH_CHUNK_SIZE]
+            values = ", ".join(["(%s, %s::timestamptz)"] * len(chunk))
+            cursor.execute(
+                f"UPDATE {table} AS u SET last_activity = v.last_activity "
+                f"FROM (VALUES {values}) AS v(id, last_activity) "
+                "WHERE u.id = v.id "
+                "AND (u.last_activity IS NULL OR u.last_activity < v.last_activity)",
+                [param for item in chunk for param in item],
+            )
+            updated += cursor.rowcount
+    return updated
+
+
+def _bulk_mark_logged_in(user_ids: list) -> None:
+    """Mark users (except staff) as logged in today in their visit history"""
+    user_ids = list(
+        User.objects.filter(
+            pk__in=user_ids, is_staff=False, is_superuser=False
+        ).values_list("pk", flat=True)
+    )
+    # (user, created_at) is unique, existing rows are updated below
+    ProfileVisitHistory.objects.bulk_create(
+        [ProfileVisitHistory(user_id=pk, user_logged_in=True) for pk in user_ids],
+        batch_size=ACTIVITY_FLUSH_CHUNK_SIZE,
+        ignore_conflicts=True,
+    )
+    ProfileVisitHistory.objects.filter(
+        user_id__in=user_ids,
+        created_at=timezone.localdate(),
+        user_logged_in=False,
+    ).update(user_logged_in=True)
 
 
 @shared_task
-def update_visit_history_for_actual_date(*args, **kwargs):
+def flush_user_activity() -> dict:
     """
-    Update user visit history for actual date.
+    Write activity buffered by UserActivityMiddleware to the database.
     """
-    user = _get_user(kwargs.get("user_id"))
-    visit_history_service = ProfileVisitHistoryService()
+    activity, hits = pop_activity()
+    if not activity:
+        return {"users": 0, "hits": hits}
 
-    if not user.is_staff and not user.is_superuser:
-        try:
-            user_visit_history = visit_history_service.get_user_profile_visit_history(
-                user=user, created_at=timezone.now()
-            )
-            user_visit_history.user_logged_in = True
-            user_visit_history.save()
-        except ProfileVisitHistoryDoesNotExistException:
-            visit_history_service.create(user=user, user_logged_in=True)
+    updated = _bulk_update_last_activity(activity)
+    _bulk_mark_logged_in(list(activity))
+    coalescing_ratio = hits / len(activity)
+    logger.info(
+        f"Flushed activity of {len(activity)} users ({hits} requests, "
+        f"coalescing ratio {coalescing_ratio:.1f})"
+    )
+    return {
+        "users": len(activity),
+        "hits": hits,
+        "updated": updated,
+        "coalescing_ratio": coalescing_ratio,
+    }
 
 
 @shared_task
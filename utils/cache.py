@@ -1,35 +1,154 @@
 import logging
+import time
 import typing
+import uuid
+import zlib
 
+import orjson
 from django.conf import settings
 from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.functional import cached_property
 from rest_framework.request import Request
 
-from backend.settings import cfg
 from api.i18n_config import SUPPORTED_LANGUAGE_CODES, DEFAULT_LANGUAGE
+from api.renderers import render_json
 
 logger = logging.getLogger(__name__)
 
-TRANSFER_REQUEST_CACHE_KEY = f"*{cfg.redis.key_prefix.transfer_requests}:*"
-TRANSFER_STATUS_CACHE_KEY = f"*{cfg.redis.key_prefix.list_profiles}:*transfer_status=*"
+CACHE_TAG_KEY = "cache_tag:{tag}"
+CACHE_STATS_KEY = "cache_stats:{prefix}:{event}"
+CACHE_STATS_EVENTS = ("hit", "miss", "stale")
+CACHE_LOCK_KEY = "{cache_key}:lock"
+CACHE_LOCK_POLL_INTERVAL = 0.1  # in seconds
+
+TRANSFER_REQUESTS_TAG = "transfer_requests"
+MAPPER_ENTITIES_TAG = "mapper_entities"
+REFERENCE_DATA_TAG = "reference_data"
+
+
+def role_tag(role: str) -> str:
+    """Tag of cached pages listing profiles of given role (e.g. P, T, C)"""
+    return f"role:{role}"
+
+
+def league_tag(league_id: int) -> str:
+    """Tag of cached pages filtered by given league"""
+    return f"league:{league_id}"
+
+
+def _incr(key: str) -> None:
+    """Increment counter, create it if it doesn't exist yet (never expires)."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def invalidate_cache_tags(*tags: str) -> None:
+    """
+    Bump generation of given tags.
+    Every cached page recorded with an older generation of any of its tags
+    is considered stale and will be recomputed.
+    """
+    for tag in set(tags):
+        try:
+            _incr(CACHE_TAG_KEY.format(tag=tag))
+        except Exception as e:
+            logger.error(f"Error invalidating cache tag '{tag}': {e}")
+
+
+def get_cache_tag_generation(tag: str) -> int:
+    """Get current generation of given tag (0 if it was never invalidated)"""
+    return cache.get(CACHE_TAG_KEY.format(tag=tag), 0)
+
+
+def get_cache_stats(prefix: str) -> typing.Dict[str, int]:
+    """Get hit/miss/stale counters of cached responses with given key prefix"""
+    keys = {
+        event: CACHE_STATS_KEY.format(prefix=prefix, event=event)
+        for event in CACHE_STATS_EVENTS
+    }
+    values = cache.get_many(list(keys.values()))
+    return {event: values.get(key, 0) for event, key in keys.items()}
+
+
+class CachedJSONResponse(HttpResponse):
+    """Response with already rendered JSON content, served from cache"""
+
+    def __init__(self, content: bytes, **kwargs) -> None:
+        super().__init__(content, content_type="application/json", **kwargs)
+
+    @cached_property
+    def data(self) -> typing.Any:
+        """Decoded content, as `data` of DRF Response (used by tests)"""
+        return orjson.loads(self.content)
 
 
 class CachedResponse:
+    """
+    Cache for (paginated) API responses.
+
+    Entries hold the rendered JSON (zlib-compressed above
+    CACHE_COMPRESS_MIN_SIZE bytes), so a hit is returned as
+    `CachedJSONResponse` without decoding and rendering the data again.
+
+    Each entry records the generation of its tags (roles, leagues, transfer
+    objects it covers). Bumping any of these tags with `invalidate_cache_tags`
+    makes the entry stale, so tagged entries can live much longer than TTL
+    based ones.
+
+    With `single_flight` only one worker recomputes an expired/stale entry
+    (holder of a lock stored with `cache.add`, SET NX on Redis), the others get
+    the previous value or wait up to `CACHE_LOCK_WAIT` seconds for the new one.
+    With `stale_while_revalidate` the stale value is served for up to
+    `CACHE_STALE_WHILE_REVALIDATE` seconds after expiration, while the entry
+    is recomputed by `refresh_cached_response` celery task.
+    """
+
     def __init__(
         self,
         cache_key: str,
         request: Request,
-        cache_timeout: int = settings.DEFAULT_CACHE_LIFESPAN,
+        cache_timeout: typing.Optional[int] = None,
+        tags: typing.Iterable[str] = (),
+        single_flight: bool = False,
+        stale_while_revalidate: bool = False,
     ):
-        self._cache_timeout = cache_timeout
+        self._tags = sorted(set(tags))
+        self._cache_timeout = cache_timeout or (
+            settings.TAGGED_CACHE_LIFESPAN
+            if self._tags
+            else settings.DEFAULT_CACHE_LIFESPAN
+        )
         self._request = request
+        self._stats_prefix = cache_key.split(":", 1)[0]
+        self._generations = None
+        self._single_flight = single_flight or stale_while_revalidate
+        self._stale_while_revalidate = stale_while_revalidate
+        # how long expired entry is kept, to be served while it's recomputed
+        if stale_while_revalidate:
+            self._grace_period = settings.CACHE_STALE_WHILE_REVALIDATE
+        elif single_flight:
+            self._grace_period = settings.CACHE_LOCK_TIMEOUT
+        else:
+            self._grace_period = 0
+        # set on requests made by `refresh_cached_response` task
+        self._refresh = bool(getattr(request, "cache_refresh", False))
+        self._lock_token = None
         # Generate language-aware cache key
         self._cache_key = self._generate_language_aware_cache_key(cache_key, request)
+        self._lock_key = CACHE_LOCK_KEY.format(cache_key=self._cache_key)
+        # refreshed entry is stored under keys of the entry which scheduled it,
+        # the key may depend on more than url and language (e.g. the user)
+        if refresh_keys := getattr(request, "cache_refresh_keys", None):
+            self._cache_key, self._lock_key = refresh_keys
 
     def __enter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb): ...
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._release_lock()
 
     def _get_request_language(self, request: Request) -> str:
         """
@@ -66,14 +185,159 @@ class CachedResponse:
 
         return base_key
 
+    def _current_generations(self) -> typing.Dict[str, int]:
+        """Get current generation of each tag of this entry"""
+        keys = {tag: CACHE_TAG_KEY.format(tag=tag) for tag in self._tags}
+        values = cache.get_many(list(keys.values())) if keys else {}
+        return {tag: values.get(key, 0) for tag, key in keys.items()}
+
+    def _count(self, event: str) -> None:
+        try:
+            _incr(CACHE_STATS_KEY.format(prefix=self._stats_prefix, event=event))
+        except Exception as e:
+            logger.debug(f"Unable to count cache {event}: {e}")
+
+    @staticmethod
+    def _pack(content: bytes) -> dict:
+        if len(content) >= settings.CACHE_COMPRESS_MIN_SIZE:
+            return {"content": zlib.compress(content, 1), "compressed": True}
+        return {"content": content, "compressed": False}
+
+    @staticmethod
+    def _unpack(entry: dict) -> bytes:
+        if entry["compressed"]:
+            return zlib.decompress(entry["content"])
+        return entry["content"]
+
+    def _get_entry(self) -> typing.Optional[dict]:
+        """Cached entry, None if there is none (or it has outdated format)"""
+        entry = cache.get(self._cache_key)
+        if isinstance(entry, dict) and "content" in entry:
+            return entry
+        return None
+
+    def _is_fresh(self, entry: dict) -> bool:
+        """Entry is up to date with its tags and not expired"""
+        expires_at = entry.get("expires_at")
+        return entry.get("generations") == self._generations and (
+            expires_at is None or expires_at > time.time()
+        )
+
+    def _acquire_lock(self) -> bool:
+        token = uuid.uuid4().hex
+        if cache.add(self._lock_key, token, timeout=settings.CACHE_LOCK_TIMEOUT):
+            self._lock_token = token
+            return True
+        return False
+
+    def _release_lock(self) -> None:
+        if self._lock_token and cache.get(self._lock_key) == self._lock_token:
+            cache.delete(self._lock_key)
+        self._lock_token = None
+
+    def _schedule_refresh(self) -> bool:
+        """Recompute entry in the background, lock is released by the task."""
+        from app.celery.tasks import refresh_cached_response
+
+        try:
+            refresh_cached_response.delay(
+                self._request.build_absolute_uri(),
+                self._get_request_language(self._request),
+                self._cache_key,
+                self._lock_key,
+            )
+        except Exception as e:
+            logger.error(f"Unable to schedule refresh of '{self._cache_key}': {e}")
+            return False
+        self._lock_token = None
+        return True
+
+    def _wait_for_entry(self) -> typing.Any:
+        """Wait for the lock holder to store fresh entry"""
+        deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(CACHE_LOCK_POLL_INTERVAL)
+            entry = self._get_entry()
+            if entry is not None and self._is_fresh(entry):
+                return self._unpack(entry)
+            if cache.get(self._lock_key) is None:
+                break
+        return None
+
+    def _single_flight_content(
+        self, entry: typing.Optional[dict]
+    ) -> typing.Optional[bytes]:
+        """
+        Decide whether this worker recomputes the entry (returns None)
+        or reuses the previous/concurrently computed value.
+        """
+        if self._acquire_lock():
+            if (
+                entry is not None
+                and self._stale_while_revalidate
+                and self._schedule_refresh()
+            ):
+                return self._unpack(entry)
+            return None
+        if entry is not None:
+            return self._unpack(entry)
+        return self._wait_for_entry()
+
+    @property
+    def content(self) -> typing.Optional[bytes]:
+        """Retrieve cached rendered JSON if available and not stale."""
+        entry = self._get_entry()
+        # generations are captured before data is (re)computed, so invalidation
+        # during computation makes freshly stored entry stale as well
+        self._generations = self._current_generations()
+        if self._refresh:
+            return None
+
+        if entry is None:
+            self._count("miss")
+        elif self._is_fresh(entry):
+            self._count("hit")
+            return self._unpack(entry)
+        else:
+            self._count("stale")
+
+        if not self._single_flight:
+            return None
+        return self._single_flight_content(entry)
+
+    @content.setter
+    def content(self, content: bytes) -> None:
+        if self._generations is None:
+            self._generations = self._current_generations()
+        entry = {**self._pack(content), "generations": self._generations}
+        if self._grace_period:
+            entry["expires_at"] = time.time() + self._cache_timeout
+        cache.set(
+            self._cache_key,
+            entry,
+            timeout=self._cache_timeout + self._grace_period,
+        )
+        if self._refresh:
+            cache.delete(self._lock_key)
+        self._release_lock()
+
+    @property
+    def response(self) -> typing.Optional[CachedJSONResponse]:
+        """Cached response if available and not stale."""
+        if (content := self.content) is not None:
+            return CachedJSONResponse(content)
+        return None
+
     @property
-    def data(self):
-        """Retrieve cached data if available."""
-        return cache.get(self._cache_key)
+    def data(self) -> typing.Any:
+        """Decoded cached data if available and not stale."""
+        if (content := self.content) is not None:
+            return orjson.loads(content)
+        return None
 
     @data.setter
     def data(self, data: typing.Any) -> None:
-        cache.set(self._cache_key, data, timeout=self._cache_timeout)
+        self.content = render_json(data)
 
 
 def get_cache_backend_type() -> str:
@@ -0,0 +1,73 @@
+import typing
+
+from django.db import connections, models, router
+
+
+def upsert(
+    instance: models.Model,
+    unique_fields: typing.Sequence[str],
+    update_fields: typing.Sequence[str] = (),
+    increment_fields: typing.Sequence[str] = (),
+) -> typing.Tuple[int, bool]:
+    """
+    Insert (unsaved) instance or update the row conflicting on `unique_fields`
+    with a single INSERT ... ON CONFLICT DO UPDATE, which is atomic under
+    concurrency. On conflict `update_fields` are set to the instance's values
+    and `increment_fields` are incremented by them.
+    Returns (pk, created).
+    """
+    model = type(instance)
+    opts = model._meta
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    fields = [
+        field
+        for field in opts.concrete_fields
+        if not (field.primary_key and getattr(instance, field.attname) is None)
+    ]
+    params = [
+        field.get_db_prep_save(field.pre_save(instance, True), connection)
+        for field in fields
+    ]
+    table = quote(opts.db_table)
+
+    def column(name: str) -> str:
+        return quote(opts.get_field(name).column)
+
+    assignments = [
+        f"{column(name)} = EXCLUDED.{column(name)}" for name in update_fields
+    ]
+    assignments += [
+        f"{column(name)} = {table}.{column(name)} + EXCLUDED.{column(name)}"
+        for name in increment_fields
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(quote(f.column) for f in fields)}) "
+            f"VALUES ({', '.join(['%s'] * len(fields))}) "
+            f"ON CONFLICT ({', '.join(column(name) for name in unique_fields)}) "
+            f"DO UPDATE SET {', '.join(assignments)} "
+            # xmax is 0 only for rows inserted (not updated) by the statement
+            f"RETURNING {quote(opts.pk.column)}, xmax = 0",
+            params,
+        )
+        return cursor.fetchone()
+
+
+def increment_json_key(instance: models.Model, field_name: str, key: str) -> int:
+    """
+    Atomically increment integer stored under `key` of instance's JSON field
+    (missing key counts as 0), return the new value.
+    """
+    opts = instance._meta
+    connection = connections[router.db_for_write(type(instance))]
+    quote = connection.ops.quote_name
+    column = quote(opts.get_field(field_name).column)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {quote(opts.db_table)} SET {column} = jsonb_set({column}, "
+            f"ARRAY[%s], to_jsonb(COALESCE(({column} ->> %s)::int, 0) + 1)) "
+            f"WHERE {quote(opts.pk.column)} = %s RETURNING {column} ->> %s",
+            [key, key, instance.pk, key],
+        )
+        return int(cursor.fetchone()[0])
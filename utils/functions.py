@@ -7,7 +7,6 @@ from datetime import datetime
 
 import django.db.utils
 from django.conf import settings
-from django.core.exceptions import ObjectDoesNotExist
 from django.template.loader import get_template
 from django.urls import reverse
 from django.utils import timezone, translation
@@ -69,13 +68,12 @@ def get_current_season():
     Return current season based on season stored in database
     """
     from clubs.models import Season  # avoid circular import
+    from utils.reference_data import reference_data
 
     if not settings.SCRAPPER:
         return "2021/2022"
     try:
-        return Season.objects.get(is_current=True).name
-    except ObjectDoesNotExist:
-        return Season.define_current_season()
+        return reference_data.get("current_season") or Season.define_current_season()
     except django.db.utils.ProgrammingError:
         return "2021/2022"
 
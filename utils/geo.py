@@ -0,0 +1,89 @@
+import math
+import typing
+from decimal import Decimal
+
+from django.db.models import (
+    Expression,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    QuerySet,
+    Value,
+)
+from django.db.models import functions as django_base_functions
+
+EARTH_RADIUS = 6371  # km
+
+Number = typing.Union[int, float, Decimal]
+
+
+def bounding_box(
+    latitude: Number, longitude: Number, radius: Number
+) -> typing.Tuple[float, float, typing.Optional[float], typing.Optional[float]]:
+    """
+    Get (min_lat, max_lat, min_lng, max_lng) of a box containing circle
+    of given radius (km). Longitude bounds are None near the poles
+    and when the box crosses the antimeridian.
+    """
+    latitude, longitude, radius = float(latitude), float(longitude), float(radius)
+    lat_delta = math.degrees(radius / EARTH_RADIUS)
+    min_lat, max_lat = max(latitude - lat_delta, -90.0), min(latitude + lat_delta, 90.0)
+
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if cos_lat <= 0:
+        return min_lat, max_lat, None, None
+    lng_delta = math.degrees(radius / (EARTH_RADIUS * cos_lat))
+    min_lng, max_lng = longitude - lng_delta, longitude + lng_delta
+    if min_lng < -180 or max_lng > 180:
+        return min_lat, max_lat, None, None
+    return min_lat, max_lat, min_lng, max_lng
+
+
+def distance_expression(
+    latitude: Number, longitude: Number, latitude_field: str, longitude_field: str
+) -> Expression:
+    """Haversine distance (km) between given point and point stored in fields"""
+    latitude, longitude = math.radians(latitude), math.radians(longitude)
+    field_latitude = django_base_functions.Radians(F(latitude_field))
+    field_longitude = django_base_functions.Radians(F(longitude_field))
+    cos_term = Value(math.cos(latitude)) * django_base_functions.Cos(field_latitude)
+    sin_term = Value(math.sin(latitude)) * django_base_functions.Sin(field_latitude)
+    cos_angle = (
+        cos_term * django_base_functions.Cos(field_longitude - Value(longitude))
+        + sin_term
+    )
+    # rounding may push cosine out of ACos domain for (almost) the same points
+    cos_angle = django_base_functions.Greatest(
+        django_base_functions.Least(cos_angle, Value(1.0), output_field=FloatField()),
+        Value(-1.0),
+        output_field=FloatField(),
+    )
+    return ExpressionWrapper(
+        EARTH_RADIUS * django_base_functions.ACos(cos_angle),
+        output_field=FloatField(),
+    )
+
+
+def filter_within_radius(
+    queryset: QuerySet,
+    latitude: Number,
+    longitude: Number,
+    radius: Number,
+    latitude_field: str = "latitude",
+    longitude_field: str = "longitude",
+) -> QuerySet:
+    """
+    Filter queryset with objects within radius (km) from given point,
+    annotated with `distance`.
+    Bounding box on (indexed) coordinates is applied first, so exact distance
+    is computed only for the objects within the box.
+    """
+    min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius)
+    queryset = queryset.filter(**{f"{latitude_field}__range": (min_lat, max_lat)})
+    if min_lng is not None:
+        queryset = queryset.filter(**{f"{longitude_field}__range": (min_lng, max_lng)})
+    return queryset.annotate(
+        distance=distance_expression(
+            latitude, longitude, latitude_field, longitude_field
+        )
+    ).filter(distance__lt=float(radius))
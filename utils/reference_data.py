@@ -0,0 +1,134 @@
+"""
+Process-local registry of reference data: seasons, player positions,
+licence types, languages and label definitions.
+
+These tables are small and rarely change, yet they were queried on almost
+every request. Each dataset is loaded once per process on first use and
+kept until any of the tables changes: signals clear the registry of the
+process which saved/deleted a row and bump REFERENCE_DATA_TAG, so other
+processes drop their registries on the next generation check (made at most
+once per CHECK_INTERVAL seconds).
+
+Cached model instances are shared by all threads of the process,
+treat them as read-only.
+"""
+
+import logging
+import threading
+import time
+import typing
+
+from utils.cache import REFERENCE_DATA_TAG, get_cache_tag_generation
+
+logger = logging.getLogger(__name__)
+
+Loader = typing.Callable[[], typing.Any]
+
+
+class ReferenceDataRegistry:
+    CHECK_INTERVAL = 5  # in seconds
+
+    def __init__(self, check_interval: float = CHECK_INTERVAL) -> None:
+        self.check_interval = check_interval
+        self._loaders: typing.Dict[str, Loader] = {}
+        self._data: typing.Dict[str, typing.Any] = {}
+        self._generation = None
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+
+    def register(self, name: str) -> typing.Callable[[Loader], Loader]:
+        """Register loader of a dataset (decorator)"""
+
+        def decorator(loader: Loader) -> Loader:
+            self._loaders[name] = loader
+            return loader
+
+        return decorator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def _check_generation(self) -> None:
+        """Forget loaded datasets if reference data changed since"""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        try:
+            generation = get_cache_tag_generation(REFERENCE_DATA_TAG)
+        except Exception as e:
+            logger.warning(f"Unable to check reference data generation: {e}")
+            generation = None
+        if generation is None or generation != self._generation:
+            self.clear()
+            self._generation = generation
+
+    def get(self, name: str) -> typing.Any:
+        """Dataset of given name, loaded on first use"""
+        self._check_generation()
+        with self._lock:
+            if name not in self._data:
+                self._data[name] = self._loaders[name]()
+            return self._data[name]
+
+
+reference_data = ReferenceDataRegistry()
+
+
+class Languages(typing.NamedTuple):
+    by_id: dict
+    by_code: dict
+
+
+@reference_data.register("current_season")
+def load_current_season() -> typing.Optional[str]:
+    """Name of season marked as current, None if there is no such season"""
+    from clubs.models import Season
+
+    return (
+        Season.objects.filter(is_current=True)
+        .order_by("pk")
+        .values_list("name", flat=True)
+        .first()
+    )
+
+
+@reference_data.register("seasons")
+def load_seasons() -> tuple:
+    """All seasons, latest first"""
+    from clubs.models import Season
+
+    return tuple(Season.objects.order_by("-name"))
+
+
+@reference_data.register("positions")
+def load_positions() -> tuple:
+    from profiles.models import PlayerPosition
+
+    return tuple(PlayerPosition.objects.all())
+
+
+@reference_data.register("licences")
+def load_licences() -> tuple:
+    from profiles.models import LicenceType
+
+    return tuple(LicenceType.objects.all())
+
+
+@reference_data.register("languages")
+def load_languages() -> Languages:
+    from profiles.models import Language
+
+    by_id, by_code = {}, {}
+    for language in Language.objects.all():
+        by_id[language.pk] = language
+        by_code.setdefault(language.code, language)
+    return Languages(by_id, by_code)
+
+
+@reference_data.register("label_names")
+def load_label_names() -> typing.FrozenSet[str]:
+    from labels.models import LabelDefinition
+
+    return frozenset(LabelDefinition.objects.values_list("label_name", flat=True))
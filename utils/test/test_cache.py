@@ -0,0 +1,170 @@
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from utils.cache import (
+    CachedJSONResponse,
+    CachedResponse,
+    get_cache_stats,
+    invalidate_cache_tags,
+    league_tag,
+    role_tag,
+)
+
+
+class CachedResponseTagsTest(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.request = Request(APIRequestFactory().get("/profiles/?role=P"))
+
+    def cached(self, tags=(role_tag("P"), league_tag(1))) -> CachedResponse:
+        return CachedResponse(
+            "list_profiles:/profiles/?role=P", self.request, tags=tags
+        )
+
+    def test_cached_data_returned_until_tag_invalidated(self):
+        with self.cached() as response_cache:
+            assert response_cache.data is None
+            response_cache.data = {"results": [1, 2]}
+
+        with self.cached() as response_cache:
+            assert response_cache.data == {"results": [1, 2]}
+
+        invalidate_cache_tags(league_tag(1))
+
+        with self.cached() as response_cache:
+            assert response_cache.data is None
+
+    def test_unrelated_tag_does_not_invalidate(self):
+        with self.cached() as response_cache:
+            response_cache.data = {"results": []}
+
+        invalidate_cache_tags(role_tag("T"), league_tag(2))
+
+        with self.cached() as response_cache:
+            assert response_cache.data == {"results": []}
+
+    def test_invalidation_during_computation_makes_entry_stale(self):
+        with self.cached() as response_cache:
+            assert response_cache.data is None
+            invalidate_cache_tags(role_tag("P"))
+            response_cache.data = {"results": ["outdated"]}
+
+        with self.cached() as response_cache:
+            assert response_cache.data is None
+
+    @override_settings(CACHE_COMPRESS_MIN_SIZE=100)
+    def test_rendered_content_returned_on_hit(self):
+        data = {
+            "results": [{"name": "Łukasz", "number": number} for number in range(20)]
+        }
+        with self.cached() as response_cache:
+            assert response_cache.response is None
+            response_cache.data = data
+
+        entry = cache.get("list_profiles:/profiles/?role=P")
+        assert entry["compressed"]
+        with self.cached() as response_cache:
+            response = response_cache.response
+
+        assert isinstance(response, CachedJSONResponse)
+        assert response["Content-Type"] == "application/json"
+        assert len(entry["content"]) < len(response.content)
+        assert response.data == data
+
+    def test_stats(self):
+        with self.cached() as response_cache:
+            response_cache.data = {"results": []}
+        with self.cached() as response_cache:
+            assert response_cache.data is not None
+        invalidate_cache_tags(role_tag("P"))
+        with self.cached() as response_cache:
+            assert response_cache.data is None
+        cache.delete("list_profiles:/profiles/?role=P")
+        with self.cached() as response_cache:
+            assert response_cache.data is None
+
+        assert get_cache_stats("list_profiles") == {"hit": 1, "miss": 1, "stale": 1}
+
+
+@override_settings(CACHE_LOCK_WAIT=0.2)
+class CachedResponseSingleFlightTest(SimpleTestCase):
+    cache_key = "transfer_requests:/transfer-requests/"
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.request = Request(APIRequestFactory().get("/transfer-requests/"))
+
+    def cached(self, **kwargs) -> CachedResponse:
+        return CachedResponse(
+            self.cache_key, self.request, tags=["transfer_requests"], **kwargs
+        )
+
+    def test_only_lock_holder_recomputes(self):
+        with self.cached(single_flight=True) as response_cache:
+            response_cache.data = {"results": ["old"]}
+        invalidate_cache_tags("transfer_requests")
+
+        with self.cached(single_flight=True) as lock_holder:
+            assert lock_holder.data is None
+            with self.cached(single_flight=True) as other_worker:
+                assert other_worker.data == {"results": ["old"]}
+            lock_holder.data = {"results": ["new"]}
+
+        with self.cached(single_flight=True) as response_cache:
+            assert response_cache.data == {"results": ["new"]}
+
+    def test_lock_released_when_computation_fails(self):
+        with self.assertRaises(ValueError):
+            with self.cached(single_flight=True) as response_cache:
+                assert response_cache.data is None
+                raise ValueError
+
+        assert cache.get(f"{self.cache_key}:lock") is None
+
+    @patch("app.celery.tasks.refresh_cached_response.delay")
+    def test_stale_while_revalidate(self, refresh_mock):
+        with self.cached(stale_while_revalidate=True) as response_cache:
+            response_cache.data = {"results": ["old"]}
+
+        expired = time.time() + response_cache._cache_timeout + 1
+        with patch("utils.cache.time.time", return_value=expired):
+            for _ in range(2):
+                with self.cached(stale_while_revalidate=True) as response_cache:
+                    assert response_cache.data == {"results": ["old"]}
+
+        refresh_mock.assert_called_once_with(
+            "http://testserver/transfer-requests/",
+            "pl",
+            self.cache_key,
+            f"{self.cache_key}:lock",
+        )
+
+    def test_refresh_request_recomputes_and_releases_lock(self):
+        cache.set(f"{self.cache_key}:lock", "task-lock")
+        self.request.cache_refresh = True
+
+        with self.cached(stale_while_revalidate=True) as response_cache:
+            assert response_cache.data is None
+            response_cache.data = {"results": ["new"]}
+
+        assert cache.get(f"{self.cache_key}:lock") is None
+
+    def test_refresh_stored_under_keys_of_stale_entry(self):
+        cache.set("user_entry:lock", "task-lock")
+        self.request.cache_refresh = True
+        self.request.cache_refresh_keys = ("user_entry", "user_entry:lock")
+
+        with self.cached(stale_while_revalidate=True) as response_cache:
+            assert response_cache.data is None
+            response_cache.data = {"results": ["new"]}
+
+        assert cache.get("user_entry:lock") is None
+        assert cache.get(self.cache_key) is None
+        request = Request(APIRequestFactory().get("/transfer-requests/"))
+        with CachedResponse("user_entry", request, tags=["transfer_requests"]) as c:
+            assert c.data == {"results": ["new"]}
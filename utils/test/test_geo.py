@@ -0,0 +1,38 @@
+import math
+
+from utils.geo import EARTH_RADIUS, bounding_box
+
+
+def haversine(lat1, lng1, lat2, lng2) -> float:
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    return EARTH_RADIUS * math.acos(
+        math.cos(lat1) * math.cos(lat2) * math.cos(lng2 - lng1)
+        + math.sin(lat1) * math.sin(lat2)
+    )
+
+
+class TestBoundingBox:
+    def test_box_contains_circle(self):
+        latitude, longitude, radius = 54.2545, 18.3153, 30
+        min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius)
+
+        # points on the circle in each direction are inside the box
+        assert haversine(latitude, longitude, max_lat, longitude) >= radius - 0.01
+        assert haversine(latitude, longitude, min_lat, longitude) >= radius - 0.01
+        assert haversine(latitude, longitude, latitude, max_lng) >= radius
+        assert haversine(latitude, longitude, latitude, min_lng) >= radius
+
+    def test_box_is_tight(self):
+        min_lat, max_lat, min_lng, max_lng = bounding_box(52.0, 21.0, 10)
+
+        assert max_lat - min_lat < 0.2
+        assert max_lng - min_lng < 0.35
+
+    def test_no_longitude_bounds_across_antimeridian(self):
+        assert bounding_box(0, 179.9, 50)[2:] == (None, None)
+
+    def test_no_longitude_bounds_near_pole(self):
+        min_lat, max_lat, min_lng, max_lng = bounding_box(89.9, 0, 50)
+
+        assert max_lat == 90.0
+        assert (min_lng, max_lng) == (None, None)
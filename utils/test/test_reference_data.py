@@ -0,0 +1,67 @@
+import pytest
+
+from clubs.models import Season
+from labels.utils import validate_labels
+from profiles import errors
+from profiles.models import LicenceType
+from profiles.services import LanguageService
+from utils import factories, get_current_season
+from utils.cache import REFERENCE_DATA_TAG, invalidate_cache_tags
+from utils.reference_data import ReferenceDataRegistry, reference_data
+
+pytestmark = pytest.mark.django_db
+
+
+def test_reference_data_is_loaded_once(django_assert_num_queries):
+    factories.LanguageFactory(name="Testowy", code="zz")
+    factories.LicenceTypeFactory(name="Test licence", key="TEST")
+    factories.LicenceTypeFactory(name="Other licence", key=None)
+    factories.LabelDefinitionFactory(label_name="TEST_LABEL")
+    season = factories.SeasonFactory(name=Season.define_current_season())
+    reference_data.clear()
+
+    with django_assert_num_queries(4):
+        language = LanguageService.get_language_by_code("zz")
+        licence_names = LicenceType.get_available_licence_names()
+        assert validate_labels(["TEST_LABEL", "UNKNOWN"]) == ["TEST_LABEL"]
+        assert get_current_season() == season.name
+
+    with django_assert_num_queries(0):
+        assert LanguageService.get_language_by_id(language.pk) == language
+        assert LanguageService.get_language_by_code("zz") == language
+        assert LicenceType.get_available_licence_names() == licence_names
+        assert validate_labels(["TEST_LABEL"]) == ["TEST_LABEL"]
+        assert get_current_season() == season.name
+
+    assert "Test licence" in licence_names
+    assert "Other licence" not in licence_names
+
+
+def test_language_lookup_errors():
+    with pytest.raises(errors.LanguageDoesNotExistException):
+        LanguageService.get_language_by_code("xx-unknown")
+    with pytest.raises(errors.LanguageDoesNotExistException):
+        LanguageService.get_language_by_id(123456)
+    with pytest.raises(errors.ExpectedIntException):
+        LanguageService.get_language_by_id("zz")
+
+
+def test_reference_data_reloaded_after_change():
+    assert "Test licence" not in LicenceType.get_available_licence_names()
+
+    licence = factories.LicenceTypeFactory(name="Test licence", key="TEST")
+    assert "Test licence" in LicenceType.get_available_licence_names()
+
+    licence.delete()
+    assert "Test licence" not in LicenceType.get_available_licence_names()
+
+
+def test_registry_forgets_data_changed_by_other_process():
+    registry = ReferenceDataRegistry(check_interval=0)
+    registry.register("numbers")(lambda: [1, 2])
+
+    first = registry.get("numbers")
+    assert registry.get("numbers") is first
+
+    invalidate_cache_tags(REFERENCE_DATA_TAG)
+    assert registry.get("numbers") is not first